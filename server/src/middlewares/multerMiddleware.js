@@ -67,4 +67,32 @@ const multerUploader = (req, res, next) => {
   });
 };
 
+/**
+ * Middleware to handle preview image uploads for an asset whose main file was uploaded directly to Blob Storage.
+ * @param {object} req - The request object.
+ * @param {object} res - The response object.
+ * @param {Function} next - The next middleware function.
+ */
+export const multerPreviewUploader = (req, res, next) => {
+  upload.fields([
+    { maxCount: 30, name: "previewImages" } // max preview images
+  ])(req, res, function handleMulterPreviewUpload(err) {
+    if (err instanceof MulterError) {
+      logger.error(`Multer error: ${err.message}`);
+      return res
+        .status(statusCodes.BAD_REQUEST)
+        .json({ message: err.message, success: false });
+    } else if (err) {
+      logger.error("Error during file upload:", err);
+      return res.status(statusCodes.INTERNAL_SERVER_ERROR).json({
+        message: `An error occurred during file upload on multer middleware: ${err.message}`,
+        success: false
+      });
+    }
+
+    // The file name is validated by the /register route
+    return next();
+  });
+};
+
 export default multerUploader;
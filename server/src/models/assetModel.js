@@ -57,6 +57,11 @@ const assetSchema = new Schema(
       required: true,
       type: Number
     },
+    fingerprint: {
+      index: true,
+      required: false,
+      type: String
+    },
     format: {
       required: true,
       type: String
@@ -8,11 +8,16 @@ import {
   checkAuthentication,
   checkIsAdmin
 } from "../middlewares/authMiddleware.js";
-import multerUploader from "../middlewares/multerMiddleware.js";
+import multerUploader, {
+  multerPreviewUploader
+} from "../middlewares/multerMiddleware.js";
 import { assetModel } from "../models/assetModel.js";
+import { projectModel } from "../models/projectModel.js";
 import {
+  createBlobSasToken,
   createContainerSasToken,
   createMongoAsset,
+  findAssetConflict,
   uploadToBlobStorage
 } from "../utils/blobStorage.js";
 import { deleteAsset } from "../utils/delete.js";
@@ -54,6 +59,107 @@ router.get("/asset-sas-token", checkAuthentication, async (req, res) => {
   }
 });
 
+const UPLOAD_TOKEN_DURATION = 60;
+// Gets a create-only sas token for uploading a new asset file directly to the assets container
+router.get(
+  "/upload-sas-token",
+  checkAuthentication,
+  checkIsAdmin,
+  async (req, res) => {
+    try {
+      const { fileName, name } = req.query;
+      if (!fileName) {
+        return res.status(statusCodes.BAD_REQUEST).json({
+          message: "File name is required",
+          success: false
+        });
+      }
+
+      // Refuse before anything is staged, so an upload never replaces a live asset
+      const conflict = await findAssetConflict(
+        mainContainerClient,
+        fileName,
+        name
+      );
+      if (conflict) {
+        return res
+          .status(statusCodes.CONFLICT)
+          .json({ message: conflict, success: false });
+      }
+
+      // Scoped to this blob: r = read its uncommitted block list when resuming,
+      // c = create it (committing fails if the blob appeared in the meantime)
+      const sasToken = await createBlobSasToken(
+        ASSET_CONTAINER_NAME,
+        fileName,
+        UPLOAD_TOKEN_DURATION,
+        "rc"
+      );
+      logger.info(
+        `'${req.user.username}' requested an upload sas token for: ${ASSET_CONTAINER_NAME}/${fileName}`
+      );
+      return res.json({
+        blobUrl: mainContainerClient.getBlockBlobClient(fileName).url,
+        message: sasToken,
+        success: true
+      });
+    } catch (error) {
+      logger.error(`Error generating sas upload token: ${error.message}`);
+      return res.status(statusCodes.INTERNAL_SERVER_ERROR).json({
+        message: `Error generating sas upload token: ${error.message}`,
+        success: false
+      });
+    }
+  }
+);
+
+// Finds the asset uploaded from a source folder with the given content fingerprint
+router.get(
+  "/fingerprint",
+  checkAuthentication,
+  checkIsAdmin,
+  async (req, res) => {
+    try {
+      const { fingerprint } = req.query;
+      if (!fingerprint) {
+        return res.status(statusCodes.BAD_REQUEST).json({
+          message: "Fingerprint is required",
+          success: false
+        });
+      }
+
+      const asset = await assetModel
+        .findOne({ fingerprint })
+        .select("_id fileName name projects")
+        .populate({
+          path: "projects",
+          select: "name"
+        });
+      if (!asset) {
+        return res
+          .status(statusCodes.NOT_FOUND)
+          .json({ message: "Asset not found", success: false });
+      }
+
+      return res.status(statusCodes.OK).json({
+        asset: {
+          _id: asset._id,
+          fileName: asset.fileName,
+          name: asset.name,
+          projects: asset.projects.map(project => project.name)
+        },
+        success: true
+      });
+    } catch (error) {
+      logger.error(`Error looking up asset fingerprint: ${error.message}`);
+      return res.status(statusCodes.INTERNAL_SERVER_ERROR).json({
+        message: `Error looking up asset fingerprint: ${error.message}`,
+        success: false
+      });
+    }
+  }
+);
+
 // -------------------------POST-------------------------
 
 // /upload-Asset
@@ -139,6 +245,157 @@ router.post(
   }
 );
 
+// /register - Registers an asset whose main file was uploaded directly to Blob Storage
+router.post(
+  "/register",
+  checkAuthentication,
+  multerPreviewUploader,
+  checkIsAdmin,
+  async (req, res) => {
+    const { fileName } = req.body;
+    const { previewImages } = req.files || {};
+
+    // eslint-disable-next-line prefer-const
+    let previewImagesUrl = [];
+
+    try {
+      if (!fileName) {
+        return res.status(statusCodes.BAD_REQUEST).json({
+          message: "File name is required",
+          success: false
+        });
+      }
+
+      // Register each main file once; a second registration would point two assets at the same blob
+      if (await assetModel.findOne({ fileName })) {
+        return res.status(statusCodes.CONFLICT).json({
+          message: `An asset already uses the file: ${fileName}`,
+          success: false
+        });
+      }
+
+      // The main file must already be committed to the assets container
+      const mainBlobClient = mainContainerClient.getBlockBlobClient(fileName);
+      if (!(await mainBlobClient.exists())) {
+        return res.status(statusCodes.NOT_FOUND).json({
+          message: `Main file not found: ${fileName}`,
+          success: false
+        });
+      }
+      const { contentLength, contentType } =
+        await mainBlobClient.getProperties();
+
+      logger.info(`'${req.user.username}' registered a Main file: ${fileName}`);
+
+      const NO_PREVIEW_IMAGES = 0;
+
+      // Upload preview images, if any
+      if (previewImages && previewImages.length > NO_PREVIEW_IMAGES) {
+        const previewFilesToUpload = previewImages.map(preview => ({
+          fileBuffer: preview.buffer,
+          originalName: `${fileName}/${preview.originalname}`
+        }));
+
+        const previewUploadResults = await uploadToBlobStorage(
+          previewContainerClient,
+          previewFilesToUpload,
+          {
+            sanitize: false,
+            tier: "Hot"
+          }
+        );
+
+        previewImagesUrl.push(...previewUploadResults);
+
+        previewImages.forEach(preview => {
+          logger.info(
+            `'${req.user.username}' uploaded a Preview Image: ${preview.originalname}`
+          );
+        });
+      }
+
+      // Create asset in MongoDB
+      const mongoUploadedSuccessfully = await createMongoAsset(
+        {
+          mimetype: contentType,
+          originalname: fileName,
+          size: contentLength
+        },
+        req.body,
+        previewImagesUrl
+      );
+
+      if (mongoUploadedSuccessfully) {
+        res
+          .status(statusCodes.OK)
+          .json({ message: "Asset registered successfully", success: true });
+      } else {
+        throw new Error("Error uploading asset to MongoDB");
+      }
+    } catch (err) {
+      logger.error("Error registering asset: ", err.message);
+      res.status(statusCodes.INTERNAL_SERVER_ERROR).json({
+        message: `Blob Storage register asset error: ${err.message}`,
+        success: false
+      });
+    }
+  }
+);
+
+// -------------------------PUT-------------------------
+
+// Adds projects to the asset with the given content fingerprint, for duplicates found in another project
+router.put(
+  "/fingerprint/projects",
+  checkAuthentication,
+  checkIsAdmin,
+  async (req, res) => {
+    try {
+      const { fingerprint, projects } = req.body;
+      if (!fingerprint || !Array.isArray(projects)) {
+        return res.status(statusCodes.BAD_REQUEST).json({
+          message: "Fingerprint and projects are required",
+          success: false
+        });
+      }
+
+      // projects names to IDs
+      const projectIds = (
+        await Promise.all(
+          projects.map(async projectName => {
+            const project = await projectModel.findOne({ name: projectName });
+            return project ? project._id : null; // Return ObjectId if found, otherwise null
+          })
+        )
+      ).filter(id => id !== null); // remove null values from the array
+
+      const asset = await assetModel.findOneAndUpdate(
+        { fingerprint },
+        { $addToSet: { projects: { $each: projectIds } } },
+        { new: true }
+      );
+      if (!asset) {
+        return res
+          .status(statusCodes.NOT_FOUND)
+          .json({ message: "Asset not found", success: false });
+      }
+
+      logger.info(
+        `'${req.user.username}' linked asset '${asset.fileName}' to projects: ${projects.join(", ")}`
+      );
+      return res
+        .status(statusCodes.OK)
+        .json({ message: "Asset projects updated", success: true });
+    } catch (error) {
+      logger.error(`Error linking asset projects: ${error.message}`);
+      return res.status(statusCodes.INTERNAL_SERVER_ERROR).json({
+        message: `Error linking asset projects: ${error.message}`,
+        success: false
+      });
+    }
+  }
+);
+
 //------------------------------------------------------------------------------
 // File download endpoint, finds the file by ID in the get request, sends the full url to download from the blob
 router.get("/download", checkAuthentication, async (req, res) => {
@@ -0,0 +1,225 @@
+import { assetModel } from "../../models/assetModel.js";
+import {
+  createBlobSasToken,
+  createMongoAsset,
+  findAssetConflict
+} from "../../utils/blobStorage.js";
+import router from "../asset.js";
+
+// Mock dependencies
+jest.mock("@azure/storage-blob", () => {
+  const mockContainerClient = {
+    getBlockBlobClient: jest.fn(blobName => ({
+      exists: jest.fn().mockResolvedValue(true),
+      getProperties: jest.fn().mockResolvedValue({
+        contentLength: 1234,
+        contentType: "application/zip"
+      }),
+      url: `https://storage.example.com/assets/${blobName}`
+    }))
+  };
+  return {
+    BlobClient: jest.fn(),
+    BlobServiceClient: {
+      fromConnectionString: jest.fn().mockReturnValue({
+        getContainerClient: jest.fn().mockReturnValue(mockContainerClient)
+      })
+    }
+  };
+});
+
+jest.mock("../../middlewares/authMiddleware.js", () => ({
+  checkAuthentication: jest.fn((req, res, next) => next()),
+  checkIsAdmin: jest.fn((req, res, next) => next())
+}));
+
+jest.mock("../../middlewares/multerMiddleware.js", () => ({
+  __esModule: true,
+  default: jest.fn((req, res, next) => next()),
+  multerPreviewUploader: jest.fn((req, res, next) => next())
+}));
+
+jest.mock("../../models/assetModel.js", () => ({
+  assetModel: { findOne: jest.fn() }
+}));
+
+jest.mock("../../models/projectModel.js", () => ({
+  projectModel: { findOne: jest.fn() }
+}));
+
+jest.mock("../../utils/blobStorage.js", () => ({
+  createBlobSasToken: jest.fn().mockResolvedValue("mocked-blob-sas-token"),
+  createContainerSasToken: jest.fn(),
+  createMongoAsset: jest.fn().mockResolvedValue(true),
+  findAssetConflict: jest.fn(),
+  uploadToBlobStorage: jest.fn()
+}));
+
+jest.mock("../../utils/delete.js", () => ({
+  deleteAsset: jest.fn()
+}));
+
+jest.mock("../../utils/logger.js", () => ({
+  error: jest.fn(),
+  info: jest.fn(),
+  warn: jest.fn()
+}));
+
+/**
+ * Runs the middlewares and handler of a route in order, stopping at the first one that responds.
+ * @param method - The HTTP method of the route, in lower case.
+ * @param path - The path of the route.
+ * @param req - The mock request.
+ */
+async function callRoute(method, path, req) {
+  const layer = router.stack.find(
+    ({ route }) => route && route.path === path && route.methods[method]
+  );
+  const res = {
+    json: jest.fn().mockReturnThis(),
+    status: jest.fn().mockReturnThis()
+  };
+  for (const { handle } of layer.route.stack) {
+    let nextCalled = false;
+    await handle(req, res, () => {
+      nextCalled = true;
+    });
+    if (!nextCalled) {
+      break;
+    }
+  }
+  return res;
+}
+
+describe("GET /upload-sas-token", () => {
+  beforeEach(() => {
+    jest.mocked(findAssetConflict).mockResolvedValue(null);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  test("should require a file name", async () => {
+    expect.assertions(3);
+
+    const res = await callRoute("get", "/upload-sas-token", {
+      query: { name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(res.status).toHaveBeenCalledWith(400);
+    expect(res.json).toHaveBeenCalledWith({
+      message: "File name is required",
+      success: false
+    });
+    expect(createBlobSasToken).not.toHaveBeenCalled();
+  });
+
+  test("should refuse an upload that would replace an asset", async () => {
+    expect.assertions(3);
+
+    jest
+      .mocked(findAssetConflict)
+      .mockResolvedValue("An asset already uses the file: Crate.zip");
+
+    const res = await callRoute("get", "/upload-sas-token", {
+      query: { fileName: "Crate.zip", name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(res.status).toHaveBeenCalledWith(409);
+    expect(res.json).toHaveBeenCalledWith({
+      message: "An asset already uses the file: Crate.zip",
+      success: false
+    });
+    expect(createBlobSasToken).not.toHaveBeenCalled();
+  });
+
+  test("should return a create-only SAS token scoped to the blob", async () => {
+    expect.assertions(2);
+
+    const res = await callRoute("get", "/upload-sas-token", {
+      query: { fileName: "Crate.zip", name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(createBlobSasToken).toHaveBeenCalledWith(
+      "assets",
+      "Crate.zip",
+      expect.any(Number),
+      "rc"
+    );
+    expect(res.json).toHaveBeenCalledWith({
+      blobUrl: "https://storage.example.com/assets/Crate.zip",
+      message: "mocked-blob-sas-token",
+      success: true
+    });
+  });
+});
+
+describe("POST /register", () => {
+  beforeEach(() => {
+    jest.mocked(assetModel.findOne).mockResolvedValue(null);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  test("should require a file name", async () => {
+    expect.assertions(3);
+
+    const res = await callRoute("post", "/register", {
+      body: { name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(res.status).toHaveBeenCalledWith(400);
+    expect(res.json).toHaveBeenCalledWith({
+      message: "File name is required",
+      success: false
+    });
+    expect(createMongoAsset).not.toHaveBeenCalled();
+  });
+
+  test("should refuse a file already registered to an asset", async () => {
+    expect.assertions(3);
+
+    jest
+      .mocked(assetModel.findOne)
+      .mockResolvedValue({ fileName: "Crate.zip", name: "Crate" });
+
+    const res = await callRoute("post", "/register", {
+      body: { fileName: "Crate.zip", name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(res.status).toHaveBeenCalledWith(409);
+    expect(res.json).toHaveBeenCalledWith({
+      message: "An asset already uses the file: Crate.zip",
+      success: false
+    });
+    expect(createMongoAsset).not.toHaveBeenCalled();
+  });
+
+  test("should register an uploaded file", async () => {
+    expect.assertions(2);
+
+    const res = await callRoute("post", "/register", {
+      body: { fileName: "Crate.zip", name: "Crate" },
+      user: { username: "admin" }
+    });
+
+    expect(createMongoAsset).toHaveBeenCalledWith(
+      {
+        mimetype: "application/zip",
+        originalname: "Crate.zip",
+        size: 1234
+      },
+      { fileName: "Crate.zip", name: "Crate" },
+      []
+    );
+    expect(res.status).toHaveBeenCalledWith(200);
+  });
+});
@@ -1,6 +1,7 @@
 import dotenv from "dotenv";
 dotenv.config();
 import {
+  BlobSASPermissions,
   ContainerSASPermissions,
   generateBlobSASQueryParameters,
   StorageSharedKeyCredential
@@ -108,6 +109,74 @@ export async function createContainerSasToken(containerName, minutes) {
   }
 }
 
+/**
+ *  Function:     createBlobSasToken()
+ *  Description:  Generate a SAS token scoped to a single blob
+ *  Parameters:   containerName, blobName
+ *  Returns:      string: SAS token.
+ * @param containerName - The name of the container holding the blob.
+ * @param blobName - The name of the blob the SAS token is limited to.
+ * @param minutes - The number of minutes the SAS token will be valid for.
+ * @param permissions - The blob permissions to grant (defaults to "r", read-only; "c" only creates a blob that does not exist yet).
+ */
+export async function createBlobSasToken(
+  containerName,
+  blobName,
+  minutes,
+  permissions = "r"
+) {
+  const expirationTime = minutes * MILLISECONDS_IN_MINUTE;
+
+  try {
+    const sasToken = await generateBlobSASQueryParameters(
+      {
+        blobName,
+        containerName,
+        expiresOn: new Date(Date.now() + expirationTime),
+        permissions: BlobSASPermissions.parse(permissions)
+      },
+      sharedKeyCredential
+    ).toString();
+
+    logger.info(
+      `Generated SAS token for blob: ${containerName}/${blobName} (${permissions})`
+    );
+
+    return sasToken;
+  } catch (error) {
+    logger.error(
+      `Failed to generate SAS token for ${containerName}/${blobName}:`,
+      error
+    );
+    throw error; // Rethrow error for the caller to handle
+  }
+}
+
+/**
+ *  Function:     findAssetConflict()
+ *  Description:  Check that a new asset would not replace an existing one
+ *  Returns:      string describing the existing asset or blob, or null when the asset can be uploaded.
+ *  @param containerClient - The assets container client.
+ *  @param fileName - The blob name of the asset's main file.
+ *  @param name - The asset name.
+ */
+export async function findAssetConflict(containerClient, fileName, name) {
+  const existingAsset = await assetModel.findOne({
+    $or: [{ fileName }, ...(name ? [{ name }] : [])]
+  });
+  if (existingAsset) {
+    return existingAsset.fileName === fileName
+      ? `An asset already uses the file: ${fileName}`
+      : `An asset named '${name}' already exists`;
+  }
+
+  if (await containerClient.getBlockBlobClient(fileName).exists()) {
+    return `The file already exists in Blob Storage: ${fileName}`;
+  }
+
+  return null;
+}
+
 /**
  *  Function:     createMongoAsset()
  *  Description:  Create an asset in MongoDB.
@@ -131,6 +200,7 @@ export async function createMongoAsset(mainFile, reqBody, previewImagesUrl) {
     const {
       categories = null,
       description = null, // sets the default value to null if the field is not present in the req.body
+      fingerprint = null, // content hash of the source asset folder, used to detect duplicate uploads
       license = null, // to be removed in the future
       model = null,
       name = null,
@@ -192,6 +262,7 @@ export async function createMongoAsset(mainFile, reqBody, previewImagesUrl) {
       ...(name !== null && { name }),
       ...(fileSize !== null && { fileSize }),
       ...(description !== null && { description }),
+      ...(fingerprint !== null && { fingerprint }),
       ...(format !== null && { format }),
       ...(previewImagesUrl !== null && { previews: previewImagesUrl }),
       ...(projects !== null && { projects: parsedProjects }),
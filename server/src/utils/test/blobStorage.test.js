@@ -1,22 +1,31 @@
-import { generateBlobSASQueryParameters } from "@azure/storage-blob";
+import {
+  BlobSASPermissions,
+  generateBlobSASQueryParameters
+} from "@azure/storage-blob";
 
+import { assetModel } from "../../models/assetModel.js";
 import { categoryModel } from "../../models/categoryModel.js";
 import { projectModel } from "../../models/projectModel.js";
 import { tagModel } from "../../models/tagModel.js";
 import {
+  createBlobSasToken,
   createContainerSasToken,
   createMongoAsset,
+  findAssetConflict,
   uploadToBlobStorage
 } from "../blobStorage.js";
 
 // Mock dependencies
 jest.mock("../../models/assetModel.js", () => ({
-  assetModel: jest.fn().mockImplementation(() => ({
-    save: jest.fn().mockResolvedValue({
-      _id: "ObjectId123",
-      name: "New Category"
-    })
-  }))
+  assetModel: Object.assign(
+    jest.fn().mockImplementation(() => ({
+      save: jest.fn().mockResolvedValue({
+        _id: "ObjectId123",
+        name: "New Category"
+      })
+    })),
+    { findOne: jest.fn() }
+  )
 }));
 
 jest.mock("../../models/projectModel.js", () => ({
@@ -58,6 +67,9 @@ jest.mock("../../models/tagModel.js", () => ({
 }));
 
 jest.mock("@azure/storage-blob", () => ({
+  BlobSASPermissions: {
+    parse: jest.fn().mockReturnValue("c")
+  },
   ContainerSASPermissions: {
     parse: jest.fn().mockReturnValue("r") // Mock the permissions as read-only
   },
@@ -209,6 +221,132 @@ describe("createContainerSasToken", () => {
   });
 });
 
+describe("createBlobSasToken", () => {
+  beforeAll(() => {
+    generateBlobSASQueryParameters.mockReturnValue({
+      toString: jest.fn().mockReturnValue("mocked-blob-sas-token")
+    });
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  test("should scope the SAS token to the blob", async () => {
+    expect.assertions(3);
+
+    const result = await createBlobSasToken("assets", "Crate.zip", 10, "rc");
+
+    expect(result).toBe("mocked-blob-sas-token");
+    expect(BlobSASPermissions.parse).toHaveBeenCalledWith("rc");
+    expect(generateBlobSASQueryParameters).toHaveBeenCalledWith(
+      expect.objectContaining({ blobName: "Crate.zip", containerName: "assets" }),
+      expect.anything()
+    );
+  });
+
+  test("should default to read-only permissions", async () => {
+    expect.assertions(1);
+
+    await createBlobSasToken("assets", "Crate.zip", 10);
+
+    expect(BlobSASPermissions.parse).toHaveBeenCalledWith("r");
+  });
+
+  test("should rethrow SAS token generation errors", async () => {
+    expect.assertions(1);
+
+    generateBlobSASQueryParameters.mockImplementationOnce(() => {
+      throw new Error("SAS token generation failed");
+    });
+
+    await expect(
+      createBlobSasToken("assets", "Crate.zip", 10, "rc")
+    ).rejects.toThrow("SAS token generation failed");
+  });
+});
+
+describe("findAssetConflict", () => {
+  let mockContainerClient;
+  let mockBlockBlobClient;
+
+  beforeEach(() => {
+    mockBlockBlobClient = { exists: jest.fn().mockResolvedValue(false) };
+    mockContainerClient = {
+      getBlockBlobClient: jest.fn().mockReturnValue(mockBlockBlobClient)
+    };
+    jest.mocked(assetModel.findOne).mockResolvedValue(null);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  test("should allow a new asset", async () => {
+    expect.assertions(2);
+
+    const conflict = await findAssetConflict(
+      mockContainerClient,
+      "Crate.zip",
+      "Crate"
+    );
+
+    expect(conflict).toBeNull();
+    expect(assetModel.findOne).toHaveBeenCalledWith({
+      $or: [{ fileName: "Crate.zip" }, { name: "Crate" }]
+    });
+  });
+
+  test("should refuse a file name used by an asset", async () => {
+    expect.assertions(2);
+
+    jest
+      .mocked(assetModel.findOne)
+      .mockResolvedValue({ fileName: "Crate.zip", name: "Crate" });
+
+    const conflict = await findAssetConflict(
+      mockContainerClient,
+      "Crate.zip",
+      "Crate"
+    );
+
+    expect(conflict).toBe("An asset already uses the file: Crate.zip");
+    expect(mockBlockBlobClient.exists).not.toHaveBeenCalled();
+  });
+
+  test("should refuse an existing asset name", async () => {
+    expect.assertions(1);
+
+    jest
+      .mocked(assetModel.findOne)
+      .mockResolvedValue({ fileName: "Crate (1).zip", name: "Crate" });
+
+    const conflict = await findAssetConflict(
+      mockContainerClient,
+      "Crate.zip",
+      "Crate"
+    );
+
+    expect(conflict).toBe("An asset named 'Crate' already exists");
+  });
+
+  test("should refuse a blob that already exists", async () => {
+    expect.assertions(1);
+
+    mockBlockBlobClient.exists.mockResolvedValue(true);
+
+    const conflict = await findAssetConflict(
+      mockContainerClient,
+      "Crate.zip",
+      "Crate"
+    );
+
+    expect(conflict).toBe(
+      "The file already exists in Blob Storage: Crate.zip"
+    );
+  });
+});
+
 describe("createMongoAsset", () => {
   beforeEach(() => {
     // Reset all mocks before each test
@@ -271,6 +409,27 @@ describe("createMongoAsset", () => {
     expect(saved).toBe(true);
   });
 
+  test("stores the source folder fingerprint", async () => {
+    expect.assertions(1);
+
+    const mainFile = {
+      mimetype: "application/zip",
+      originalname: "asset.zip",
+      size: 1234
+    };
+
+    const reqBody = {
+      fingerprint: "0123456789abcdef",
+      name: "Sample Asset"
+    };
+
+    await createMongoAsset(mainFile, reqBody, []);
+
+    expect(assetModel).toHaveBeenCalledWith(
+      expect.objectContaining({ fingerprint: "0123456789abcdef" })
+    );
+  });
+
   test("catch case", async () => {
     expect.assertions(1);
 
@@ -0,0 +1,164 @@
+// Stages, commits and checks a direct-to-blob asset upload against the Azurite storage emulator,
+// the way upload-automation.py does with UPLOAD_MODE = "blob".
+// Run Azurite (npx azurite-blob --loose) and set AZURITE_CONNECTION_STRING to enable these tests, e.g.
+// DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=<well-known key>;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;
+import { BlobServiceClient } from "@azure/storage-blob";
+
+jest.mock("../logger.js", () => ({
+  error: jest.fn(),
+  info: jest.fn(),
+  warn: jest.fn()
+}));
+
+jest.mock("../../models/assetModel.js", () => ({
+  assetModel: { findOne: jest.fn().mockResolvedValue(null) }
+}));
+
+const connectionString = process.env.AZURITE_CONNECTION_STRING;
+const describeAzurite = connectionString ? describe : describe.skip;
+
+const BLOB_API_VERSION = "2021-08-06";
+const SAS_MINUTES = 5;
+
+/**
+ * Builds a block id the same length for every block of a blob.
+ * @param index - Position of the block in the blob.
+ */
+function blockId(index) {
+  return Buffer.from(`${String(index).padStart(6, "0")}-block`).toString(
+    "base64"
+  );
+}
+
+/**
+ * Stages the blocks of a blob with a SAS token, then commits them, returning the commit status.
+ * @param blobUrl - The URL of the blob.
+ * @param sasToken - The SAS token to authorize the requests with.
+ * @param blocks - The block contents, in order.
+ */
+async function stageAndCommit(blobUrl, sasToken, blocks) {
+  for (const [index, block] of blocks.entries()) {
+    const response = await fetch(
+      `${blobUrl}?comp=block&blockid=${encodeURIComponent(blockId(index))}&${sasToken}`,
+      {
+        body: block,
+        headers: { "x-ms-version": BLOB_API_VERSION },
+        method: "PUT"
+      }
+    );
+    if (response.status !== 201) {
+      return response.status;
+    }
+  }
+
+  const blockList = blocks
+    .map((block, index) => `<Latest>${blockId(index)}</Latest>`)
+    .join("");
+  const response = await fetch(`${blobUrl}?comp=blocklist&${sasToken}`, {
+    body: `<?xml version="1.0" encoding="utf-8"?><BlockList>${blockList}</BlockList>`,
+    headers: {
+      "Content-Type": "application/xml",
+      "x-ms-blob-content-type": "application/zip",
+      "x-ms-version": BLOB_API_VERSION
+    },
+    method: "PUT"
+  });
+  return response.status;
+}
+
+describeAzurite("direct-to-blob upload (Azurite)", () => {
+  let containerClient;
+  let createBlobSasToken;
+  let findAssetConflict;
+
+  beforeAll(async () => {
+    // The shared key credential of blobStorage.js is built from these when the module loads
+    const settings = Object.fromEntries(
+      connectionString
+        .split(";")
+        .filter(Boolean)
+        .map(setting => setting.split(/=(.*)/s).slice(0, 2))
+    );
+    process.env.AZURE_STORAGE_ACCOUNT_NAME = settings.AccountName;
+    process.env.AZURE_STORAGE_ACCOUNT_KEY = settings.AccountKey;
+    ({ createBlobSasToken, findAssetConflict } = await import(
+      "../blobStorage.js"
+    ));
+
+    containerClient = BlobServiceClient.fromConnectionString(
+      connectionString
+    ).getContainerClient(`assets-test-${Date.now()}`);
+    await containerClient.create();
+  });
+
+  afterAll(async () => {
+    await containerClient?.deleteIfExists();
+  });
+
+  test("stages and commits a new asset blob with a create-only SAS token", async () => {
+    expect.assertions(4);
+
+    const blobClient = containerClient.getBlockBlobClient("Crate.zip");
+    expect(
+      await findAssetConflict(containerClient, "Crate.zip", "Crate")
+    ).toBeNull();
+
+    const sasToken = await createBlobSasToken(
+      containerClient.containerName,
+      "Crate.zip",
+      SAS_MINUTES,
+      "rc"
+    );
+    const blocks = [Buffer.from("first block "), Buffer.from("second block")];
+    expect(await stageAndCommit(blobClient.url, sasToken, blocks)).toBe(201);
+
+    const content = await blobClient.downloadToBuffer();
+    expect(content.toString()).toBe("first block second block");
+    expect((await blobClient.getProperties()).contentType).toBe(
+      "application/zip"
+    );
+  });
+
+  test("refuses to replace an existing asset blob", async () => {
+    expect.assertions(3);
+
+    const blobClient = containerClient.getBlockBlobClient("Barrel.zip");
+    await blobClient.uploadData(Buffer.from("live asset"));
+
+    // Registration is refused before anything is staged
+    expect(
+      await findAssetConflict(containerClient, "Barrel.zip", "Barrel")
+    ).toBe("The file already exists in Blob Storage: Barrel.zip");
+
+    // Even with a token, a create-only SAS cannot commit over the live blob
+    const sasToken = await createBlobSasToken(
+      containerClient.containerName,
+      "Barrel.zip",
+      SAS_MINUTES,
+      "rc"
+    );
+    expect(
+      await stageAndCommit(blobClient.url, sasToken, [Buffer.from("other")])
+    ).not.toBe(201);
+    expect((await blobClient.downloadToBuffer()).toString()).toBe(
+      "live asset"
+    );
+  });
+
+  test("limits the SAS token to its blob", async () => {
+    expect.assertions(1);
+
+    const sasToken = await createBlobSasToken(
+      containerClient.containerName,
+      "Lamp.zip",
+      SAS_MINUTES,
+      "rc"
+    );
+    const otherBlobClient = containerClient.getBlockBlobClient("Other.zip");
+    expect(
+      await stageAndCommit(otherBlobClient.url, sasToken, [
+        Buffer.from("data")
+      ])
+    ).toBe(403);
+  });
+});
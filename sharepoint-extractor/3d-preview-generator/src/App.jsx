@@ -152,7 +152,11 @@ const App = () => {
   const [fbxFilePath, setFbxFilePath] = useState(null); // State to hold the dynamic file path
   const [darkestColor, setDarkestColor] = useState("black");
 
-  const port = import.meta.env.VITE_SERVER_PORT;
+  // The server port and render settings are passed in the page URL, so a prebuilt bundle works with any port
+  const searchParams = new URLSearchParams(window.location.search);
+  const port =
+    searchParams.get("serverPort") || import.meta.env.VITE_SERVER_PORT;
+  const antialias = searchParams.get("antialias") !== "false";
 
   // Set up a simple server inside the client to listen for a POST request
   useEffect(() => {
@@ -209,7 +213,7 @@ const App = () => {
       ) : (
         <>
           <Canvas
-            gl={{ antialias: true }}
+            gl={{ antialias }}
             style={{
               width: "100%",
               height: "100%"
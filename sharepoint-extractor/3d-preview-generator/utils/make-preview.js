@@ -8,7 +8,16 @@ import { promises as fs } from "fs";
   let browser;
   const saveToFile = false; // Set this to true if you want to save the screenshot to a file, false to skip
   const fileName = "screenshot"; // Name of the PNG file to save
-  const format = "webp"; // Format of the screenshot (png, jpeg, webp)
+  // Render profile settings, passed by upload-automation.py (defaults match the "hero" profile)
+  const format = process.env.PREVIEW_FORMAT || "webp"; // Format of the screenshot (png, jpeg, webp)
+  const quality = Number(process.env.PREVIEW_QUALITY) || undefined; // 1-100, jpeg and webp only
+  const width = Number(process.env.PREVIEW_WIDTH) || 1920;
+  const height = Number(process.env.PREVIEW_HEIGHT) || 1080;
+  const deviceScaleFactor = Number(process.env.PREVIEW_SCALE) || 2;
+  const antialias = process.env.PREVIEW_ANTIALIAS !== "false";
+  const previewPort = process.env.VITE_PGEN_PORT || 4000; // Port of the preview page (set per worker by upload-automation.py)
+  const serverPort = process.env.VITE_SERVER_PORT || 4040; // Port of the file server the page loads the model from
+  const pageUrl = `http://localhost:${previewPort}/?serverPort=${serverPort}&antialias=${antialias}`;
 
   try {
     browser = await puppeteer.launch({
@@ -45,13 +54,13 @@ import { promises as fs } from "fs";
     try {
       // Set viewport size and device scale factor
       await page.setViewport({
-        width: 1920, // Set the desired width of the screenshot
-        height: 1080, // Set the desired height of the screenshot
-        deviceScaleFactor: 2, // Increase this to 2 or more for higher DPI (2 for Retina-like quality)
+        width, // Width of the screenshot
+        height, // Height of the screenshot
+        deviceScaleFactor, // 2 or more for higher DPI (2 for Retina-like quality)
       });
 
       // Load the HTML content from a local server
-      await page.goto(`http://localhost:4000`, {
+      await page.goto(pageUrl, {
         waitUntil: "networkidle2",
       });
 
@@ -64,6 +73,7 @@ import { promises as fs } from "fs";
       const screenshotBuffer = await page.screenshot({
         encoding: "base64", // Encode the screenshot as base64
         type: format, // Use PNG for lossless quality
+        ...(format !== "png" && { quality }), // Puppeteer rejects a quality for PNG
       });
       // Output the screenshot as a JSON object, using JSON.stringify to avoid [object Object]
       const output = {
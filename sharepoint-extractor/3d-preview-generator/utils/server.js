@@ -16,6 +16,13 @@ app.use(cors());
 
 let latestFilename = null; // Variable to store the filename
 let lastLocation = {}; // Object to store the last found location for each filename
+let pathIndex = new Map(); // Registered file ids mapped to absolute paths
+let registeredPaths = new Map(); // Normalized registered paths mapped to absolute paths
+let nameIndex = new Map(); // Normalized basenames of registered files mapped to every path registered under them
+
+// Normalize a path or file name for index lookups (Windows paths are case-insensitive)
+const indexKey = filePath =>
+  process.platform === "win32" ? filePath.toLowerCase() : filePath;
 
 // Helper function to recursively search for a file in deeply nested directories
 const findFileInDirectory = async (dir, filename) => {
@@ -69,6 +76,33 @@ const searchForFile = async filename => {
   return await findFileInDirectory(rootDirectory, filename);
 };
 
+// Resolve a requested name against the registered path index (constant-time lookup).
+// Relative requests (textures referenced by a model) resolve against the directory of the
+// model being rendered; the basename is used only when a single registered file has it.
+const resolveIndexedFile = name => {
+  if (pathIndex.has(name)) {
+    return pathIndex.get(name);
+  }
+
+  const modelPath = latestFilename && pathIndex.get(latestFilename);
+  if (modelPath) {
+    const relativePath = registeredPaths.get(
+      indexKey(path.resolve(path.dirname(modelPath), name))
+    );
+    if (relativePath) {
+      return relativePath;
+    }
+  }
+
+  const matches = nameIndex.get(indexKey(path.basename(name))) || [];
+  if (matches.length > 1) {
+    console.error(
+      `Ambiguous file name: ${name} (${matches.length} registered files)`
+    );
+  }
+  return matches.length === 1 ? matches[0] : null;
+};
+
 // Send the latest filename via Server-Sent Events (SSE)
 app.get("/fbx-updates", (req, res) => {
   res.setHeader("Access-Control-Allow-Origin", "*"); // Allow all origins
@@ -89,16 +123,27 @@ app.get("/fbx-updates", (req, res) => {
   });
 });
 
-// Serve a file directly by filename, searching through nested directories and updating last location dynamically
+// Readiness probe used by upload-automation.py (defined before the /:filename route)
+app.get("/health", (req, res) => {
+  res.json({ status: "ok", uptime: process.uptime() });
+});
+
+// Serve a file by registered id, falling back to searching nested directories when no index is registered
 app.get("/:filename", async (req, res) => {
   try {
-    const filePath = await searchForFile(req.params.filename);
+    let filePath = resolveIndexedFile(req.params.filename);
 
-    if (filePath) {
-      console.log(`Serving file: ${filePath}`);
+    if (!filePath && pathIndex.size === 0) {
+      filePath = await searchForFile(req.params.filename);
 
       // Update last location dynamically
-      lastLocation[req.params.filename] = path.dirname(filePath);
+      if (filePath) {
+        lastLocation[req.params.filename] = path.dirname(filePath);
+      }
+    }
+
+    if (filePath) {
+      console.log(`Serving file: ${filePath}`);
 
       res.sendFile(filePath, err => {
         if (err) {
@@ -116,6 +161,38 @@ app.get("/:filename", async (req, res) => {
   }
 });
 
+// Register the path index (id -> absolute path) built by upload-automation.py, replacing the previous one
+app.post(
+  "/register-path-index",
+  express.json({ limit: "10mb" }),
+  (req, res) => {
+    const { paths } = req.body;
+    if (!paths || typeof paths !== "object") {
+      console.error("Path index is required but not provided.");
+      return res.status(400).send("Path index is required");
+    }
+
+    const entries = Object.entries(paths);
+    const invalid = entries.find(([, filePath]) => !path.isAbsolute(filePath));
+    if (invalid) {
+      console.error(`Invalid path in index: ${invalid[1]}`);
+      return res.status(400).send("Invalid path in index");
+    }
+
+    pathIndex = new Map(entries);
+    registeredPaths = new Map();
+    nameIndex = new Map();
+    for (const filePath of pathIndex.values()) {
+      registeredPaths.set(indexKey(path.resolve(filePath)), filePath);
+      const name = indexKey(path.basename(filePath));
+      nameIndex.set(name, [...(nameIndex.get(name) || []), filePath]);
+    }
+
+    console.log(`Path index registered: ${pathIndex.size} files`);
+    res.send(`Path index registered: ${pathIndex.size} files`);
+  }
+);
+
 // Set the root directory for serving files dynamically
 app.post("/set-directory", express.json(), (req, res) => {
   const { directoryPath } = req.body;
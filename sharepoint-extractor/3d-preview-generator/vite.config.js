@@ -13,6 +13,11 @@ export default defineConfig(({ mode }) => {
     server: {
       // Use the loaded env variable
       port: env.VITE_PGEN_PORT || 4000
+    },
+    preview: {
+      // Serves the production build (npm run build) on the same port as the dev server
+      port: env.VITE_PGEN_PORT || 4000,
+      strictPort: true
     }
   };
 });
@@ -28,6 +28,7 @@ PROJECT_FOLDERS = {}  # Empty set means process all project folders
 # Folder names to check for determining if an asset folder is valid
 REQUIRED_FOLDERS = {"Engine Import Files", "Engine Imports", "Source Files", "Mesh Exports", "Texture Files", "Animation Updates"}
 IGNORE_FOLDERS = {"Asset Files - [Template - Insert Label]", "Old Files"}  # Folders to ignore
+COPY_2D_ASSETS = False  # Copy asset folders without .fbx files to "2D Assets" for the texture pipeline (False = log them to the error ledger, as before)
 
 LOG_FILE_BASE_NAME = "onedrive-extractor"  # Base name for log files
 LOG_MODE = logging.INFO  # Logging level (DEBUG or INFO)
@@ -315,16 +316,15 @@ def find_and_copy(src_path, dest_path, project_name):
                         logging.info(f"Copying 3D asset to '{dest_path}'...")
                         final_dest_path = os.path.join(dest_path, asset_type)
                         copy_directory(dir_path, final_dest_path, project_name)
-                    else:
+                    elif COPY_2D_ASSETS:
                         asset_type = "2D Assets"
+                        logging.info(f"Copying 2D asset to '{dest_path}'...")
+                        final_dest_path = os.path.join(dest_path, asset_type)
+                        copy_directory(dir_path, final_dest_path, project_name)
+                    else:
                         logging.info(f"Skipping 2D asset folder '{dir_path}'")
                         error_logger = logging.getLogger('errored_assets_logger')
                         error_logger.info(f"{project_name}/{dir_name} --\t--\t{current_dir}")
-                    # elif asset_type == "2D Assets": #not in current scope
-                    #     logging.info(f"Copying 2D asset to '{dest_path}'...")
-                    #     final_dest_path = os.path.join(dest_path, asset_type)
-                    #     logging.info(f"Copying to {final_dest_path}...")
-                    #     copy_directory(dir_path, final_dest_path, project_name)
                 elif dir_path.count("Asset Files -") == 0 and check_required_folders(dir_path, REQUIRED_FOLDERS):
                     asset_type = "3D Assets" if check_fbx_exists(dir_path) else "2D Assets"
                     final_dest_path = os.path.join(dest_path, asset_type)
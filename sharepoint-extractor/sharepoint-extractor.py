@@ -1,6 +1,15 @@
+import json
 import logging
 import os
+import shutil
+import threading
 import time
+import zipfile
+from collections import Counter, deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as wait_for_futures
+from urllib.parse import quote, urlsplit
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
@@ -10,6 +19,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     StaleElementReferenceException,
     NoSuchElementException,
+    SessionNotCreatedException,
     TimeoutException,
 )
 from webdriver_manager.chrome import ChromeDriverManager
@@ -21,6 +31,33 @@ log_file_base_name = "sharepoint-extractor"  # Set your log file name here
 file_extension = ".zip"  # Set the file extension to download here
 # Set the SharePoint URL to extract files from
 sharepoint_url = "https://stuconestogacon.sharepoint.com.mcas.ms/sites/VARLab/Shared%20Documents/Forms/AllItems.aspx?view=7&q=%2Ezip"
+listing_mode = "keyboard"  # "keyboard" walks the rows with the arrow keys (as before), "rest" pages through the library listing API, "dom" harvests the rendered rows one viewport at a time
+sharepoint_site_url = "https://stuconestogacon.sharepoint.com.mcas.ms/sites/VARLab"  # Site of the document library (listing API)
+sharepoint_library_path = "/sites/VARLab/Shared Documents"  # Server-relative URL of the document library (listing API)
+listing_page_size = 5000  # Rows per listing API page (5000 is the SharePoint maximum)
+listing_sessions = 4  # Sessions listing the top-level library folders in parallel (rest listing); 1 lists the library in one pass
+dom_scroll_delay = 0.3  # Seconds for the virtualized list to render after each page scroll (dom listing)
+dom_end_checks = 3  # Passes at the bottom of the list without new rows before the dom listing stops
+max_concurrent_downloads = 4  # Browser downloads kept in flight at once
+download_poll_interval = 1  # Seconds between download progress checks while waiting for a free slot
+download_tracking = "files"  # "files" watches the .crdownload files (as before), "cdp" follows browser downloads through DevTools download events (by GUID)
+download_start_timeout = 120  # Seconds for a triggered download to appear in the download folder before it fails
+download_stall_timeout = 30  # Seconds without progress before a download counts as stalled and is resumed
+max_download_resumes = 5  # Resume attempts before a stalled download fails
+download_mode = "browser"  # "browser" downloads through Chrome (as before), "http" streams files directly with the browser session cookies (rest and dom listings)
+download_segments = 4  # Parallel Range requests per large file (http downloads)
+segment_threshold = 256 * 1024 * 1024  # Files at least this large are downloaded in segments (bytes)
+download_chunk_size = 1024 * 1024  # Read size of http downloads (bytes)
+manifest_save_interval = 5  # Seconds between manifest saves while downloads progress
+reuse_manifest_listing = False  # Skip listing the library again when the manifest holds a complete listing (new files are then not picked up)
+extract_archives = False  # Verify and extract each downloaded archive while later downloads continue (False = leave the archives as downloaded, as before)
+extraction_dir = "./extracted"  # Extracted archives laid out like the library (<project>/.../<archive name>/): the copier's source root
+extraction_workers = 2  # Archives extracted in parallel
+browser_profile_dir = "./.sharepoint-extractor-profile"  # Chrome user-data-dir kept between runs so the login is cached; None for a fresh profile every run
+headless = "auto"  # True, False, or "auto": headless once the profile holds a login, visible for the first login
+login_timeout = 300  # Seconds to log in and pass 2FA in a visible browser
+headless_login_timeout = 60  # Seconds for the cached login to load the library in a headless browser
+chromedriver_path = None  # Local chromedriver binary; None resolves one with webdriver_manager once and caches its path
 
 
 # Custom formatter for console with selective coloring
@@ -64,28 +101,82 @@ logging.getLogger().addHandler(file_handler)
 logging.getLogger().addHandler(console_handler)
 
 # # Set up the Chrome driver
-options = webdriver.ChromeOptions()
+def create_driver():
+    options = webdriver.ChromeOptions()
 
-# Set up chrome download preferences
-prefs = {
-    "download.default_directory": download_dir,
-    "download.prompt_for_download": False,  # Auto-download without a popup
-    "download.directory_upgrade": True,
-    "safebrowsing.enabled": True,  # Prevents Chrome's download protection from blocking the download
-}
-options.add_experimental_option("prefs", prefs)
+    # Set up chrome download preferences
+    prefs = {
+        "download.default_directory": download_dir,
+        "download.prompt_for_download": False,  # Auto-download without a popup
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True,  # Prevents Chrome's download protection from blocking the download
+        "profile.default_content_setting_values.automatic_downloads": 1,  # Allow several downloads from the site at once
+    }
+    options.add_experimental_option("prefs", prefs)
 
-options.add_argument("--log-level=3")  # Disable Chrome logging errors
-options.add_argument("--disable-logging")
+    options.add_argument("--log-level=3")  # Disable Chrome logging errors
+    options.add_argument("--disable-logging")
 
-# Use Service to avoid deprecation warning
-service = Service(ChromeDriverManager().install())
+    if browser_profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(browser_profile_dir)}")
+    if is_headless():
+        logging.info("Starting a headless browser with the cached login.")
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")  # The virtualized list renders rows for the window size
+
+    if download_tracking == "cdp":
+        # DevTools events are read from the performance log, which carries the events of the page session only
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": False, "enablePage": True})
+
+    try:
+        chrome = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+    except SessionNotCreatedException as e:
+        if chromedriver_path:
+            raise
+        # Chrome was updated since the driver was cached
+        logging.warning(f"The cached chromedriver failed to start Chrome, resolving it again: {e.msg}")
+        chrome = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)), options=options)
+    if download_tracking == "cdp":
+        # Save downloads under their GUID; files are renamed once complete. The Page.download* events
+        # follow from the Page domain being enabled for the performance log
+        chrome.execute_cdp_cmd("Browser.setDownloadBehavior", {
+            "behavior": "allowAndName",
+            "downloadPath": os.path.abspath(download_dir),
+        })
+    return chrome
+
+
+# Path of the chromedriver binary, resolved over the network by webdriver_manager only when no cached path works
+def get_chromedriver_path(refresh=False):
+    if chromedriver_path:
+        return chromedriver_path
+    if not refresh and os.path.exists(chromedriver_cache_path):
+        with open(chromedriver_cache_path) as cache_file:
+            cached_path = cache_file.read().strip()
+        if os.path.exists(cached_path):
+            return cached_path
+    resolved_path = ChromeDriverManager().install()
+    with open(chromedriver_cache_path, "w") as cache_file:
+        cache_file.write(resolved_path)
+    return resolved_path
+
+
+# Run headless when configured, or in "auto" mode once a login has been cached in the browser profile
+def is_headless():
+    if headless == "auto":
+        return login_marker_path is not None and os.path.exists(login_marker_path)
+    return bool(headless)
 
-# # Initialize driver
-driver = webdriver.Chrome(service=service, options=options)
 
 # # Global variables
+driver = None  # Created when the script runs, so the listing functions can be imported without a browser
 master_list = []
+manifest_path = os.path.join(download_dir, f".{log_file_base_name}-manifest.json")
+metrics_path = os.path.join(download_dir, f".{log_file_base_name}-metrics.jsonl")
+chromedriver_cache_path = os.path.join(download_dir, f".{log_file_base_name}-chromedriver")
+# Written to the browser profile after a successful login, so later runs can start headless
+login_marker_path = os.path.join(browser_profile_dir, "sharepoint-extractor-login") if browser_profile_dir else None
 
 
 def setup_browser():
@@ -95,17 +186,25 @@ def setup_browser():
 
 
 def wait_for_2fa():
-    # Wait until the SharePoint main content is loaded
+    # Wait until the SharePoint main content is loaded; headless, nobody can log in, so only the cached login can
+    headless_run = is_headless()
     try:
-        wait = WebDriverWait(driver, 300)  # 5 minutes to login
+        wait = WebDriverWait(driver, headless_login_timeout if headless_run else login_timeout)
         wait.until(
             EC.presence_of_element_located(
                 (By.CSS_SELECTOR, '[data-automationid="DetailsRowCell"]')
             )
         )
         logging.info("Login successful! Proceeding with file checks...")
+        if login_marker_path and not headless_run:
+            with open(login_marker_path, "w") as marker_file:
+                marker_file.write(time.strftime("%Y-%m-%d %H:%M:%S"))
     except Exception as e:
         logging.error(f"Error during login or page load: {e}")
+        if headless_run and login_marker_path and os.path.exists(login_marker_path):
+            # The cached login expired: the next run opens a visible browser to log in again
+            os.remove(login_marker_path)
+            logging.error("The cached login is no longer valid. Run the extractor again to log in.")
         driver.quit()
         exit()
 
@@ -134,20 +233,6 @@ def start_download_process(active_element):
         logging.error(f"An error occurred while trying to download: {e}")
 
 
-# Monitor the download folder for changes
-def monitor_download_folder():
-    logging.info("Monitoring downloads folder for new files...")
-    before_files = os.listdir(download_dir)
-    return before_files
-
-
-# Check if a new file has started downloading
-def check_download_started(before_files):
-    after_files = os.listdir(download_dir)
-    added_files = [file for file in after_files if file not in before_files]
-    return added_files[0] if added_files else None
-
-
 # Monitor the downloads and click "Resume" button if it appears
 def monitor_downloads_tab(final_file_name):
     logging.info(f"Checking downloads tab for failed items related to {final_file_name}...")
@@ -197,54 +282,651 @@ def monitor_downloads_tab(final_file_name):
         logging.error(f"Error while monitoring downloads tab: {e}")
 
 
-# Check if the download has completed
-def check_download_completed(download_file, final_file_name):
-    file_path = os.path.join(download_dir, download_file)
-    final_path = os.path.join(download_dir, final_file_name)
-
-    logging.info(f"Waiting for download of {download_file} to complete...")
+# Download states tracked by the download manager
+QUEUED, STARTED, STALLED, RESUMED, DONE, FAILED = "queued", "started", "stalled", "resumed", "done", "failed"
 
-    size = -1
-    no_change_count = 0
-    while True:
-        # Check if the final file exists
-        if os.path.exists(final_path):
-            logging.info(f"File {final_file_name} already exists. Download complete.")
-            return True  # Download is complete
 
-        # Check if the .crdownload file exists
-        if os.path.exists(file_path):
+# On-disk record of the discovered files (listing size, modified time, download state and downloaded bytes),
+# so a restarted run picks up the pending downloads first and re-fetches only incomplete or mismatched files
+class Manifest:
+    def __init__(self, path=None):
+        self.path = path or manifest_path
+        self.lock = threading.Lock()
+        self.saved_at = 0
+        self.listing_complete = False
+        self.files = {}  # File name -> listed file fields, plus "state" and "bytes"
+        if os.path.exists(self.path):
             try:
-                new_size = os.path.getsize(file_path)
-                if size == new_size:
-                    no_change_count += 1
-                    logging.info(f"File size hasn't changed for {no_change_count} checks.")
-                    if no_change_count >= 3:
-                        logging.info("File size hasn't changed for a while, checking for 'Resume' button...")
-                        monitor_downloads_tab(final_file_name)
-                        no_change_count = 0
+                with open(self.path) as manifest_file:
+                    data = json.load(manifest_file)
+                self.listing_complete, self.files = data["listing_complete"], data["files"]
+                logging.info(f"Loaded the download manifest: {len(self.files)} files, "
+                             f"{sum(entry['state'] != DONE for entry in self.files.values())} not downloaded.")
+            except (json.JSONDecodeError, KeyError) as e:
+                logging.error(f"The download manifest {self.path} is unreadable ({e}). Starting a new one.")
+
+    # Record a listed file; a downloaded file modified on the server since is downloaded again.
+    # Empty fields (e.g. the url of a keyboard-mode listing) do not overwrite the known ones
+    def add(self, file):
+        with self.lock:
+            entry = self.files.get(file["name"])
+            if entry is None:
+                entry = self.files[file["name"]] = {"state": "pending", "bytes": None}
+            elif entry["state"] == DONE and file.get("modified") and entry.get("modified") not in ("", None, file["modified"]):
+                logging.info(f"{file['name']} was modified on the server since it was downloaded.")
+                entry["state"] = "stale"
+            entry.update((key, value) for key, value in file.items() if value not in ("", None) or key not in entry)
+
+    # Record extra fields of a file, e.g. its extraction result
+    def record(self, file_name, **fields):
+        with self.lock:
+            self.files.setdefault(file_name, {"name": file_name, "state": "pending", "bytes": None}).update(fields)
+
+    def set_state(self, file_name, state):
+        with self.lock:
+            entry = self.files.setdefault(file_name, {"name": file_name, "url": "", "id": "", "size": 0, "bytes": None})
+            entry["state"] = state
+            if state == DONE:
+                entry["bytes"] = os.path.getsize(os.path.join(download_dir, file_name))
+
+    # Check whether a file still has to be downloaded: missing, stale, or shown to be incomplete by a size
+    # mismatch or, without an exact listed size, a zip file that does not open
+    def needs_download(self, file_name):
+        path = os.path.join(download_dir, file_name)
+        if not os.path.exists(path):
+            return True
+        entry = self.files.get(file_name, {"state": "pending"})
+        size = os.path.getsize(path)
+        if entry["state"] == "stale":
+            return True
+        if entry["state"] == DONE:
+            return size != entry["bytes"]
+        if entry.get("size_exact") and entry.get("size"):
+            complete = size == entry["size"]
+        else:
+            # Keyboard and dom listings have no exact size. Partial downloads are written under another name
+            # (.crdownload, .part), so a file on disk is kept unless it is a zip file that does not open
+            complete = not file_name.lower().endswith(".zip") or zipfile.is_zipfile(path)
+            if not complete:
+                logging.info(f"{file_name} is not a readable zip file. Downloading it again.")
+        if complete:
+            self.set_state(file_name, DONE)
+        return not complete
+
+    # Files left pending, incomplete or mismatched by a previous run that can be downloaded without the listing
+    def pending_files(self):
+        return [dict(entry) for entry in list(self.files.values())
+                if (entry.get("url") or entry.get("id")) and self.needs_download(entry["name"])]
+
+    def save(self, force=False):
+        if not force and time.time() - self.saved_at < manifest_save_interval:
+            return
+        with self.lock:
+            # Write a complete copy before replacing the manifest, so an interrupted save leaves the previous one
+            with open(self.path + ".tmp", "w") as manifest_file:
+                json.dump({"listing_complete": self.listing_complete, "files": self.files}, manifest_file)
+                manifest_file.flush()
+                os.fsync(manifest_file.fileno())
+            os.replace(self.path + ".tmp", self.path)
+            self.saved_at = time.time()
+
+
+# Download and listing metrics. Every finished download is appended to a JSON-lines file as it completes, and
+# a summary line with the aggregates and the time spent per phase is appended at exit
+class DownloadMetrics:
+    def __init__(self, path=None):
+        self.path = path or metrics_path
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.run = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.downloads = []
+        self.phases = Counter()  # Phase -> seconds the main thread spent in it
+        self.phase_stack = []
+        self.responses = Counter()  # HTTP status -> responses
+
+    # Time the main thread spends in a phase; an outer phase is paused while a nested one runs
+    @contextmanager
+    def phase(self, name):
+        now = time.time()
+        if self.phase_stack:
+            self.phases[self.phase_stack[-1][0]] += now - self.phase_stack[-1][1]
+        self.phase_stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.time()
+            name, started = self.phase_stack.pop()
+            self.phases[name] += now - started
+            if self.phase_stack:
+                self.phase_stack[-1][1] = now
+
+    # Response hook of the requests sessions, to see whether SharePoint throttles the listing or the downloads
+    def count_response(self, response, *args, **kwargs):
+        with self.lock:
+            self.responses[response.status_code] += 1
+        if response.status_code in (429, 503):
+            logging.warning(f"Throttled by SharePoint ({response.status_code}, Retry-After "
+                            f"{response.headers.get('Retry-After', '-')}): {response.request.method} {response.url}")
+
+    def record_download(self, download, state):
+        now = time.time()
+        finished_at = download["finished_at"] or now
+        path = os.path.join(download_dir, download["name"])
+        size = os.path.getsize(path) if state == DONE and os.path.exists(path) else max(download["size"], 0)
+        transfer_seconds = finished_at - (download["first_byte_at"] or download["started_at"] or finished_at)
+        record = {
+            "type": "download",
+            "run": self.run,
+            "name": download["name"],
+            "state": state,
+            "bytes": size,
+            "seconds": round(finished_at - (download["started_at"] or finished_at), 3),
+            "bytes_per_second": round(size / transfer_seconds) if transfer_seconds > 0 else None,
+            "time_to_first_byte": round(download["first_byte_at"] - download["started_at"], 3)
+            if download["first_byte_at"] and download["started_at"] else None,
+            "stalls": download["stalls"],
+            "resumes": download["resumed"],
+            "queued_seconds": round((download["started_at"] or now) - download["queued_at"], 3),
+            "detection_delay": round(now - download["finished_at"], 3) if download["finished_at"] else None,
+            "started_at": download["started_at"],
+            "finished_at": finished_at,
+        }
+        with self.lock:
+            self.downloads.append(record)
+            self.write(record)
+
+    def write(self, record):
+        with open(self.path, "a") as metrics_file:
+            metrics_file.write(json.dumps(record) + "\n")
+
+    def summarize(self):
+        with self.lock:
+            downloads = list(self.downloads)
+        done = [record for record in downloads if record["state"] == DONE]
+        first_bytes = [record["time_to_first_byte"] for record in downloads if record["time_to_first_byte"] is not None]
+        detection_delays = [record["detection_delay"] for record in downloads if record["detection_delay"] is not None]
+        total_bytes = sum(record["bytes"] for record in done)
+        # Aggregate throughput over the time at least one download was running
+        active_seconds = 0
+        active_until = 0
+        for record in sorted(downloads, key=lambda record: record["started_at"] or 0):
+            started_at = max(record["started_at"] or record["finished_at"], active_until)
+            if record["finished_at"] > started_at:
+                active_seconds += record["finished_at"] - started_at
+                active_until = record["finished_at"]
+        summary = {
+            "type": "summary",
+            "run": self.run,
+            "seconds": round(time.time() - self.started_at, 3),
+            "files": len(downloads),
+            "done": len(done),
+            "failed": len(downloads) - len(done),
+            "bytes": total_bytes,
+            "bytes_per_second": round(total_bytes / active_seconds) if active_seconds > 0 else None,
+            "mean_time_to_first_byte": round(sum(first_bytes) / len(first_bytes), 3) if first_bytes else None,
+            "max_time_to_first_byte": max(first_bytes, default=None),
+            "stalls": sum(record["stalls"] for record in downloads),
+            "resumes": sum(record["resumes"] for record in downloads),
+            "mean_detection_delay": round(sum(detection_delays) / len(detection_delays), 3) if detection_delays else None,
+            "throttled_responses": self.responses[429] + self.responses[503],
+            "responses": {str(status): count for status, count in sorted(self.responses.items())},
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+        }
+        with self.lock:
+            self.write(summary)
+
+        logging.info(f"Run summary: {summary['done']} files downloaded, {summary['failed']} failed, "
+                     f"{total_bytes / 1024 ** 2:.1f} MB at {(summary['bytes_per_second'] or 0) / 1024 ** 2:.2f} MB/s "
+                     f"in {summary['seconds']:.0f}s.")
+        logging.info(f"Time to first byte {summary['mean_time_to_first_byte']}s on average "
+                     f"(max {summary['max_time_to_first_byte']}s), {summary['stalls']} stalls, "
+                     f"{summary['resumes']} resumes, {summary['throttled_responses']} throttled responses.")
+        if summary["phases"]:
+            logging.info("Time spent: " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in summary["phases"].items()) + ".")
+        if detection_delays:
+            logging.info(f"Finished downloads were noticed {summary['mean_detection_delay']}s after completing on average.")
+        logging.info(f"Metrics written to {self.path}.")
+        return summary
+
+
+metrics = DownloadMetrics()
+
+
+# Verifies and extracts downloaded archives on a worker pool while later downloads continue. Members are
+# streamed out of the archive, which checks their CRCs, into a partial folder renamed once complete
+class ArchiveExtractor:
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.executor = ThreadPoolExecutor(max_workers=extraction_workers)
+        self.futures = []
+
+    def submit(self, file_name):
+        entry = self.manifest.files.get(file_name, {})
+        if not file_name.lower().endswith(".zip") or entry.get("extracted") and os.path.isdir(entry["extracted"]):
+            return
+        self.futures.append(self.executor.submit(self.extract, file_name))
+
+    # Folder an archive is extracted to, mirroring its folder in the library
+    def get_extraction_path(self, file_name):
+        url = self.manifest.files.get(file_name, {}).get("url") or ""
+        library = sharepoint_library_path.rstrip("/") + "/"
+        relative_url = url[len(library):] if url.lower().startswith(library.lower()) else url.lstrip("/")
+        folders = [folder for folder in os.path.dirname(relative_url).split("/") if folder]
+        return os.path.join(extraction_dir, *folders, os.path.splitext(file_name)[0])
+
+    def extract(self, file_name):
+        archive_path = os.path.join(download_dir, file_name)
+        target_path = self.get_extraction_path(file_name)
+        partial_path = target_path + ".partial"
+        start = time.time()
+        try:
+            shutil.rmtree(partial_path, ignore_errors=True)
+            with zipfile.ZipFile(archive_path) as archive:
+                members = [info for info in archive.infolist() if not info.is_dir()]
+                # A single top-level folder named after the archive (in any case) is the asset folder itself
+                prefix = os.path.splitext(file_name)[0].lower() + "/"
+                if members and all(info.filename.replace("\\", "/").lower().startswith(prefix) for info in members):
+                    strip = len(prefix)
                 else:
-                    size = new_size
-                    logging.info(f"File {download_file} size: {size}. Still downloading...")
-                    no_change_count = 0
+                    strip = 0
+                for info in members:
+                    parts = info.filename.replace("\\", "/")[strip:].split("/")
+                    if ":" in parts[0] or any(part in ("", ".", "..") for part in parts):
+                        logging.warning(f"Skipping unsafe archive member '{info.filename}' in {file_name}")
+                        continue
+                    member_path = os.path.join(partial_path, *parts)
+                    os.makedirs(os.path.dirname(member_path), exist_ok=True)
+                    with archive.open(info) as source, open(member_path, "wb") as target:
+                        shutil.copyfileobj(source, target, download_chunk_size)  # Raises on a CRC mismatch
+
+            shutil.rmtree(target_path, ignore_errors=True)
+            os.replace(partial_path, target_path)
+            self.manifest.record(file_name, extracted=target_path, extraction_error=None)
+            logging.info(f"Extracted {file_name} to {target_path} in {time.time() - start:.1f}s.")
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, EOFError) as e:
+            shutil.rmtree(partial_path, ignore_errors=True)
+            logging.error(f"{file_name} is corrupt and will be downloaded again on the next run: {e}")
+            self.manifest.record(file_name, extracted=None, extraction_error=str(e))
+            self.manifest.set_state(file_name, "stale")
+        except Exception as e:
+            shutil.rmtree(partial_path, ignore_errors=True)
+            logging.error(f"Failed to extract {file_name}: {e}")
+            self.manifest.record(file_name, extracted=None, extraction_error=str(e))
+
+    # Block until every submitted archive is extracted
+    def wait(self):
+        for future in self.futures:
+            future.result()
+        self.executor.shutdown()
+        extracted = sum(1 for entry in self.manifest.files.values() if entry.get("extracted"))
+        logging.info(f"Extraction finished: {extracted} archives extracted, "
+                     f"{sum(1 for entry in self.manifest.files.values() if entry.get('extraction_error'))} failed.")
+
+
+# Follows browser downloads through the DevTools Page.downloadWillBegin and Page.downloadProgress events read
+# from the performance log, so each download's GUID, bytes and completion are known exactly. The log only
+# carries events of the page session: the Browser.download* events are sent to the browser session and never appear
+class CdpDownloadTracker:
+    def __init__(self):
+        self.events = {}  # GUID -> {"name", "index", "received", "total", "state"}, until the download is forgotten
+        self.claimed = set()  # GUIDs matched to a download
+        self.begun = 0  # Downloads begun in the browser, numbering the events in arrival order
+        self.triggered = 0  # Downloads triggered by the download manager, numbering them in trigger order
+
+    def poll(self):
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method", ""), message.get("params", {})
+            if method == "Page.downloadWillBegin":
+                self.events[params["guid"]] = {"name": params.get("suggestedFilename", ""), "index": self.begun,
+                                               "received": 0, "total": 0, "state": "inProgress"}
+                self.begun += 1
+            elif method == "Page.downloadProgress" and params["guid"] in self.events:
+                self.events[params["guid"]].update(received=params.get("receivedBytes", 0),
+                                                   total=params.get("totalBytes", 0),
+                                                   state=params.get("state", "inProgress"))
+
+    # Number a download in trigger order, once its trigger has been sent to the browser
+    def trigger(self, download):
+        download["trigger"] = self.triggered
+        self.triggered += 1
+
+    # Match a triggered download to its GUID: by the suggested file name, else by trigger order (the n-th
+    # triggered download is the n-th to begin) when the event's name is not that of another pending download.
+    # Returns None when no event matches; the download then fails once download_start_timeout passes
+    def claim(self, download, pending_names):
+        unclaimed = [guid for guid in self.events if guid not in self.claimed]
+        guid = next((guid for guid in unclaimed if self.events[guid]["name"] == download["name"]), None)
+        if guid is None:
+            guid = next((guid for guid in unclaimed if self.events[guid]["index"] == download.get("trigger")
+                         and self.events[guid]["name"] not in pending_names), None)
+        if guid:
+            self.claimed.add(guid)
+        return guid
+
+    def unclaimed_names(self):
+        return [event["name"] for guid, event in self.events.items() if guid not in self.claimed]
+
+    # Drop the events of a finished download
+    def forget(self, guid):
+        self.events.pop(guid, None)
+        self.claimed.discard(guid)
+
+
+# Keeps up to max_concurrent_downloads browser downloads in flight and tracks the state of each one from
+# its .crdownload and final files, so the list can keep being enumerated while transfers run
+class DownloadManager:
+    def __init__(self, max_in_flight=max_concurrent_downloads, tracker=None, manifest=None, extractor=None):
+        self.max_in_flight = max_in_flight
+        self.tracker = tracker  # CdpDownloadTracker, or None to watch the download folder
+        self.manifest = manifest or Manifest()
+        self.extractor = extractor  # ArchiveExtractor, or None to leave the archives as downloaded
+        self.queue = deque()
+        self.downloads = {}  # File name -> download state
+
+    def in_flight(self):
+        return [download for download in self.downloads.values() if download["state"] in (STARTED, STALLED, RESUMED)]
+
+    def set_state(self, download, state):
+        if download["state"] != state:
+            logging.info(f"Download {download['name']}: {download['state']} -> {state}")
+            download["state"] = state
+            self.manifest.set_state(download["name"], state)
+            if state == STALLED:
+                download["stalls"] += 1
+            elif state == RESUMED:
+                download["resumed"] += 1
+            elif state in (DONE, FAILED):
+                metrics.record_download(download, state)
+                if self.tracker and download["guid"]:
+                    self.tracker.forget(download["guid"])
+            if state == DONE and self.extractor:
+                self.extractor.submit(download["name"])
+
+    # Queue a download; start_download is called (without arguments) to trigger it once a slot is free
+    def submit(self, file_name, start_download):
+        # Clear an earlier copy shown to be incomplete by needs_download, which the browser would otherwise download next to
+        if os.path.exists(os.path.join(download_dir, file_name)):
+            os.remove(os.path.join(download_dir, file_name))
+        self.manifest.record(file_name, extracted=None)  # A fresh download is extracted again
+        download = {"name": file_name, "state": QUEUED, "start": start_download, "future": None, "guid": None,
+                    "started_at": None, "size": -1, "progress_at": None, "resumes": 0, "queued_at": time.time(),
+                    "first_byte_at": None, "finished_at": None, "stalls": 0, "resumed": 0}
+        self.downloads[file_name] = download
+        self.queue.append(download)
+        self.poll()
+
+    # Update the in-flight downloads and start queued ones while slots are free
+    def poll(self):
+        if self.tracker:
+            self.tracker.poll()
+        for download in self.in_flight():
+            self.update(download)
+        while self.queue and len(self.in_flight()) < self.max_in_flight:
+            download = self.queue.popleft()
+            try:
+                download["started_at"] = download["progress_at"] = time.time()
+                download["future"] = download["start"]()  # Http downloads run on their own threads
+                if self.tracker and not download["future"]:
+                    self.tracker.trigger(download)
+                if download["future"]:
+                    download["future"].add_done_callback(lambda future, download=download: self.record_finish(download))
+                self.set_state(download, STARTED)
+            except Exception as e:
+                logging.error(f"Failed to trigger download for {download['name']}: {e}")
+                self.set_state(download, FAILED)
+        self.manifest.save()
+
+    # Called on the download thread, to measure how long the poll loop takes to notice a finished download
+    def record_finish(self, download):
+        download["finished_at"] = time.time()
+
+    def record_first_byte(self, download):
+        if download["first_byte_at"] is None:
+            download["first_byte_at"] = time.time()
+
+    def update(self, download):
+        if download["future"]:
+            # Http downloads report stalls and resumes themselves; only the outcome is tracked here
+            if download["future"].done():
+                error = download["future"].exception()
+                if error:
+                    logging.error(f"Download of {download['name']} failed: {error}")
+                self.set_state(download, FAILED if error else DONE)
+            return
+        if self.tracker:
+            self.update_from_events(download)
+            return
+
+        final_path = os.path.join(download_dir, download["name"])
+        partial_path = final_path + ".crdownload"
+        now = time.time()
+
+        if os.path.exists(partial_path):
+            try:
+                size = os.path.getsize(partial_path)
             except FileNotFoundError:
-                logging.info(f"{download_file} disappeared, possibly renamed or download interrupted.")
-                # Since the file disappeared, we need to check for 'Resume' button
-                monitor_downloads_tab(final_file_name)
-        else:
-            # The .crdownload file does not exist
-            logging.info(f"{download_file} not found. Checking if final file exists...")
-            if os.path.exists(final_path):
-                logging.info(f"File {final_file_name} exists. Download complete.")
-                return True
+                return  # Renamed to the final file in the meantime; picked up by the next poll
+            if size != download["size"]:
+                download["size"], download["progress_at"] = size, now
+                if size:
+                    self.record_first_byte(download)
+                if download["state"] == STALLED:
+                    self.set_state(download, RESUMED)
+            elif now - download["progress_at"] >= download_stall_timeout:
+                self.stall(download)
+        elif os.path.exists(final_path):
+            self.set_state(download, DONE)
+        elif now - download["started_at"] >= download_start_timeout and download["size"] < 0:
+            logging.error(f"Download of {download['name']} did not start within {download_start_timeout} seconds.")
+            self.set_state(download, FAILED)
+        elif download["size"] >= 0 and now - download["progress_at"] >= download_stall_timeout:
+            self.stall(download)  # The partial file disappeared: the download was interrupted
+
+    def update_from_events(self, download):
+        now = time.time()
+        if download["guid"] is None:
+            pending_names = {other["name"] for other in self.in_flight() if other["guid"] is None and other is not download}
+            download["guid"] = self.tracker.claim(download, pending_names)
+            if download["guid"] is None:
+                if now - download["started_at"] >= download_start_timeout:
+                    unclaimed = ", ".join(self.tracker.unclaimed_names()) or "none"
+                    logging.error(f"Download of {download['name']} did not start within {download_start_timeout} seconds "
+                                  f"(unmatched browser downloads: {unclaimed}).")
+                    self.set_state(download, FAILED)
+                return
+
+        event = self.tracker.events[download["guid"]]
+        if event["state"] == "completed":
+            # allowAndName saves the file under its GUID
+            os.replace(os.path.join(download_dir, download["guid"]), os.path.join(download_dir, download["name"]))
+            self.set_state(download, DONE)
+        elif event["state"] == "canceled":
+            logging.error(f"Download of {download['name']} was canceled.")
+            self.set_state(download, FAILED)
+        elif event["received"] != download["size"]:
+            download["size"], download["progress_at"] = event["received"], now
+            if event["received"]:
+                self.record_first_byte(download)
+            if download["state"] == STALLED:
+                self.set_state(download, RESUMED)
+        elif now - download["progress_at"] >= download_stall_timeout:
+            self.stall(download)
+
+    def stall(self, download):
+        if download["resumes"] >= max_download_resumes:
+            logging.error(f"Download of {download['name']} still stalled after {max_download_resumes} resume attempts.")
+            self.set_state(download, FAILED)
+            return
+        self.set_state(download, STALLED)
+        download["resumes"] += 1
+        download["progress_at"] = time.time()
+        # With allowAndName the browser saves, and lists, the file under its GUID
+        monitor_downloads_tab(download["guid"] or download["name"])
+
+    # Block until a download slot is free, e.g. before triggering a download from the focused row
+    def wait_for_slot(self):
+        with metrics.phase("waiting"):
+            self.poll()
+            while self.queue or len(self.in_flight()) >= self.max_in_flight:
+                time.sleep(download_poll_interval)
+                self.poll()
+
+    # Block until every download is done or failed
+    def wait(self):
+        self.poll()
+        while self.queue or self.in_flight():
+            time.sleep(download_poll_interval)
+            self.poll()
+        self.manifest.save(force=True)
+        states = [download["state"] for download in self.downloads.values()]
+        logging.info(f"Downloads finished: {states.count(DONE)} done, {states.count(FAILED)} failed.")
+
+
+# Streams listed files straight to disk with the browser session cookies over a pooled HTTP client.
+# Progress is saved next to the partial file, so interrupted transfers resume with Range requests;
+# large files are fetched in parallel segments, and the size and ETag are verified before the rename
+class HttpDownloader:
+    def __init__(self, session):
+        self.session = session
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_concurrent_downloads,
+                                                pool_maxsize=max_concurrent_downloads * download_segments)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_downloads)
+        self.segment_executor = ThreadPoolExecutor(max_workers=max_concurrent_downloads * download_segments)
+
+    # Start downloading a listed file; returns the future tracked by the download manager
+    def start(self, file, download_manager):
+        download = download_manager.downloads[file["name"]]
+        return self.executor.submit(self.download, file, lambda state: download_manager.set_state(download, state),
+                                    lambda: download_manager.record_first_byte(download))
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+        self.segment_executor.shutdown(cancel_futures=True)
+
+    def head(self, url):
+        response = self.session.head(url, allow_redirects=True, timeout=download_stall_timeout, headers={"Accept": "*/*"})
+        response.raise_for_status()
+        size = int(response.headers.get("Content-Length") or -1)
+        return size, response.headers.get("ETag"), response.headers.get("Accept-Ranges") == "bytes"
+
+    def download(self, file, set_state, first_byte):
+        url = get_file_url(file)
+        final_path = os.path.join(download_dir, file["name"])
+        part_path = final_path + ".part"
+        state_path = part_path + ".json"
+        size, etag, ranges = self.head(url)
+        if size < 0 and file["size"]:
+            size = file["size"]
+
+        # Resume the segments of an earlier attempt, unless the file changed since
+        state = None
+        if ranges and os.path.exists(part_path) and os.path.exists(state_path):
+            with open(state_path) as state_file:
+                state = json.load(state_file)
+            if state["etag"] != etag or state["size"] != size:
+                logging.info(f"{file['name']} changed on the server since the last attempt. Starting over.")
+                state = None
+        if state is None:
+            segment_count = download_segments if ranges and size >= segment_threshold else 1
+            segment_size = -(-size // segment_count) if size > 0 else 0
+            # Each segment is [first byte, last byte (None until the end of the file), bytes written]
+            if size > 0:
+                segments = [[start, min(start + segment_size, size) - 1, 0] for start in range(0, size, segment_size)]
             else:
-                # Neither file exists, perhaps download failed or was interrupted
-                monitor_downloads_tab(final_file_name)
-        # Wait a bit before checking again
-        time.sleep(10)
-        
+                segments = [] if size == 0 else [[0, None, 0]]
+            state = {"etag": etag, "size": size, "segments": segments}
+            with open(part_path, "wb") as part_file:
+                part_file.truncate(max(size, 0))
+        elif any(segment[2] for segment in state["segments"]):
+            logging.info(f"Resuming {file['name']} from {sum(segment[2] for segment in state['segments'])} bytes.")
+
+        state_lock = threading.Lock()
+
+        def save_state():
+            with state_lock:
+                with open(state_path + ".tmp", "w") as state_file:
+                    json.dump(state, state_file)
+                os.replace(state_path + ".tmp", state_path)
+
+        futures = [
+            self.segment_executor.submit(self.download_segment, url, part_path, segment, etag if ranges else None,
+                                         ranges, set_state, save_state, first_byte)
+            for segment in state["segments"]
+        ]
+        for future in futures:
+            future.result()
+
+        # Verify the transfer before publishing the file. The part file was sized up front, so the bytes
+        # written by each segment are checked rather than its length
+        written = sum(segment[2] for segment in state["segments"])
+        if size >= 0 and (written != size or any(segment[2] != segment[1] - segment[0] + 1 for segment in state["segments"])):
+            os.remove(part_path)
+            os.remove(state_path)
+            raise Exception(f"Size mismatch: {written} bytes written, {size} expected")
+        if etag and self.head(url)[1] != etag:
+            os.remove(part_path)
+            os.remove(state_path)
+            raise Exception("The file changed on the server during the download")
+        os.replace(part_path, final_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
+    def download_segment(self, url, part_path, segment, etag, ranges, set_state, save_state, first_byte):
+        start, end = segment[0], segment[1]
+        failures = 0
+        while end is None or segment[2] < end - start + 1:
+            headers = {"Accept": "*/*"}
+            if ranges:
+                headers["Range"] = f"bytes={start + segment[2]}-{'' if end is None else end}"
+                if etag:
+                    headers["If-Range"] = etag  # The server sends the whole file instead if it changed
+            else:
+                segment[2] = 0  # No Range support: start over
+
+            chunks = 0
+            try:
+                with self.session.get(url, headers=headers, stream=True,
+                                      timeout=(download_stall_timeout, download_stall_timeout)) as response:
+                    response.raise_for_status()
+                    if ranges and response.status_code != 206 and (segment[2] or start):
+                        raise Exception("The file changed on the server during the download")
+                    with open(part_path, "r+b") as part_file:
+                        part_file.seek(start + segment[2])
+                        for chunk in response.iter_content(download_chunk_size):
+                            part_file.write(chunk)
+                            segment[2] += len(chunk)
+                            chunks += 1
+                            if chunks == 1:
+                                first_byte()
+                            if failures:
+                                set_state(RESUMED)
+                                failures = 0
+                            if chunks % 16 == 0:
+                                part_file.flush()
+                                save_state()
+                if end is None:
+                    break  # Unknown size: the response ended with the file
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                failures += 1
+                if failures > max_download_resumes:
+                    raise
+                logging.warning(f"Download of {os.path.basename(part_path)} interrupted ({e}). Resuming...")
+                set_state(STALLED)
+                time.sleep(min(2 ** failures, 30))
+            finally:
+                save_state()
+
+
+# Direct URL of a listed file, from its server-relative path
+def get_file_url(file):
+    site = urlsplit(sharepoint_site_url)
+    return f"{site.scheme}://{site.netloc}{quote(file['url'])}"
 
-def read_page_and_create_master_list():
+
+def read_page_and_create_master_list(download_manager):
     max_stuck_counter = 10  # Number of times the accessible name hasn't changed before breaking the loop
     counter = 0  # Initialize counter for tracking added items
     
@@ -280,30 +962,24 @@ def read_page_and_create_master_list():
                             counter += 1  # Increment the counter when a new item is added
                             logging.info(f"Tracking: {file_name}")
                             # Check if the file_name exists in the download directory
-                            file_path = os.path.join(download_dir, file_name)
-                            if not os.path.exists(file_path):
+                            download_manager.manifest.add({"name": file_name, "url": "", "id": "", "size": 0})
+                            if download_manager.manifest.needs_download(file_name):
                                 logging.info(f"File not found locally. Triggering download: {file_name}")
-                                # Click the element to trigger the download
+                                # Click the element to trigger the download once a download slot is free
                                 try:
-                                    before_files = monitor_download_folder()
-                                    download_file = None
+                                    download_manager.wait_for_slot()
                                     time.sleep(0.1)  # Sleep to avoid overloading the browser
-                                    start_download_process(active_element)
-                                    
-                                    while download_file is None:
-                                        download_file = check_download_started(before_files)
-                                        time.sleep(1)
-                                        
-                                    logging.info(f"Download started: {download_file}")
-                                    
+                                    download_manager.submit(file_name, lambda: start_download_process(active_element))
+
                                     active_element.click()
                                     logging.info("Returned to the active element.")
-                                    check_download_completed(download_file, file_name)
-                                    
+
                                 except Exception as click_error:
                                     logging.error(f"Failed to trigger download for {file_name}: {click_error}")
                             else:
                                 logging.info(f"File already exists locally: {file_name}")
+                                if download_manager.extractor:
+                                    download_manager.extractor.submit(file_name)
                         else:
                             logging.info(f"Skipped duplicate: {file_name}")
                     else:
@@ -323,6 +999,8 @@ def read_page_and_create_master_list():
                 # Update the previous accessible name
                 prev_accessible_name = accessible_name
                 
+                download_manager.poll()  # Track the downloads in flight while walking the list
+
                 # Scroll down after processing each element
                 ActionChains(driver).send_keys('\ue015').perform()  # Down arrow key
 
@@ -341,7 +1019,315 @@ def read_page_and_create_master_list():
     logging.info(f"Total items added: {counter}")
 
 
+# Build a requests session that reuses the authenticated browser session cookies
+def create_listing_session():
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    session.headers.update({
+        "Accept": "application/json;odata=nometadata",
+        "User-Agent": driver.execute_script("return navigator.userAgent;"),
+    })
+    session.hooks["response"].append(metrics.count_response)
+    return session
+
+
+# Copy a listing session, so parallel listings each get their own connections with the same authentication
+def copy_listing_session(session):
+    session_copy = requests.Session()
+    session_copy.cookies.update(session.cookies)
+    session_copy.headers.update(session.headers)
+    session_copy.hooks["response"] = list(session.hooks["response"])
+    return session_copy
+
+
+# Get the form digest required by POST requests to the SharePoint REST API
+def get_form_digest(session, site_url):
+    response = session.post(f"{site_url}/_api/contextinfo")
+    response.raise_for_status()
+    return response.json()["FormDigestValue"]
+
+
+# Page through every file of a document library with the RenderListDataAsStream listing API. A folder limits
+# the listing to that folder; without recursion only its direct files are listed and its subfolders are
+# collected into folders
+def list_library_files(session, site_url, library_path, folder=None, recursive=True, folders=None):
+    digest = get_form_digest(session, site_url)
+    # No server-side filter: filtering on a non-indexed column fails on libraries above the list view threshold
+    scope = " Scope='RecursiveAll'" if recursive else ""
+    view_xml = (
+        f"<View{scope}><ViewFields>"
+        "<FieldRef Name='FileLeafRef'/><FieldRef Name='FileRef'/><FieldRef Name='File_x0020_Size'/>"
+        "<FieldRef Name='FSObjType'/><FieldRef Name='UniqueId'/><FieldRef Name='Modified'/>"
+        f"</ViewFields><RowLimit Paged='TRUE'>{listing_page_size}</RowLimit></View>"
+    )
+    endpoint = f"{site_url}/_api/web/GetList(@listUrl)/RenderListDataAsStream"
+    list_url_param = "@listUrl=" + quote("'" + library_path.replace("'", "''") + "'")  # OData string literal
+    parameters = {"RenderOptions": 2, "ViewXml": view_xml}
+    if folder:
+        parameters["FolderServerRelativeUrl"] = folder
+    paging = "?"
+
+    files = []
+    page = 0
+    while paging:
+        response = session.post(
+            f"{endpoint}{paging}{'' if paging == '?' else '&'}{list_url_param}",
+            json={"parameters": parameters},
+            headers={"X-RequestDigest": digest},
+        )
+        response.raise_for_status()
+        data = response.json()
+        page += 1
+        for row in data.get("Row", []):
+            if str(row.get("FSObjType")) != "0":
+                if folders is not None:
+                    folders.append(row["FileRef"])
+                continue  # Folder
+            files.append({
+                "name": row["FileLeafRef"],
+                "url": row["FileRef"],
+                "size": int(row.get("File_x0020_Size") or 0),
+                "size_exact": True,
+                "modified": row.get("Modified.", row.get("Modified", "")),
+                "id": row.get("UniqueId", "").strip("{}"),
+            })
+        logging.info(f"Listing page {page}{f' of {folder}' if folder else ''}: {len(files)} files so far.")
+        paging = data.get("NextHref")  # '?Paged=TRUE&p_ID=...' until the last page
+
+    return files
+
+
+# Collect the rendered rows of the virtualized list, then scroll it down by one page, in a single round trip
+harvest_rows_script = """
+    var rows = document.querySelectorAll('[data-automationid="DetailsRow"]');
+    var harvested = [];
+    for (var i = 0; i < rows.length; i++) {
+        var row = rows[i];
+        var nameElement = row.querySelector('[data-automationid="FieldRenderer-name"]');
+        if (!nameElement) continue;
+        var sizeCell = row.querySelector('[data-automation-key^="fileSize"], [data-automation-key^="FileSize"]');
+        var modifiedCell = row.querySelector('[data-automation-key^="modified"], [data-automation-key^="Modified"]');
+        var link = nameElement.closest('a[href]') || nameElement.querySelector('a[href]');
+        harvested.push({
+            name: (nameElement.getAttribute('title') || nameElement.textContent).trim(),
+            size: sizeCell ? sizeCell.textContent.trim() : '',
+            modified: modifiedCell ? modifiedCell.textContent.trim() : '',
+            row: row.getAttribute('data-list-index') || row.getAttribute('data-selection-index') || '',
+            url: link ? decodeURIComponent(new URL(link.href, location.href).pathname) : ''
+        });
+    }
+
+    // The scroll container is the closest scrollable ancestor of the rows
+    var container = rows.length ? rows[0].parentElement : null;
+    while (container && !(container.scrollHeight > container.clientHeight &&
+                          /(auto|scroll)/.test(getComputedStyle(container).overflowY))) {
+        container = container.parentElement;
+    }
+    container = container || document.scrollingElement;
+    var atEnd = container.scrollTop + container.clientHeight >= container.scrollHeight - 1;
+    container.scrollTop += container.clientHeight;
+    return {rows: harvested, atEnd: atEnd};
+"""
+
+
+# Convert a displayed file size (e.g. '1.5 MB') to bytes
+def parse_size_text(size_text):
+    units = {"B": 1, "BYTES": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+    parts = size_text.replace(",", "").split()
+    try:
+        return int(float(parts[0]) * units.get(parts[1].upper() if len(parts) > 1 else "B", 1))
+    except (IndexError, ValueError):
+        return 0
+
+
+# List the files of the current view by harvesting the rendered rows, one execute_script per viewport
+def harvest_listed_files():
+    files = {}
+    end_checks = 0
+    passes = 0
+    while end_checks < dom_end_checks:
+        result = driver.execute_script(harvest_rows_script)
+        passes += 1
+        new_rows = 0
+        for row in result["rows"]:
+            key = row["row"] or row["name"]
+            if key not in files:
+                # Displayed sizes are rounded, so they are not used to verify downloaded files
+                files[key] = {"name": row["name"], "url": row["url"], "size": parse_size_text(row["size"]),
+                              "size_exact": False, "modified": row["modified"], "id": ""}
+                new_rows += 1
+        # At the bottom with nothing new: SharePoint may still be loading the next batch of rows
+        end_checks = end_checks + 1 if result["atEnd"] and not new_rows else 0
+        time.sleep(dom_scroll_delay)
+    logging.info(f"Harvested {len(files)} rows in {passes} passes.")
+    return list(files.values())
+
+
+# Trigger the browser download of a listed file
+def start_listed_file_download(file):
+    if file["id"]:
+        download_url = f"{sharepoint_site_url}/_layouts/15/download.aspx?UniqueId={file['id']}"
+    elif file["url"]:
+        download_url = f"{sharepoint_site_url}/_layouts/15/download.aspx?SourceUrl={quote(file['url'])}"
+    else:
+        raise Exception("The row has no file link to download from")
+    driver.execute_script("window.location.href = arguments[0];", download_url)
+
+
+def read_library_and_create_master_list(download_manager, http_downloader=None):
+    manifest = download_manager.manifest
+    if reuse_manifest_listing and manifest.listing_complete:
+        logging.info("Using the file listing of the manifest.")
+        track_and_download_files(list(manifest.files.values()), download_manager, http_downloader)
+        return
+
+    manifest.listing_complete = False
+    if listing_mode == "dom":
+        files = harvest_listed_files()
+    elif listing_sessions > 1:
+        manifest.listing_complete = crawl_library_folders(create_listing_session(), download_manager, http_downloader)
+        manifest.save(force=True)
+        return
+    else:
+        session = create_listing_session()
+        files = list_library_files(session, sharepoint_site_url, sharepoint_library_path)
+        logging.info(f"Listed {len(files)} files in {sharepoint_library_path}.")
+    track_and_download_files(files, download_manager, http_downloader)
+    manifest.listing_complete = True
+    manifest.save(force=True)
+
+
+# List the library with several sessions at once. The top-level folders are partitioned across the sessions,
+# and the files of each folder are merged, deduplicated and queued for download as soon as the folder is listed.
+# Returns whether every folder was listed
+def crawl_library_folders(session, download_manager, http_downloader=None):
+    folders = []
+    root_files = list_library_files(session, sharepoint_site_url, sharepoint_library_path, recursive=False,
+                                    folders=folders)
+    logging.info(f"Listing {len(folders)} folders of {sharepoint_library_path} with {listing_sessions} sessions.")
+
+    sessions = deque(copy_listing_session(session) for _ in range(min(listing_sessions, max(len(folders), 1))))
+    sessions_lock = threading.Lock()
+
+    def list_folder(folder):
+        with sessions_lock:
+            folder_session = sessions.popleft()
+        try:
+            return list_library_files(folder_session, sharepoint_site_url, sharepoint_library_path, folder)
+        finally:
+            with sessions_lock:
+                sessions.append(folder_session)
+
+    # Merge on this thread only, so the download manager is never used from the listing threads
+    seen_files = set()
+    seen_names = set()
+
+    def merge(files):
+        new_files = []
+        for file in files:
+            key = file["id"] or file["url"]
+            if key not in seen_files:
+                seen_files.add(key)
+                new_files.append(file)
+        track_and_download_files(new_files, download_manager, http_downloader, seen_names)
+
+    merge(root_files)
+    complete = True
+    with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+        pending = {executor.submit(list_folder, folder): folder for folder in folders}
+        while pending:
+            done, _ = wait_for_futures(pending, timeout=download_poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder = pending.pop(future)
+                try:
+                    files = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to list {folder}: {e}")
+                    complete = False
+                    continue
+                logging.info(f"Listed {len(files)} files in {folder}.")
+                merge(files)
+            download_manager.poll()
+
+    logging.info(f"Listed {len(seen_files)} files in {sharepoint_library_path}.")
+    return complete
+
+
+# Add the listed zip files to the master list and download the ones missing locally. seen_elements carries
+# the tracked file names across calls
+def track_and_download_files(files, download_manager, http_downloader=None, seen_elements=None):
+    counter = 0
+    seen_elements = set() if seen_elements is None else seen_elements
+    for file in files:
+        file_name = file["name"]
+        if not file_name.endswith(file_extension):
+            logging.debug(f"Skipped non-zip file: {file_name}")
+            continue
+        if file_name in seen_elements:
+            logging.info(f"Skipped duplicate: {file_name}")
+            continue
+        master_list.append(file_name)
+        seen_elements.add(file_name)
+        counter += 1
+        logging.info(f"Tracking: {file_name}")
+
+        download_manager.manifest.add(file)
+        if file_name in download_manager.downloads:
+            continue  # Already queued from the manifest
+        if not download_manager.manifest.needs_download(file_name):
+            logging.info(f"File already exists locally: {file_name}")
+            if download_manager.extractor:
+                download_manager.extractor.submit(file_name)
+            continue
+        logging.info(f"File not found locally or incomplete. Queuing download: {file_name}")
+        queue_file_download(file, download_manager, http_downloader)
+
+    logging.info(f"Total items added: {counter}")
+
+
+def queue_file_download(file, download_manager, http_downloader=None):
+    if http_downloader and file["url"]:
+        download_manager.submit(file["name"], lambda: http_downloader.start(file, download_manager))
+    else:
+        download_manager.submit(file["name"], lambda: start_listed_file_download(file))
+
+
 def process_page():
+    manifest = Manifest()
+    extractor = ArchiveExtractor(manifest) if extract_archives else None
+    download_manager = DownloadManager(tracker=CdpDownloadTracker() if download_tracking == "cdp" else None,
+                                       manifest=manifest, extractor=extractor)
+    http_downloader = None
+    try:
+        if listing_mode in ("rest", "dom"):
+            if download_mode == "http":
+                http_downloader = HttpDownloader(create_listing_session())
+            # Start with the downloads a previous run left pending, while the library is listed again
+            pending_files = download_manager.manifest.pending_files()
+            if pending_files:
+                logging.info(f"Resuming {len(pending_files)} pending downloads from the manifest.")
+            for file in pending_files:
+                queue_file_download(file, download_manager, http_downloader)
+            with metrics.phase("enumeration"):
+                read_library_and_create_master_list(download_manager, http_downloader)
+        else:
+            prepare_keyboard_listing()
+            with metrics.phase("enumeration"):
+                read_page_and_create_master_list(download_manager)
+        with metrics.phase("downloading"):
+            download_manager.wait()
+        if extractor:
+            with metrics.phase("extraction"):
+                extractor.wait()
+    finally:
+        if http_downloader:
+            http_downloader.close()
+        manifest.save(force=True)
+
+
+# Clear the list headers and focus the first row for the arrow-key walk
+def prepare_keyboard_listing():
     # Remove the header elements to avoid blocking the active element
     driver.execute_script(f"""
         var element = document.querySelector('.ms-FocusZone.css-91.ms-DetailsHeader');
@@ -367,16 +1353,18 @@ def process_page():
     time.sleep(0.1)
     ActionChains(driver).send_keys('\ue013').perform()  # Up arrow key
     time.sleep(0.05)
-    read_page_and_create_master_list()
 
 
 # # Main
-try:
-    setup_browser()
-    wait_for_2fa()
-    process_page()
-except Exception as e:
-    logging.error(f"Error during page processing: {e}")
-finally:
-    logging.info("Closing the browser...")
-    driver.quit()
+if __name__ == "__main__":
+    driver = create_driver()
+    try:
+        setup_browser()
+        wait_for_2fa()
+        process_page()
+    except Exception as e:
+        logging.error(f"Error during page processing: {e}")
+    finally:
+        metrics.summarize()
+        logging.info("Closing the browser...")
+        driver.quit()
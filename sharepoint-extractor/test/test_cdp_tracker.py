@@ -0,0 +1,129 @@
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+# The script name is not importable as a module name
+spec = importlib.util.spec_from_file_location(
+    "sharepoint_extractor", os.path.join(os.path.dirname(__file__), "..", "sharepoint-extractor.py"))
+sharepoint_extractor = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sharepoint_extractor)
+
+FRAME_ID = "A1B2C3D4E5F60718293A4B5C6D7E8F90"
+
+
+def perf_log_entry(method, params):
+    """
+    Builds a performance log entry the way chromedriver returns it from get_log("performance"):
+    the DevTools message is JSON-encoded inside the entry's "message" field.
+    """
+    return {"level": "INFO", "timestamp": 1792411200000,
+            "message": json.dumps({"message": {"method": method, "params": params}, "webview": FRAME_ID})}
+
+
+def download_will_begin(guid, name):
+    return perf_log_entry("Page.downloadWillBegin", {"frameId": FRAME_ID, "guid": guid, "suggestedFilename": name,
+                                                     "url": f"https://example.sharepoint.com/download/{name}"})
+
+
+def download_progress(guid, received, total, state="inProgress"):
+    return perf_log_entry("Page.downloadProgress", {"guid": guid, "receivedBytes": received, "totalBytes": total,
+                                                    "state": state})
+
+
+class PerformanceLogDriver:
+    """
+    Stands in for the Chrome driver; each get_log call returns the entries queued since the previous one.
+    """
+    def __init__(self):
+        self.entries = []
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        entries, self.entries = self.entries, []
+        return entries
+
+
+class TestCdpDownloadTracker(unittest.TestCase):
+    def setUp(self):
+        self.download_dir = tempfile.mkdtemp()
+        self.settings = {name: getattr(sharepoint_extractor, name) for name in ("driver", "download_dir", "metrics")}
+        self.driver = sharepoint_extractor.driver = PerformanceLogDriver()
+        sharepoint_extractor.download_dir = self.download_dir
+        sharepoint_extractor.metrics = sharepoint_extractor.DownloadMetrics(os.path.join(self.download_dir, "metrics.jsonl"))
+        self.tracker = sharepoint_extractor.CdpDownloadTracker()
+
+    def tearDown(self):
+        for name, value in self.settings.items():
+            setattr(sharepoint_extractor, name, value)
+        shutil.rmtree(self.download_dir)
+
+    def test_poll_follows_page_download_events(self):
+        self.driver.entries = [
+            perf_log_entry("Page.frameStartedLoading", {"frameId": FRAME_ID}),
+            download_will_begin("guid-1", "Asset 1.zip"),
+            download_progress("guid-1", 0, 2048),
+            download_progress("guid-1", 1024, 2048),
+        ]
+        self.tracker.poll()
+
+        self.assertEqual(self.tracker.events, {
+            "guid-1": {"name": "Asset 1.zip", "index": 0, "received": 1024, "total": 2048, "state": "inProgress"},
+        })
+
+        self.driver.entries = [download_progress("guid-1", 2048, 2048, "completed")]
+        self.tracker.poll()
+
+        self.assertEqual(self.tracker.events["guid-1"]["state"], "completed")
+
+    def test_poll_ignores_browser_events_and_unknown_downloads(self):
+        self.driver.entries = [
+            perf_log_entry("Browser.downloadWillBegin", {"frameId": FRAME_ID, "guid": "guid-1",
+                                                         "suggestedFilename": "Asset 1.zip", "url": ""}),
+            download_progress("guid-2", 1024, 2048),
+        ]
+        self.tracker.poll()
+
+        self.assertEqual(self.tracker.events, {})
+
+    def test_claim_matches_by_name_then_trigger_order(self):
+        first, second = {"name": "Asset 1.zip"}, {"name": "Asset 2.zip"}
+        self.tracker.trigger(first)
+        self.tracker.trigger(second)
+        # The second download is saved under a name the browser chose itself
+        self.driver.entries = [download_will_begin("guid-1", "Asset 1.zip"), download_will_begin("guid-2", "download.zip")]
+        self.tracker.poll()
+
+        self.assertEqual(self.tracker.claim(second, {"Asset 1.zip"}), "guid-2")
+        self.assertEqual(self.tracker.claim(first, set()), "guid-1")
+        self.assertEqual(self.tracker.unclaimed_names(), [])
+
+        self.tracker.forget("guid-1")
+        self.assertNotIn("guid-1", self.tracker.events)
+
+    def test_download_manager_renames_completed_download(self):
+        manifest = sharepoint_extractor.Manifest(os.path.join(self.download_dir, "manifest.json"))
+        download_manager = sharepoint_extractor.DownloadManager(max_in_flight=1, tracker=self.tracker, manifest=manifest)
+        download_manager.submit("Asset 1.zip", lambda: None)
+        download = download_manager.downloads["Asset 1.zip"]
+        self.assertEqual(download["state"], sharepoint_extractor.STARTED)
+
+        self.driver.entries = [download_will_begin("guid-1", "Asset 1.zip"), download_progress("guid-1", 1024, 2048)]
+        download_manager.poll()
+        self.assertEqual((download["guid"], download["size"]), ("guid-1", 1024))
+
+        # allowAndName saves the file under its GUID
+        with open(os.path.join(self.download_dir, "guid-1"), "wb") as downloaded_file:
+            downloaded_file.write(b"\0" * 2048)
+        self.driver.entries = [download_progress("guid-1", 2048, 2048, "completed")]
+        download_manager.poll()
+
+        self.assertEqual(download["state"], sharepoint_extractor.DONE)
+        self.assertTrue(os.path.exists(os.path.join(self.download_dir, "Asset 1.zip")))
+        self.assertEqual(self.tracker.events, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
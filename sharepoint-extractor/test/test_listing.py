@@ -0,0 +1,183 @@
+import importlib.util
+import json
+import os
+import re
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+# The script name is not importable as a module name
+spec = importlib.util.spec_from_file_location(
+    "sharepoint_extractor", os.path.join(os.path.dirname(__file__), "..", "sharepoint-extractor.py"))
+sharepoint_extractor = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sharepoint_extractor)
+
+SITE_PATH = "/sites/VARLab"
+LIBRARY_PATH = "/sites/VARLab/Shared Documents"
+FORM_DIGEST = "0x1234,19 Oct 2026 12:00:00 -0000"
+
+# Folders of the mock library, and the files in each one
+LIBRARY = {
+    LIBRARY_PATH: [f"Root Asset {index}.zip" for index in range(3)],
+    f"{LIBRARY_PATH}/Project A": [f"A Asset {index}.zip" for index in range(5)],
+    f"{LIBRARY_PATH}/Project A/Archive": [f"A Old Asset {index}.zip" for index in range(4)],
+    f"{LIBRARY_PATH}/Project B": [f"B Asset {index}.zip" for index in range(2)],
+    f"{LIBRARY_PATH}/Project B/Textures": [],
+}
+
+
+def get_rows(folder, recursive):
+    """
+    Lists the rows of a folder of the mock library the way RenderListDataAsStream returns them:
+    its direct files and subfolders, or every file and folder below it with Scope='RecursiveAll'.
+    """
+    rows = []
+    for folder_path, file_names in LIBRARY.items():
+        parent_path = folder_path.rsplit("/", 1)[0]
+        below = folder_path.startswith(folder + "/")
+        if below and (recursive or parent_path == folder):
+            rows.append({"FileLeafRef": folder_path.rsplit("/", 1)[1], "FileRef": folder_path, "FSObjType": "1",
+                         "UniqueId": f"{{folder-{len(rows)}}}"})
+        if folder_path == folder or (recursive and below):
+            rows.extend({"FileLeafRef": name, "FileRef": f"{folder_path}/{name}", "FSObjType": "0",
+                         "File_x0020_Size": str(1000 + len(name)), "Modified": "2026-10-19T12:00:00Z",
+                         "UniqueId": f"{{{folder_path}/{name}}}"} for name in file_names)
+    return rows
+
+
+class MockSharePointHandler(BaseHTTPRequestHandler):
+    """
+    Serves the form digest and the RenderListDataAsStream listing of the mock library,
+    paging the rows by the RowLimit of the view with NextHref.
+    """
+    requests_seen = []  # (folder, scope, page offset) of each listing request
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+        if url.path == f"{SITE_PATH}/_api/contextinfo":
+            self.send_json(200, {"FormDigestValue": FORM_DIGEST})
+            return
+        if url.path != f"{SITE_PATH}/_api/web/GetList(@listUrl)/RenderListDataAsStream":
+            self.send_json(404, {"error": "Not found"})
+            return
+        if self.headers.get("X-RequestDigest") != FORM_DIGEST or query.get("@listUrl") != [f"'{LIBRARY_PATH}'"]:
+            self.send_json(403, {"error": "Forbidden"})
+            return
+
+        parameters = body["parameters"]
+        view_xml = parameters["ViewXml"]
+        recursive = "Scope='RecursiveAll'" in view_xml
+        row_limit = int(re.search(r"<RowLimit Paged='TRUE'>(\d+)</RowLimit>", view_xml).group(1))
+        folder = parameters.get("FolderServerRelativeUrl", LIBRARY_PATH)
+        offset = int(query.get("p_ID", ["0"])[0])
+        MockSharePointHandler.requests_seen.append((folder, recursive, offset))
+
+        rows = get_rows(folder, recursive)
+        data = {"Row": rows[offset:offset + row_limit]}
+        if offset + row_limit < len(rows):
+            data["NextHref"] = f"?Paged=TRUE&p_ID={offset + row_limit}&View=00000000-0000-0000-0000-000000000000"
+        self.send_json(200, data)
+
+
+class RecordingDownloadManager:
+    """
+    Stands in for DownloadManager while crawling; the listed files are collected by track_and_download_files.
+    """
+    def poll(self):
+        pass
+
+
+class TestRestListing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockSharePointHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.site_url = f"http://127.0.0.1:{cls.server.server_port}{SITE_PATH}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        MockSharePointHandler.requests_seen = []
+        self.settings = {name: getattr(sharepoint_extractor, name) for name in
+                         ("sharepoint_site_url", "sharepoint_library_path", "listing_page_size", "listing_sessions",
+                          "track_and_download_files")}
+        sharepoint_extractor.sharepoint_site_url = self.site_url
+        sharepoint_extractor.sharepoint_library_path = LIBRARY_PATH
+        sharepoint_extractor.listing_page_size = 3
+        self.session = requests.Session()
+
+    def tearDown(self):
+        self.session.close()
+        for name, value in self.settings.items():
+            setattr(sharepoint_extractor, name, value)
+
+    def test_list_library_files_follows_next_href(self):
+        files = sharepoint_extractor.list_library_files(self.session, self.site_url, LIBRARY_PATH)
+
+        expected = sorted(f"{folder}/{name}" for folder, names in LIBRARY.items() for name in names)
+        self.assertEqual(sorted(file["url"] for file in files), expected)
+        # 14 files and 4 folders in pages of 3 rows
+        self.assertEqual([offset for _, _, offset in MockSharePointHandler.requests_seen], [0, 3, 6, 9, 12, 15])
+
+    def test_list_library_files_returns_listing_fields(self):
+        files = sharepoint_extractor.list_library_files(self.session, self.site_url, LIBRARY_PATH)
+
+        file = next(file for file in files if file["name"] == "B Asset 1.zip")
+        self.assertEqual(file, {
+            "name": "B Asset 1.zip",
+            "url": f"{LIBRARY_PATH}/Project B/B Asset 1.zip",
+            "size": 1000 + len("B Asset 1.zip"),
+            "size_exact": True,
+            "modified": "2026-10-19T12:00:00Z",
+            "id": f"{LIBRARY_PATH}/Project B/B Asset 1.zip",
+        })
+
+    def test_list_library_files_without_recursion_collects_folders(self):
+        folders = []
+        files = sharepoint_extractor.list_library_files(self.session, self.site_url, LIBRARY_PATH,
+                                                        recursive=False, folders=folders)
+
+        self.assertEqual(sorted(file["name"] for file in files), sorted(LIBRARY[LIBRARY_PATH]))
+        self.assertEqual(sorted(folders), [f"{LIBRARY_PATH}/Project A", f"{LIBRARY_PATH}/Project B"])
+
+    def test_crawl_library_folders_lists_nested_folders_once(self):
+        listed = []
+        sharepoint_extractor.track_and_download_files = \
+            lambda files, download_manager, http_downloader=None, seen_elements=None: listed.extend(files)
+        sharepoint_extractor.listing_sessions = 2
+
+        complete = sharepoint_extractor.crawl_library_folders(self.session, RecordingDownloadManager())
+
+        self.assertTrue(complete)
+        expected = sorted(f"{folder}/{name}" for folder, names in LIBRARY.items() for name in names)
+        self.assertEqual(sorted(file["url"] for file in listed), expected)
+        # The root is listed without recursion, each top-level folder with it
+        self.assertEqual(sorted({(folder, recursive) for folder, recursive, _ in MockSharePointHandler.requests_seen}), [
+            (LIBRARY_PATH, False),
+            (f"{LIBRARY_PATH}/Project A", True),
+            (f"{LIBRARY_PATH}/Project B", True),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,41 @@
 import os
+import shutil
 import subprocess
+import signal
+import multiprocessing
 import json
+import asyncio
+import threading
+import time
+import functools
+import itertools
+import contextvars
+import sqlite3
+import argparse
+import aiohttp
 import requests
 import logging
 import io
+import struct
 import zipfile
+import zlib
+import mmap
+import tempfile
+import xml.etree.ElementTree as ET
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import namedtuple, Counter
+from contextlib import contextmanager
 from colorama import Fore, Style
 import cohere
 import re
 from dotenv import load_dotenv
 import base64
+import hashlib
 import enchant
 import nltk
 from nltk.stem import WordNetLemmatizer
+from PIL import Image
 
 ROOT_ASSET_PATH = "A:\\VARLab FinalFinal AMB"  # Root path for assets
 COHERE_API_KEY = "cohere-api-key"  # API key for Cohere
@@ -22,10 +45,54 @@ API_URL = "http://localhost:3000/api/asset"  # Local endpoint for testing
 #API_URL = "https://assetstore.vconestoga.com/api/asset"  # API endpoint for uploading assets
 REFRESH_TOKEN = "aaa.bbb.ccc"  # Refresh token for authentication
 ASSET_TEXTURE_FOLDERS = {'Textures (Compressed)', 'Texture Files'}  # Texture folders to search for image files
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}  # Extensions counted as texture images
 LOG_FILE_BASE_NAME = "upload-automation"  # Base name for log files
 LOG_MODE = logging.INFO  # Logging level (DEBUG or INFO)
-PREVIEW_FORMAT = "webp"  # Set your desired format (e.g., "png", "webp")
+RENDER_PROFILES = {  # Preview capture settings: viewport size, device scale factor, antialiasing, image format and quality (1-100, ignored for png, None for the encoder default)
+    "draft": {"width": 960, "height": 540, "scale": 1, "antialias": False, "format": "webp", "quality": 70},
+    "catalog": {"width": 1280, "height": 720, "scale": 1, "antialias": True, "format": "webp", "quality": 85},
+    "hero": {"width": 1920, "height": 1080, "scale": 2, "antialias": True, "format": "webp", "quality": None},
+}
+RENDER_PROFILE = "hero"  # Render profile for this run ("hero" keeps the original capture settings; "catalog" or "draft" are cheaper for bulk imports)
+PREVIEW_FORMAT = RENDER_PROFILES[RENDER_PROFILE]["format"]  # Preview image format ("png", "jpeg" or "webp"), set by the render profile
 GLOBAL_ASSET_TAGS = ["3d"]  # Tags to be added to all assets (Array of strings)
+GLOBAL_TEXTURE_TAGS = ["2d"]  # Tags to be added to all texture (non-FBX) assets (Array of strings)
+ZIP_STORED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp', '.gif', '.zip', '.7z', '.rar', '.mp3', '.mp4', '.ogg'}  # Already-compressed formats stored without deflating
+ZIP_DEFLATE_LEVEL = 6  # zlib level (1-9) used to deflate FBX, source and other compressible files
+ZIP_WORKERS = os.cpu_count() or 1  # Archive members deflated in parallel ahead of the archive writer
+ZIP_CHUNK_SIZE = 1024 * 1024  # Bytes read (and deflated) at a time per archive member
+ARCHIVE_MODE = False  # Take zipped asset folders (e.g. SharePoint downloads) as-is: read members from the archive and upload the original zip (False = asset folders must be extracted, as before)
+ARCHIVE_PREVIEW_EXTENSIONS = {'.fbx', '.tga', '.dds', '.exr', '.hdr'} | IMAGE_EXTENSIONS  # Archive members extracted for metadata, previews and thumbnails
+UPLOAD_MODE = "api"  # "api" sends the zip through /api/asset, "blob" uploads it straight to blob storage in chunks
+BLOB_CHUNK_SIZE = 8 * 1024 * 1024  # Block size for direct-to-blob uploads (bytes)
+BLOB_UPLOAD_WORKERS = 4  # Number of blocks uploaded in parallel
+BLOB_API_VERSION = "2021-08-06"  # Blob service REST API version (also supported by Azurite)
+UPLOAD_CONCURRENCY = 0  # Uploads in flight at once (0 = blocking uploads, one asset at a time, as before; e.g. 4 to overlap uploads with processing)
+UPLOAD_TIMEOUT_SECONDS = 600  # Timeout for a single asset upload
+PROCESS_WORKERS = 1  # Number of worker processes (1 = single process, 0 = one per CPU core)
+WORKER_BASE_PORT = 4100  # First port allocated to worker preview/API servers (two consecutive ports per worker)
+TRACE_ENABLED = False  # Record per-stage tracing spans and export them as Chrome trace-event JSON (open in Perfetto)
+TRACE_SUMMARY_LIMIT = 10  # Number of slowest assets listed in the end-of-run trace summary
+DUPLICATE_MODE = "off"  # Already-uploaded assets: "off" (upload again, as before), "skip", or "link" (add PROJECT_DESTINATION_NAMES to the existing asset)
+FINGERPRINT_LOOKUP_SERVER = True  # Also look fingerprints up on the asset API when they are not in the local index
+FINGERPRINT_WORKERS = os.cpu_count() or 1  # Threads used to hash asset files in parallel
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024  # Read size when hashing asset files (bytes)
+MEMORY_BUDGET_BYTES = 4 * 1024 * 1024 * 1024  # RAM ceiling for in-flight zips and previews, shared by the workers (0 = unlimited)
+TEXTURE_WORKERS = os.cpu_count() or 1  # Processes generating texture thumbnails (split between the worker processes)
+TEXTURE_BATCH_IMAGES = 256  # Texture images queued across asset folders before a batch is processed
+TEXTURE_CHUNK_SIZE = 16  # Texture images per task sent to the thumbnail processes
+TEXTURE_THUMBNAIL_SIZE = 384  # Longest side of texture thumbnails (pixels)
+CONTACT_SHEET_COLUMNS = 4  # Thumbnails per contact sheet row
+CONTACT_SHEET_MAX_IMAGES = 16  # Thumbnails per contact sheet; larger texture sets get several sheets
+CONTACT_SHEET_BACKGROUND = (32, 32, 32)  # Contact sheet background colour (RGB)
+PREVIEW_SERVER_MODE = "dev"  # "dev" runs the Vite dev server (as before), "bundle" serves the production build of the preview page (rebuilt when its sources change)
+PREVIEW_SERVER_STARTUP_TIMEOUT = 60  # Seconds to wait for the preview servers to pass their health checks
+PREVIEW_SERVER_KEEP_ALIVE = False  # Leave started preview servers running at the end, so the next run attaches to them
+VITE_BIN = os.path.join('node_modules', 'vite', 'bin', 'vite.js')  # Vite CLI, relative to the 3d-preview-generator folder
+DAEMON_POLL_INTERVAL = 2  # Seconds between job queue checks while the daemon is idle
+DAEMON_RESTART_BACKOFF = 5  # Seconds before retrying a failed preview server restart (doubled after each failure)
+DAEMON_RESTART_BACKOFF_MAX = 300  # Upper bound of the preview server restart backoff (seconds)
+JOB_STATUS_LIMIT = 20  # Most recent jobs listed by the status command
 
 
 def set_working_directory_and_load_env(env_dir='./3d-preview-generator/.env'):
@@ -80,12 +147,247 @@ class ColoredFormatter(logging.Formatter):
         return formatted_message
 
 
-def setup_logger():
+AssetFile = namedtuple('AssetFile', ['path', 'rel_path', 'name', 'extension', 'size', 'in_texture_folder'])
+
+
+class AssetInventory:
+    """
+    Listing of an asset folder built from a single os.scandir walk. Every upload stage reads
+    the folder contents from the inventory, so each asset folder is listed exactly once.
+    """
+    def __init__(self, asset_folder_path):
+        self.root = os.path.abspath(asset_folder_path)
+        self.files = []
+        self._scan(self.root, "", self._is_texture_folder(self.root))
+
+    @staticmethod
+    def _is_texture_folder(dir_path):
+        return any(dir_path.endswith(target_folder) for target_folder in ASSET_TEXTURE_FOLDERS)
+
+    def _scan(self, dir_path, rel_dir, in_texture_folder):
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    # Everything nested below a texture folder belongs to it
+                    self._scan(entry.path, rel_path, in_texture_folder or self._is_texture_folder(entry.name))
+                elif entry.is_file():
+                    self.files.append(AssetFile(
+                        path=entry.path,
+                        rel_path=rel_path,
+                        name=entry.name,
+                        extension=os.path.splitext(entry.name)[1].lower(),
+                        size=entry.stat().st_size,
+                        in_texture_folder=in_texture_folder
+                    ))
+
+    @property
+    def fbx_files(self):
+        return [asset_file for asset_file in self.files if asset_file.extension == '.fbx']
+
+    @property
+    def texture_images(self):
+        return [asset_file for asset_file in self.files
+                if asset_file.in_texture_folder and asset_file.extension in IMAGE_EXTENSIONS]
+
+    @property
+    def total_size(self):
+        return sum(asset_file.size for asset_file in self.files)
+
+    def open_file(self, asset_file):
+        return open(asset_file.path, 'rb')
+
+    def extract_preview_members(self):
+        pass  # Folder files are already on disk
+
+    def close(self):
+        pass
+
+
+class ArchiveInventory(AssetInventory):
+    """
+    Listing of a zipped asset folder read from the archive's central directory, without extracting it.
+    Member paths point into a scratch folder, where only the members needed for metadata, previews and
+    thumbnails (ARCHIVE_PREVIEW_EXTENSIONS) are extracted, on demand. A single top-level folder named
+    after the archive is treated as the asset folder, so an archive and its extracted folder list the
+    same relative paths (and get the same fingerprint).
+    """
+    def __init__(self, archive_path):
+        self.archive_path = os.path.abspath(archive_path)
+        self.root = tempfile.mkdtemp(prefix="upload-automation-")
+        self.files = []
+        self._members = {}
+        self._archive = zipfile.ZipFile(self.archive_path)
+        try:
+            self._scan_archive()
+        except Exception:
+            self.close()
+            raise
+
+    def _scan_archive(self):
+        asset_name = os.path.splitext(os.path.basename(self.archive_path))[0]
+        members = [(info.filename.replace('\\', '/'), info) for info in self._archive.infolist() if not info.is_dir()]
+        prefix = f"{asset_name}/"
+        if members and all(name.lower().startswith(prefix.lower()) for name, _ in members):
+            members = [(name[len(prefix):], info) for name, info in members]
+
+        for name, info in members:
+            parts = name.split('/')
+            if name.startswith('/') or ':' in parts[0] or any(part in ('', '.', '..') for part in parts):
+                logging.warning(f"Skipping unsafe archive member '{info.filename}' in '{self.archive_path}'")
+                continue
+            rel_path = os.path.join(*parts)
+            asset_file = AssetFile(
+                path=os.path.join(self.root, rel_path),
+                rel_path=rel_path,
+                name=parts[-1],
+                extension=os.path.splitext(parts[-1])[1].lower(),
+                size=info.file_size,
+                # Everything nested below a texture folder belongs to it
+                in_texture_folder=any(self._is_texture_folder(folder) for folder in [asset_name] + parts[:-1])
+            )
+            self.files.append(asset_file)
+            self._members[asset_file.path] = info
+
+    def open_file(self, asset_file):
+        return self._archive.open(self._members[asset_file.path])
+
+    def extract_preview_members(self):
+        """
+        Extracts the members needed for metadata, previews and thumbnails into the scratch folder.
+        """
+        for asset_file in self.files:
+            if asset_file.extension not in ARCHIVE_PREVIEW_EXTENSIONS or os.path.exists(asset_file.path):
+                continue
+            os.makedirs(os.path.dirname(asset_file.path), exist_ok=True)
+            with self.open_file(asset_file) as source, open(asset_file.path, 'wb') as target:
+                shutil.copyfileobj(source, target, FINGERPRINT_CHUNK_SIZE)
+
+    def map_archive(self):
+        """
+        Memory-maps the original archive for upload, so its bytes are paged in from disk rather than read into RAM.
+
+        Returns:
+            mmap.mmap: A read-only map of the archive file.
+        """
+        with open(self.archive_path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        """
+        Closes the archive and removes the scratch folder. The archive can still be mapped for upload.
+        """
+        self._archive.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def is_asset_archive(asset_path):
+    """
+    Checks if an entry of an asset parent folder is a zipped asset folder handled by ARCHIVE_MODE.
+    """
+    return ARCHIVE_MODE and asset_path.lower().endswith('.zip') and os.path.isfile(asset_path)
+
+
+def get_asset_name(asset_path):
+    """
+    Returns the asset name of an asset folder or zipped asset folder (the archive name without '.zip').
+    """
+    asset_name = os.path.basename(asset_path)
+    return os.path.splitext(asset_name)[0] if is_asset_archive(asset_path) else asset_name
+
+
+def get_zip_buffer(zip_file):
+    """
+    Returns a zero-copy view of an archive to upload, built in memory (BytesIO) or memory-mapped (mmap).
+    """
+    return zip_file.getbuffer() if isinstance(zip_file, io.BytesIO) else memoryview(zip_file)
+
+
+def close_zip_file(zip_file):
+    """
+    Closes an uploaded archive. A memory map still viewed by a finished request is unmapped when the view is freed.
+    """
+    try:
+        zip_file.close()
+    except BufferError:
+        pass
+
+
+class MemoryBudget:
+    """
+    Byte-based admission control for in-memory zips and previews. A stage reserves its estimated
+    memory before it starts and blocks while the reservation would exceed the limit, so asset
+    processing backs off until in-flight uploads finish and release their memory.
+    """
+    def __init__(self, limit=MEMORY_BUDGET_BYTES):
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def reserve(self, size):
+        """
+        Reserves memory, waiting until it fits in the budget. A reservation larger than the whole
+        budget is capped to it, so an oversized asset runs on its own instead of waiting forever.
+
+        Args:
+            size (int): The estimated number of bytes.
+
+        Returns:
+            int: The number of bytes reserved, to be passed to release().
+        """
+        if not self.limit:
+            return 0
+        size = min(size, self.limit)
+        with self._condition:
+            if self.used + size > self.limit:
+                logging.info(f"Memory budget reached ({self.used / 2**20:.0f} of {self.limit / 2**20:.0f} MiB in use). "
+                             f"Waiting for in-flight uploads...")
+                with trace_span("wait_for_memory_budget"):
+                    self._condition.wait_for(lambda: self.used + size <= self.limit)
+            self.used += size
+        return size
+
+    def release(self, size):
+        """
+        Returns reserved memory to the budget and wakes up the stages waiting for it.
+
+        Args:
+            size (int): The number of bytes to release.
+        """
+        if not size:
+            return
+        with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+memory_budget = MemoryBudget()
+
+
+def get_log_file_path(suffix="", worker_id=None, extension="log"):
+    """
+    Builds the path of a log file in the root asset folder.
+
+    Args:
+        suffix (str): Suffix appended to the base log name (e.g., '-asset-ledger').
+        worker_id (int, optional): Worker index, for the per-worker files written in parallel mode.
+        extension (str): File extension of the log file.
+
+    Returns:
+        str: The path of the log file.
+    """
+    worker_suffix = f".worker-{worker_id}" if worker_id is not None else ""
+    return os.path.join(ROOT_ASSET_PATH, f".{LOG_FILE_BASE_NAME}{suffix}{worker_suffix}.{extension}")
+
+
+def setup_logger(worker_id=None):
     """
     Sets up logging configurations for the script, including file and console handlers with appropriate formatting.
+
+    Args:
+        worker_id (int, optional): Worker index. Worker processes write to their own log and ledger files.
     """
-    log_file_name = f".{LOG_FILE_BASE_NAME}.log"
-    log_file_path = os.path.join(ROOT_ASSET_PATH, log_file_name)
+    log_file_path = get_log_file_path(worker_id=worker_id)
 
     # Clear existing handlers to avoid duplicates
     logger = logging.getLogger()
@@ -110,8 +412,7 @@ def setup_logger():
     logger.addHandler(console_handler)
 
     # Logger for successful asset uploads
-    success_log_file_name = f".{LOG_FILE_BASE_NAME}-asset-ledger.log"
-    success_log_file_path = os.path.join(ROOT_ASSET_PATH, success_log_file_name)
+    success_log_file_path = get_log_file_path("-asset-ledger", worker_id)
 
     success_file_handler = logging.FileHandler(success_log_file_path, mode='a')
     success_file_handler.setLevel(LOG_MODE)
@@ -125,8 +426,7 @@ def setup_logger():
     success_logger.addHandler(success_file_handler)
 
     # Logger for errored asset uploads
-    error_log_file_name = f".{LOG_FILE_BASE_NAME}-asset-ledger-error.log"
-    error_log_file_path = os.path.join(ROOT_ASSET_PATH, error_log_file_name)
+    error_log_file_path = get_log_file_path("-asset-ledger-error", worker_id)
 
     error_file_handler = logging.FileHandler(error_log_file_path, mode='a')
     error_file_handler.setLevel(LOG_MODE)
@@ -139,6 +439,187 @@ def setup_logger():
     error_logger.setLevel(LOG_MODE)
     error_logger.addHandler(error_file_handler)
 
+    # Logger for duplicate assets that could not be linked to their destination projects
+    link_error_log_file_path = get_log_file_path("-asset-ledger-link-error", worker_id)
+
+    link_error_file_handler = logging.FileHandler(link_error_log_file_path, mode='a')
+    link_error_file_handler.setLevel(LOG_MODE)
+    link_error_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+
+    link_error_logger = logging.getLogger('link_errored_assets_logger')
+    if link_error_logger.hasHandlers():
+        link_error_logger.handlers.clear()
+    link_error_logger.setLevel(LOG_MODE)
+    link_error_logger.addHandler(link_error_file_handler)
+
+
+_trace_events = []  # Chrome trace events recorded by this process
+_trace_lock = threading.Lock()
+_trace_tags = contextvars.ContextVar('trace_tags', default={})  # Asset/project tags of the enclosing span
+_trace_async_ids = itertools.count(1)
+
+
+def get_trace_timestamp():
+    """
+    Returns the current wall-clock time in microseconds, so spans from worker processes line up when merged.
+    """
+    return time.time_ns() // 1000
+
+
+def record_trace_event(event):
+    """
+    Adds a Chrome trace event to the events recorded by this process.
+    """
+    if not TRACE_ENABLED:
+        return
+    event.setdefault("pid", os.getpid())
+    event.setdefault("tid", threading.get_native_id())
+    with _trace_lock:
+        _trace_events.append(event)
+
+
+@contextmanager
+def trace_span(name, **tags):
+    """
+    Times the enclosed block as a tracing span, tagged with the asset and project of the enclosing spans.
+
+    Args:
+        name (str): The stage name shown in the trace.
+        **tags: Tags for this span. They also apply to every span nested inside it.
+    """
+    token = _trace_tags.set({**_trace_tags.get(), **tags})
+    start = get_trace_timestamp()
+    try:
+        yield
+    finally:
+        record_trace_event({"name": name, "cat": "stage", "ph": "X", "ts": start,
+                            "dur": get_trace_timestamp() - start, "args": _trace_tags.get()})
+        _trace_tags.reset(token)
+
+
+def traced(function):
+    """
+    Decorator that records every call of a stage function as a tracing span named after the function.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with trace_span(function.__name__):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def record_async_trace_span(name, start, end, tags):
+    """
+    Records a span that overlaps other spans on the same thread (e.g. concurrent uploads)
+    as a pair of async trace events, which Perfetto draws on their own track.
+
+    Args:
+        name (str): The stage name shown in the trace.
+        start (int): Start timestamp in microseconds.
+        end (int): End timestamp in microseconds.
+        tags (dict): Tags of the span.
+    """
+    span_id = next(_trace_async_ids)
+    record_trace_event({"name": name, "cat": "upload", "ph": "b", "id": span_id, "ts": start, "args": tags})
+    record_trace_event({"name": name, "cat": "upload", "ph": "e", "id": span_id, "ts": end})
+
+
+def write_trace_file(worker_id=None, job_id=None):
+    """
+    Writes the trace events recorded by this process to a Chrome trace-event JSON file.
+
+    Args:
+        worker_id (int, optional): Worker index. Worker processes write to their own trace file.
+        job_id (int, optional): Daemon job the events belong to. The job gets its own trace file and
+              the written events are cleared, so a long-running daemon does not keep every event in memory.
+
+    Returns:
+        list: The trace events written.
+    """
+    if not TRACE_ENABLED:
+        return []
+    with _trace_lock:
+        events = list(_trace_events)
+        if job_id is not None:
+            _trace_events.clear()
+    events.append({"name": "process_name", "ph": "M", "pid": os.getpid(),
+                   "args": {"name": f"upload-worker-{worker_id}" if worker_id is not None else "upload-automation"}})
+    trace_file_path = get_log_file_path("-trace" if job_id is None else f"-trace-job-{job_id}", worker_id, "json")
+    try:
+        with open(trace_file_path, 'w', encoding='utf-8') as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+        logging.info(f"Trace written to {trace_file_path}")
+    except Exception as e:
+        logging.error(f"Error writing trace file '{trace_file_path}': {e}")
+    return events
+
+
+def merge_worker_traces(worker_count):
+    """
+    Merges the trace files written by each worker into the main trace file and removes them.
+    Each worker keeps its own pid, so it shows up as a separate process in the trace viewer.
+
+    Args:
+        worker_count (int): The number of workers that ran.
+
+    Returns:
+        list: The merged trace events.
+    """
+    events = []
+    for worker_id in range(worker_count):
+        worker_trace_path = get_log_file_path("-trace", worker_id, "json")
+        if not os.path.exists(worker_trace_path):
+            continue
+        try:
+            with open(worker_trace_path, 'r', encoding='utf-8') as worker_trace:
+                events.extend(json.load(worker_trace)["traceEvents"])
+            os.remove(worker_trace_path)
+        except Exception as e:
+            logging.error(f"Error merging trace '{worker_trace_path}': {e}")
+
+    with _trace_lock:
+        _trace_events.extend(events)
+    return write_trace_file()
+
+
+def summarize_trace(events):
+    """
+    Logs the total and slowest duration of each stage and the slowest assets of the run.
+    An asset's time is its processing span plus its upload.
+
+    Args:
+        events (list): The Chrome trace events of the run.
+    """
+    spans = []
+    async_starts = {}
+    for event in events:
+        if event["ph"] == "X":
+            spans.append((event["name"], event["dur"], event.get("args", {})))
+        elif event["ph"] == "b":
+            async_starts[(event["pid"], event["id"])] = event
+        elif event["ph"] == "e" and (event["pid"], event["id"]) in async_starts:
+            start_event = async_starts.pop((event["pid"], event["id"]))
+            spans.append((start_event["name"], event["ts"] - start_event["ts"], start_event.get("args", {})))
+    if not spans:
+        return
+
+    stages = {}
+    assets = {}
+    for name, duration, tags in spans:
+        stages.setdefault(name, []).append(duration)
+        if name in ("process_asset_folder", "upload") and "asset" in tags:
+            asset_key = f"{tags.get('project', '')}/{tags['asset']}"
+            assets[asset_key] = assets.get(asset_key, 0) + duration
+
+    lines = [f"{'Stage':<45} {'Count':>6} {'Total (s)':>10} {'Mean (s)':>9} {'Max (s)':>8}"]
+    for name, durations in sorted(stages.items(), key=lambda item: sum(item[1]), reverse=True):
+        lines.append(f"{name:<45} {len(durations):>6} {sum(durations) / 1e6:>10.2f} "
+                     f"{sum(durations) / len(durations) / 1e6:>9.2f} {max(durations) / 1e6:>8.2f}")
+    lines.append("Slowest assets:")
+    for asset_key, duration in sorted(assets.items(), key=lambda item: item[1], reverse=True)[:TRACE_SUMMARY_LIMIT]:
+        lines.append(f"{duration / 1e6:>8.2f}s  {asset_key}")
+    logging.info("Trace summary:\n" + "\n".join(lines))
+
 
 def install_npm_dependencies(subdirectory):
     """
@@ -187,6 +668,7 @@ def install_npm_dependencies(subdirectory):
             logging.error(f"An error occurred during npm install: {e}")
 
 
+@traced
 def generate_description(filename, project_name, metadata):
     """
     Generates a detailed yet concise description of the asset using Cohere's language model.
@@ -236,10 +718,10 @@ def generate_description(filename, project_name, metadata):
         return response.generations[0].text.strip()
     except Exception as e:
         logging.error(f"Error generating description for {filename}: {e}")
-        exit(1)
-        return None
+        raise
 
 
+@traced
 def get_fbx_metadata(fbx_file_path):
     """
     Retrieves metadata from an FBX file using an external Node.js script.
@@ -272,31 +754,18 @@ def get_fbx_metadata(fbx_file_path):
         return None
 
 
-def count_image_files_in_texture_folders(asset_folder_path):
+def count_image_files_in_texture_folders(inventory):
     """
     Counts unique image files in specified texture folders within the asset folder.
 
     Args:
-        asset_folder_path (str): The path to the asset folder.
+        inventory (AssetInventory): The inventory of the asset folder.
 
     Returns:
         int: The total number of unique image files.
     """
-    unique_files = set()  # To store unique image file names
-    target_folders = ASSET_TEXTURE_FOLDERS
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}
-
-    for dirpath, dirnames, filenames in os.walk(asset_folder_path):
-        # Check if the directory path ends with any of the target folders
-        if any(dirpath.endswith(target_folder) for target_folder in target_folders):
-            # Recursively go through the directory and all nested directories
-            for subdirpath, subdirnames, subfilenames in os.walk(dirpath):
-                for filename in subfilenames:
-                    # Check if the file has a valid image extension
-                    if os.path.splitext(filename)[1].lower() in image_extensions:
-                        # Add the file to the set (this ensures uniqueness)
-                        unique_files.add(filename)
-
+    # Count file names once, even when the same image is stored in several texture folders
+    unique_files = {asset_file.name for asset_file in inventory.texture_images}
     return len(unique_files)
 
 
@@ -326,6 +795,51 @@ def clean_asset_name(asset_name):
         return asset_name
 
 
+def build_asset_form_data(main_file, asset_metadata, model_metadata):
+    """
+    Builds the form fields describing an asset for the asset API.
+
+    Args:
+        main_file (dict): Contains 'filename' of the asset.
+        asset_metadata (dict): Metadata for the asset.
+        model_metadata (dict): Model-specific metadata, or None for texture assets.
+
+    Returns:
+        dict: The form fields.
+    """
+    form_data = {
+        "name": clean_asset_name(main_file['filename']),
+        "description": asset_metadata['description'],
+        "projects": json.dumps(asset_metadata['projects']),
+        "categories": json.dumps(asset_metadata['categories']),
+        "tags": json.dumps(asset_metadata['tags'])
+    }
+    if model_metadata is not None:
+        form_data["model"] = json.dumps(model_metadata)
+    if asset_metadata.get('texture'):
+        form_data["texture"] = json.dumps(asset_metadata['texture'])
+    if asset_metadata.get('fingerprint'):
+        form_data["fingerprint"] = asset_metadata['fingerprint']
+    return form_data
+
+
+def build_preview_files(image_bytes_list):
+    """
+    Prepares the list of preview images under the same key "previewImages".
+
+    Args:
+        image_bytes_list (list): BytesIO preview images, each with a 'name'.
+
+    Returns:
+        list: Multipart file tuples for the preview images.
+    """
+    return [
+        ("previewImages", (image.name, image.getvalue(), f'image/{PREVIEW_FORMAT}'))
+        for image in image_bytes_list
+    ]
+
+
+@traced
 def send_fbx_api_request(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list):
     """
     Sends an API request to upload an FBX asset file.
@@ -345,23 +859,10 @@ def send_fbx_api_request(refresh_token, main_file, asset_metadata, model_metadat
         ("mainFile", (f"{main_file['filename']}.zip", main_file['zip'], 'application/zip'))
     ]
 
-    # Prepare the list of preview images under the same key "previewImages"
-    preview_images = [
-        ("previewImages", (image.name, image.getvalue(), f'image/${PREVIEW_FORMAT}'))
-        for image in image_bytes_list
-    ]
-
     # Add the preview images to the files list
-    files.extend(preview_images)
+    files.extend(build_preview_files(image_bytes_list))
 
-    form_data = {
-        "name": clean_asset_name(main_file['filename']),
-        "description": asset_metadata['description'],
-        "projects": json.dumps(asset_metadata['projects']),
-        "categories": json.dumps(asset_metadata['categories']),
-        "tags": json.dumps(asset_metadata['tags']),
-        "model": json.dumps(model_metadata)
-    }
+    form_data = build_asset_form_data(main_file, asset_metadata, model_metadata)
 
     try:
         logging.info(f"Uploading asset file for {form_data['name']}...")
@@ -382,169 +883,866 @@ def send_fbx_api_request(refresh_token, main_file, asset_metadata, model_metadat
         return False
 
 
-# def send_texture_api_request(metadata_list):
+def get_blob_upload_sas(refresh_token, blob_name, asset_name):
+    """
+    Requests a create-only SAS token for a new asset blob from the asset API. The server refuses
+    (409) when an asset with the same name or file, or the blob itself, already exists, so an
+    upload never replaces a live asset. Against a local server configured with an Azurite
+    connection string, the returned blob URL points at Azurite.
+
+    Args:
+        refresh_token (str): The refresh token for authentication.
+        blob_name (str): Name of the blob (the asset file name).
+        asset_name (str): Name of the asset.
+
+    Returns:
+        tuple: (blob_url, sas_token)
+    """
+    response = requests.get(f"{API_URL}/upload-sas-token", params={'fileName': blob_name, 'name': asset_name},
+                            cookies={'refreshToken': refresh_token})
+    response_json = response.json()
+    if response.status_code != 200:
+        raise Exception(f"Failed to get an upload SAS token: {response.status_code}, {response_json.get('message')}")
+    return response_json['blobUrl'], response_json['message']
 
 
-def check_fbx_exists(directory):
+def get_blob_block_id(index, chunk):
     """
-    Checks if any .fbx files exist in the given directory.
+    Builds a deterministic block id from the block index and content, so an interrupted upload
+    can be resumed by skipping blocks that are already staged with the same content.
 
     Args:
-        directory (str): The path of the directory to search for .fbx files.
+        index (int): Position of the block in the blob.
+        chunk (bytes): The block content.
 
     Returns:
-        bool: True if at least one .fbx file is found, False otherwise.
+        str: The base64 block id (all ids of a blob have the same length).
     """
-    try:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith('.fbx'):
-                    logging.debug(f".fbx file found: {os.path.join(root, file)}")
-                    return True
-        logging.debug(f"No .fbx files found in '{directory}'")
-        return False
-    except Exception as e:
-        logging.error(f"Error while searching for .fbx files: {e}")
-        return False
+    digest = hashlib.md5(chunk).hexdigest()[:16]
+    return base64.b64encode(f"{index:06d}-{digest}".encode('ascii')).decode('ascii')
 
 
-def process_fbx_files_in_asset_folder(asset_folder_path):
+def get_staged_blob_blocks(blob_url, sas_token):
     """
-    Processes all FBX files in the given asset folder and collects their metadata.
+    Retrieves the uncommitted blocks already staged for a blob.
 
     Args:
-        asset_folder_path (str): The path to the asset folder to process.
+        blob_url (str): The URL of the blob.
+        sas_token (str): SAS token with read permission.
 
     Returns:
-        list: A list of metadata dictionaries for each FBX file found.
+        dict: Block id -> block size.
     """
-    metadata_list = []
-    preview_list = []
+    response = requests.get(f"{blob_url}?comp=blocklist&blocklisttype=uncommitted&{sas_token}",
+                            headers={'x-ms-version': BLOB_API_VERSION})
+    if response.status_code == 404:
+        return {}  # Nothing staged yet
+    response.raise_for_status()
 
-    # Walk through the asset folder to find and process FBX files
-    for root, dirs, files in os.walk(asset_folder_path):
-        for file_name in files:
-            if file_name.lower().endswith('.fbx'):
-                fbx_file_path = os.path.join(root, file_name)
-                logging.info(f"Found FBX file: {fbx_file_path}")
+    staged_blocks = {}
+    for block in ET.fromstring(response.content).iter('Block'):
+        staged_blocks[block.findtext('Name')] = int(block.findtext('Size'))
+    return staged_blocks
 
-                try:
-                    # Retrieve FBX metadata using the external script
-                    metadata = get_fbx_metadata(fbx_file_path)
-                    if metadata:
-                        metadata_list.append(metadata)
-                        logging.info(f"Successfully processed metadata for {fbx_file_path}")
-
-                        try:
-                            change_preview_gen_filename(file_name)
-                            screenshot_json = run_make_preview_and_get_encoded_screenshot()
-                            if screenshot_json:
-                                preview_list.append({'file_name': file_name.replace('.fbx', f'.{PREVIEW_FORMAT}'),
-                                                     'base64': screenshot_json["screenshotBase64"]})
-
-                        except Exception as e:
-                            logging.error(f"Error forwarding filename to the Express server: {e}")
-                            raise Exception(f"Error forwarding filename to the Express server: {e}")
-                    else:
-                        logging.error(f"Failed to retrieve metadata for {fbx_file_path}")
-                        raise Exception(f"Failed to retrieve metadata for {fbx_file_path}")
-                except Exception as e:
-                    logging.error(f"This fbx is corrupted!! {e}")
-                    raise Exception(f"This fbx is corrupted!! {e}")
 
-    return metadata_list, preview_list
+def put_blob_block(blob_url, sas_token, block_id, chunk, retries=3):
+    """
+    Stages a single block of a block blob, retrying transient failures.
+
+    Args:
+        blob_url (str): The URL of the blob.
+        sas_token (str): SAS token with write permission.
+        block_id (str): The base64 block id.
+        chunk (bytes): The block content.
+        retries (int): Number of attempts before giving up.
+    """
+    headers = {
+        'x-ms-version': BLOB_API_VERSION,
+        'Content-MD5': base64.b64encode(hashlib.md5(chunk).digest()).decode('ascii')
+    }
+    for attempt in range(1, retries + 1):
+        try:
+            response = requests.put(f"{blob_url}?comp=block&blockid={quote(block_id, safe='')}&{sas_token}",
+                                    data=chunk, headers=headers)
+            response.raise_for_status()
+            return
+        except requests.RequestException as e:
+            if attempt == retries:
+                raise
+            logging.warning(f"Retrying block {block_id} ({attempt}/{retries}): {e}")
 
 
-def aggregate_metadata(metadata_list):
+def commit_blob_block_list(blob_url, sas_token, block_ids, content_type='application/zip'):
     """
-    Aggregates the metadata fields from a list of FBX file metadata.
+    Commits the staged blocks, in order, as the content of the blob.
 
     Args:
-        metadata_list (list): A list of metadata dictionaries to aggregate.
-
-    Returns:
-        dict: A dictionary with the aggregated metadata.
+        blob_url (str): The URL of the blob.
+        sas_token (str): SAS token with write permission.
+        block_ids (list): The ordered base64 block ids.
+        content_type (str): Content type stored on the blob.
     """
-    aggregated_data = {
-        'triCount': 0,
-        'vertices': 0,
-        'edges': 0,
-        'lodCount': 0,
-        'polygons': 0,
-        'rigType': "NONE",
-        'animationCount': 0,
-        'textureCount': 0
+    body = '<?xml version="1.0" encoding="utf-8"?><BlockList>'
+    body += ''.join(f'<Latest>{block_id}</Latest>' for block_id in block_ids)
+    body += '</BlockList>'
+    headers = {
+        'x-ms-version': BLOB_API_VERSION,
+        'x-ms-blob-content-type': content_type,
+        'x-ms-access-tier': 'Cool',  # Same tier as assets uploaded through the API
+        'Content-Type': 'application/xml'
     }
+    response = requests.put(f"{blob_url}?comp=blocklist&{sas_token}", data=body.encode('utf-8'), headers=headers)
+    response.raise_for_status()
 
-    for metadata in metadata_list:
-        aggregated_data['triCount'] += metadata['model'].get('triCount', 0)
-        aggregated_data['vertices'] += metadata['model'].get('vertices', 0)
-        aggregated_data['edges'] += metadata['model'].get('edges', 0)
-        aggregated_data['lodCount'] += metadata['model'].get('lodCount', 0)
-        aggregated_data['polygons'] += metadata['model'].get('polygons', 0)
-        aggregated_data['rigType'] = metadata['model'].get('rigType', "NONE")
-        aggregated_data['animationCount'] += metadata['model'].get('animationCount', 0)
 
-    return aggregated_data
+def upload_zip_to_blob(refresh_token, blob_name, zip_file, asset_name):
+    """
+    Uploads an archive straight to the assets container as a new block blob, staging BLOB_CHUNK_SIZE
+    blocks in parallel. Blocks already staged by a previous, interrupted attempt are skipped.
+
+    Args:
+        refresh_token (str): The refresh token for authentication.
+        blob_name (str): Name of the blob (the asset file name).
+        zip_file (BytesIO or mmap.mmap): The archive to upload.
+        asset_name (str): Name of the asset, checked for conflicts by the server.
+    """
+    blob_url, sas_token = get_blob_upload_sas(refresh_token, blob_name, asset_name)
+
+    data = get_zip_buffer(zip_file)
+    try:
+        chunks = [data[offset:offset + BLOB_CHUNK_SIZE] for offset in range(0, len(data), BLOB_CHUNK_SIZE)]
+        block_ids = [get_blob_block_id(index, chunk) for index, chunk in enumerate(chunks)]
+
+        staged_blocks = get_staged_blob_blocks(blob_url, sas_token)
+        pending = [
+            (block_id, chunk) for block_id, chunk in zip(block_ids, chunks)
+            if staged_blocks.get(block_id) != len(chunk)
+        ]
+        logging.info(f"Uploading {blob_name} to blob storage: {len(pending)} of {len(chunks)} blocks to stage...")
+
+        with ThreadPoolExecutor(max_workers=BLOB_UPLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(put_blob_block, blob_url, sas_token, block_id, chunk.tobytes())
+                for block_id, chunk in pending
+            ]
+            for future in futures:
+                future.result()
+
+        commit_blob_block_list(blob_url, sas_token, block_ids)
+    finally:
+        data.release()
 
 
-def zip_folder_in_memory(folder_path):
+@traced
+def send_fbx_blob_request(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list):
     """
-    Creates a zip archive of the given folder in memory.
+    Uploads an FBX asset file straight to blob storage in chunks, then registers the asset
+    metadata and preview images with a lightweight API call.
 
     Args:
-        folder_path (str): The path to the folder to zip.
+        refresh_token (str): The refresh token for authentication.
+        main_file (dict): Contains 'filename' and 'zip' of the asset.
+        asset_metadata (dict): Metadata for the asset.
+        model_metadata (dict): Model-specific metadata.
 
     Returns:
-        BytesIO: The in-memory zip archive.
+        bool: True if the upload was successful, False otherwise.
     """
+    file_name = f"{main_file['filename']}.zip"
+    form_data = build_asset_form_data(main_file, asset_metadata, model_metadata)
+    form_data['fileName'] = file_name
+
     try:
-        logging.info(f"Zipping folder: {folder_path}")
-        memory_file = io.BytesIO()
-        with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    zipf.write(file_path, os.path.relpath(file_path, folder_path))
-        memory_file.seek(0)
-        logging.info(f"Successfully zipped folder: {folder_path}")
-        return memory_file
+        logging.info(f"Uploading asset file for {form_data['name']} to blob storage...")
+        upload_zip_to_blob(refresh_token, file_name, main_file['zip'], form_data['name'])
+
+        response = requests.post(f"{API_URL}/register", files=build_preview_files(image_bytes_list),
+                                 data=form_data, cookies={'refreshToken': refresh_token})
+        response_json = response.json()
+
+        if response.status_code == 200 and response_json.get('success'):
+            logging.info("Asset file uploaded and registered successfully!")
+            return True
+        raise Exception(f"Failed to register asset file: {response.status_code}, {response_json.get('message')}")
+
     except Exception as e:
-        logging.error(f"Error zipping folder: {e}")
-        return None
+        logging.error(f"Error during blob upload: {e}")
+        return False
 
 
-def change_preview_gen_directory(new_directory):
+def send_asset_upload_request(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list):
     """
-    Makes a POST request to change the root directory on the Express server.
+    Uploads an asset using the configured UPLOAD_MODE.
 
-    :param api_url: The URL for the API (e.g., 'http://localhost:8000/set-directory')
-    :param new_directory: The new directory path to set as root
+    Returns:
+        bool: True if the upload was successful, False otherwise.
     """
-    try:
-        # Prepare the request data
-        data = {
-            'directoryPath': new_directory
-        }
+    if UPLOAD_MODE == "blob":
+        return send_fbx_blob_request(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list)
+    return send_fbx_api_request(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list)
 
-        # Make the POST request to change the directory
-        response = requests.post(f"http://localhost:{os.getenv('VITE_SERVER_PORT')}/set-directory", json=data)
 
-        # Log the response
-        if response.status_code == 200:
-            logging.info(f"Directory changed successfully: {response.text}")
-        else:
-            logging.info(f"Failed to change directory. Status Code: {response.status_code} | Response: {response.text}")
+class AsyncAssetUploader:
+    """
+    Uploads assets on an asyncio event loop running in a background thread, with at most
+    UPLOAD_CONCURRENCY uploads in flight. submit() returns as soon as the upload is scheduled
+    (blocking only while the concurrency limit is reached), and each result is written to the
+    success or error ledger as soon as that upload finishes.
+    """
+    def __init__(self, concurrency=UPLOAD_CONCURRENCY, timeout=UPLOAD_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._futures = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="asset-uploader", daemon=True)
+        self._thread.start()
+        self._session = asyncio.run_coroutine_threadsafe(self._create_session(), self._loop).result()
+
+    async def _create_session(self):
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def _post_asset(self, refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list):
+        form = aiohttp.FormData()
+        # Send a view of the archive buffer rather than a copy, which the memory budget does not account for
+        form.add_field("mainFile", get_zip_buffer(main_file['zip']), filename=f"{main_file['filename']}.zip",
+                       content_type='application/zip')
+        for field_name, (file_name, content, content_type) in build_preview_files(image_bytes_list):
+            form.add_field(field_name, content, filename=file_name, content_type=content_type)
+        for field_name, value in build_asset_form_data(main_file, asset_metadata, model_metadata).items():
+            form.add_field(field_name, value)
+
+        logging.info(f"Uploading asset file for {clean_asset_name(main_file['filename'])}...")
+        async with self._session.post(API_URL, data=form, cookies={'refreshToken': refresh_token}) as response:
+            response_json = await response.json(content_type=None)
+            if response.status == 200 and "error" not in response_json:
+                logging.info("Asset file uploaded successfully!")
+                return
+            raise Exception(f"Failed to upload asset file: {response.status}, {response_json.get('error', response_json.get('message'))}")
 
-    except requests.RequestException as e:
-        logging.info(f"Error occurred during the request: {e}")    
+    async def _upload(self, refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list, trace_tags):
+        # Tag the spans of this upload with its asset; the task runs in its own context copy
+        _trace_tags.set(trace_tags)
+        start = get_trace_timestamp()
+        try:
+            await self._send(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list)
+        finally:
+            record_async_trace_span("upload", start, get_trace_timestamp(), trace_tags)
+
+    async def _send(self, refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list):
+        if UPLOAD_MODE == "blob":
+            # The blob uploader is thread-based; run it off the event loop
+            uploaded = await asyncio.wait_for(
+                asyncio.to_thread(send_fbx_blob_request, refresh_token, main_file, asset_metadata,
+                                  model_metadata, image_bytes_list),
+                self.timeout
+            )
+            if not uploaded:
+                raise Exception("Blob upload failed")
+        else:
+            await self._post_asset(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list)
+
+    def submit(self, refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list, on_result):
+        """
+        Schedules an asset upload. Takes the same arguments as send_fbx_api_request, plus a callback.
+
+        Args:
+            on_result (callable): Called with (success, error) when the upload finishes.
+        """
+        self._slots.acquire()  # Backpressure: wait while the concurrency limit is reached
+        future = asyncio.run_coroutine_threadsafe(
+            self._upload(refresh_token, main_file, asset_metadata, model_metadata, image_bytes_list, _trace_tags.get()),
+            self._loop
+        )
+        self._futures.add(future)
+
+        def done(completed):
+            self._futures.discard(completed)
+            self._slots.release()
+            if completed.cancelled():
+                on_result(False, "Upload cancelled")
+            elif completed.exception():
+                logging.error(f"Error during API request: {completed.exception()}")
+                on_result(False, completed.exception())
+            else:
+                on_result(True, None)
 
+        future.add_done_callback(done)
 
-def change_preview_gen_filename(filename):
+    def wait(self):
+        """
+        Waits for the uploads in flight to finish.
+        """
+        for future in list(self._futures):
+            try:
+                future.result()
+            except BaseException:
+                pass  # Already reported through the result callback
+
+    def close(self, cancel=False):
+        """
+        Waits for the in-flight uploads to finish (or cancels them) and stops the event loop.
+
+        Args:
+            cancel (bool): Cancel the uploads still in flight instead of waiting for them, e.g. on shutdown.
+        """
+        if cancel:
+            for future in list(self._futures):
+                future.cancel()
+        self.wait()
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def create_asset_uploader():
     """
-    Makes a POST request to forward the filename to the Express server.
+    Creates the asynchronous uploader, or returns None when UPLOAD_CONCURRENCY is 0 (blocking uploads).
+    """
+    # Pass the settings explicitly: the constructor defaults are bound when the module is loaded
+    return AsyncAssetUploader(UPLOAD_CONCURRENCY, UPLOAD_TIMEOUT_SECONDS) if UPLOAD_CONCURRENCY > 0 else None
 
-    :param filename: The filename to be forwarded (e.g., 'example_file.fbx')
+
+_fingerprint_index = None  # Fingerprint -> index entry of every asset known to be uploaded
+_fingerprint_index_path = None  # Index file this process appends to
+_fingerprint_lock = threading.Lock()
+_pending_fingerprints = set()  # Fingerprints claimed by this process whose upload has not finished
+_shared_fingerprints = None  # Fingerprint -> claiming process ID, shared by the worker processes (multiprocessing.Manager dict)
+
+
+def hash_asset_file(inventory, asset_file):
+    """
+    Hashes the contents of a single asset file.
+
+    Args:
+        inventory (AssetInventory): The inventory the file belongs to.
+        asset_file (AssetFile): The file to hash.
+
+    Returns:
+        str: The SHA-256 hex digest of the file.
+    """
+    file_hash = hashlib.sha256()
+    with inventory.open_file(asset_file) as file:
+        for chunk in iter(lambda: file.read(FINGERPRINT_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+@traced
+def compute_asset_fingerprint(inventory):
+    """
+    Computes a content fingerprint of an asset folder. Files are hashed in parallel and combined
+    in relative-path order, so the fingerprint does not depend on the folder location or listing order.
+
+    Args:
+        inventory (AssetInventory): The inventory of the asset folder.
+
+    Returns:
+        str: The SHA-256 hex digest of the asset folder.
+    """
+    asset_files = sorted(inventory.files, key=lambda asset_file: asset_file.rel_path.replace(os.sep, '/'))
+    with ThreadPoolExecutor(max_workers=FINGERPRINT_WORKERS) as executor:
+        file_digests = list(executor.map(functools.partial(hash_asset_file, inventory), asset_files))
+
+    fingerprint = hashlib.sha256()
+    for asset_file, file_digest in zip(asset_files, file_digests):
+        fingerprint.update(f"{asset_file.rel_path.replace(os.sep, '/')}\0{asset_file.size}\0{file_digest}\n".encode('utf-8'))
+    return fingerprint.hexdigest()
+
+
+def load_fingerprint_index(worker_id=None):
+    """
+    Loads the local index of uploaded asset fingerprints. Worker processes read the main index
+    and append to their own index file, which is merged into the main index with the ledgers.
+
+    Args:
+        worker_id (int, optional): Worker index, for the per-worker files written in parallel mode.
+    """
+    global _fingerprint_index, _fingerprint_index_path
+    index = {}
+    index_path = get_log_file_path("-fingerprints", worker_id, "jsonl")
+    for path in dict.fromkeys([get_log_file_path("-fingerprints", extension="jsonl"), index_path]):
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as index_file:
+                for line in index_file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        index[entry['fingerprint']] = entry  # Later entries carry the linked projects
+        except Exception as e:
+            logging.error(f"Error loading fingerprint index '{path}': {e}")
+
+    with _fingerprint_lock:
+        _fingerprint_index = index
+        _fingerprint_index_path = index_path
+    logging.info(f"Loaded {len(index)} uploaded asset fingerprints.")
+
+
+def record_fingerprint(fingerprint, asset_name, projects):
+    """
+    Adds an uploaded asset to the local fingerprint index.
+
+    Args:
+        fingerprint (str): The content fingerprint of the asset folder.
+        asset_name (str): The name of the asset folder.
+        projects (list): The projects the asset belongs to.
+    """
+    if _fingerprint_index is None:
+        load_fingerprint_index()
+    entry = {"fingerprint": fingerprint, "asset": asset_name, "projects": list(projects)}
+    with _fingerprint_lock:
+        _fingerprint_index[fingerprint] = entry
+        try:
+            with open(_fingerprint_index_path, 'a', encoding='utf-8') as index_file:
+                index_file.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            logging.error(f"Error writing fingerprint index '{_fingerprint_index_path}': {e}")
+
+
+def lookup_server_fingerprint(refresh_token, fingerprint):
+    """
+    Looks up an asset by fingerprint on the asset API.
+
+    Args:
+        refresh_token (str): The refresh token for authentication.
+        fingerprint (str): The content fingerprint of the asset folder.
+
+    Returns:
+        dict: The asset's 'name' and 'projects', or None if it is not on the server or the lookup failed.
+    """
+    try:
+        response = requests.get(f"{API_URL}/fingerprint", params={'fingerprint': fingerprint},
+                                cookies={'refreshToken': refresh_token})
+        if response.status_code == 200:
+            return response.json()['asset']
+        if response.status_code != 404:
+            logging.warning(f"Fingerprint lookup failed: {response.status_code}, {response.text}")
+    except requests.RequestException as e:
+        logging.warning(f"Error during fingerprint lookup: {e}")
+    return None
+
+
+def link_asset_to_projects(refresh_token, fingerprint, projects):
+    """
+    Adds projects to the already-uploaded asset with the given fingerprint.
+
+    Args:
+        refresh_token (str): The refresh token for authentication.
+        fingerprint (str): The content fingerprint of the asset folder.
+        projects (list): The project names to add.
+    """
+    response = requests.put(f"{API_URL}/fingerprint/projects", json={'fingerprint': fingerprint, 'projects': projects},
+                            cookies={'refreshToken': refresh_token})
+    if response.status_code != 200:
+        raise Exception(f"Failed to link asset to projects: {response.status_code}, {response.json().get('message')}")
+
+
+def claim_fingerprint(fingerprint):
+    """
+    Claims an asset fingerprint for this process, so later copies of the asset in the run are skipped
+    while it is processed and uploaded. In parallel mode the claim is shared with the other workers.
+    The claim is released by record_asset_result when the asset fails.
+
+    Args:
+        fingerprint (str): The content fingerprint of the asset folder.
+
+    Returns:
+        bool: True if this process claimed the fingerprint, False if it is already claimed.
+    """
+    with _fingerprint_lock:
+        if fingerprint in _pending_fingerprints:
+            return False
+        if _shared_fingerprints is not None and _shared_fingerprints.setdefault(fingerprint, os.getpid()) != os.getpid():
+            return False
+        _pending_fingerprints.add(fingerprint)
+    return True
+
+
+def release_fingerprint(fingerprint, uploaded):
+    """
+    Releases the claim of this process on an asset fingerprint once the asset is uploaded or has failed.
+    Failed assets are also released in the shared claims, so a later copy can be uploaded instead.
+
+    Args:
+        fingerprint (str): The content fingerprint of the asset folder.
+        uploaded (bool): Whether the asset was uploaded.
+    """
+    with _fingerprint_lock:
+        _pending_fingerprints.discard(fingerprint)
+        if not uploaded and _shared_fingerprints is not None and _shared_fingerprints.get(fingerprint) == os.getpid():
+            _shared_fingerprints.pop(fingerprint, None)
+
+
+def find_uploaded_duplicate(fingerprint):
+    """
+    Finds an earlier upload of an asset folder with the same contents, in the local index, on the server
+    or claimed earlier in this run (by this process or, in parallel mode, another worker). Claims the
+    fingerprint when the asset was not uploaded before.
+
+    Args:
+        fingerprint (str): The content fingerprint of the asset folder.
+
+    Returns:
+        dict: The index entry of the earlier upload, or None if the asset was not uploaded before.
+    """
+    if _fingerprint_index is None:
+        load_fingerprint_index()
+    with _fingerprint_lock:
+        entry = _fingerprint_index.get(fingerprint)
+    if entry is None and FINGERPRINT_LOOKUP_SERVER:
+        server_asset = lookup_server_fingerprint(REFRESH_TOKEN, fingerprint)
+        if server_asset:
+            record_fingerprint(fingerprint, server_asset['name'], server_asset['projects'])
+            entry = _fingerprint_index[fingerprint]
+    if entry is None and not claim_fingerprint(fingerprint):
+        entry = {"fingerprint": fingerprint, "asset": None, "projects": PROJECT_DESTINATION_NAMES}
+    return entry
+
+
+def handle_duplicate_asset(project_folder_path, asset_folder_path, fingerprint):
+    """
+    Skips an asset folder that was already uploaded, linking the existing asset to the
+    destination projects it is missing when DUPLICATE_MODE is "link".
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        fingerprint (str): The content fingerprint of the asset folder.
+
+    Returns:
+        bool: True if the asset is a duplicate and was handled, False if it must be uploaded.
+    """
+    if DUPLICATE_MODE == "off":
+        return False
+    entry = find_uploaded_duplicate(fingerprint)
+    if entry is None:
+        return False
+
+    missing_projects = [project for project in PROJECT_DESTINATION_NAMES if project not in entry['projects']]
+    if missing_projects and DUPLICATE_MODE == "link":
+        try:
+            link_asset_to_projects(REFRESH_TOKEN, fingerprint, missing_projects)
+        except Exception as e:
+            # The asset itself is uploaded; only the project links are missing
+            logging.error(f"Error linking duplicate asset '{asset_folder_path}' to projects: {e}")
+            record_link_failure(project_folder_path, asset_folder_path, missing_projects, e)
+            return True
+        record_fingerprint(fingerprint, entry['asset'], entry['projects'] + missing_projects)
+        logging.info(f"Duplicate asset '{asset_folder_path}' linked to projects: {', '.join(missing_projects)}")
+    else:
+        logging.info(f"Skipping duplicate asset '{asset_folder_path}' (already uploaded as '{entry['asset'] or fingerprint}')")
+    record_asset_result(project_folder_path, asset_folder_path, True)
+    return True
+
+
+def check_fbx_exists(inventory):
+    """
+    Checks if any .fbx files exist in the given asset folder.
+
+    Args:
+        inventory (AssetInventory): The inventory of the asset folder to search for .fbx files.
+
+    Returns:
+        bool: True if at least one .fbx file is found, False otherwise.
+    """
+    fbx_files = inventory.fbx_files
+    if fbx_files:
+        logging.debug(f".fbx file found: {fbx_files[0].path}")
+        return True
+    logging.debug(f"No .fbx files found in '{inventory.root}'")
+    return False
+
+
+def process_fbx_files_in_asset_folder(inventory):
+    """
+    Processes all FBX files in the given asset folder and collects their metadata.
+
+    Args:
+        inventory (AssetInventory): The inventory of the asset folder to process.
+
+    Returns:
+        list: A list of metadata dictionaries for each FBX file found.
+    """
+    metadata_list = []
+    preview_list = []
+
+    # Index every file of the asset folder for the preview server
+    path_index = {get_preview_file_id(asset_file.path): asset_file.path for asset_file in inventory.files}
+    register_preview_path_index(path_index)
+
+    for fbx_file in inventory.fbx_files:
+        file_name, fbx_file_path = fbx_file.name, fbx_file.path
+        logging.info(f"Found FBX file: {fbx_file_path}")
+
+        try:
+            # Retrieve FBX metadata using the external script
+            metadata = get_fbx_metadata(fbx_file_path)
+            if metadata:
+                metadata_list.append(metadata)
+                logging.info(f"Successfully processed metadata for {fbx_file_path}")
+
+                try:
+                    change_preview_gen_filename(get_preview_file_id(fbx_file_path))
+                    screenshot_json = run_make_preview_and_get_encoded_screenshot()
+                    if screenshot_json:
+                        preview_list.append({'file_name': file_name.replace('.fbx', f'.{PREVIEW_FORMAT}'),
+                                             'base64': screenshot_json["screenshotBase64"]})
+
+                except Exception as e:
+                    logging.error(f"Error forwarding filename to the Express server: {e}")
+                    raise Exception(f"Error forwarding filename to the Express server: {e}")
+            else:
+                logging.error(f"Failed to retrieve metadata for {fbx_file_path}")
+                raise Exception(f"Failed to retrieve metadata for {fbx_file_path}")
+        except Exception as e:
+            logging.error(f"This fbx is corrupted!! {e}")
+            raise Exception(f"This fbx is corrupted!! {e}")
+
+    return metadata_list, preview_list
+
+
+def aggregate_metadata(metadata_list):
+    """
+    Aggregates the metadata fields from a list of FBX file metadata.
+
+    Args:
+        metadata_list (list): A list of metadata dictionaries to aggregate.
+
+    Returns:
+        dict: A dictionary with the aggregated metadata.
+    """
+    aggregated_data = {
+        'triCount': 0,
+        'vertices': 0,
+        'edges': 0,
+        'lodCount': 0,
+        'polygons': 0,
+        'rigType': "NONE",
+        'animationCount': 0,
+        'textureCount': 0
+    }
+
+    for metadata in metadata_list:
+        aggregated_data['triCount'] += metadata['model'].get('triCount', 0)
+        aggregated_data['vertices'] += metadata['model'].get('vertices', 0)
+        aggregated_data['edges'] += metadata['model'].get('edges', 0)
+        aggregated_data['lodCount'] += metadata['model'].get('lodCount', 0)
+        aggregated_data['polygons'] += metadata['model'].get('polygons', 0)
+        aggregated_data['rigType'] = metadata['model'].get('rigType', "NONE")
+        aggregated_data['animationCount'] += metadata['model'].get('animationCount', 0)
+
+    return aggregated_data
+
+
+ZipMember = namedtuple('ZipMember', ['method', 'crc', 'size', 'data'])
+
+
+def compress_zip_member(asset_file):
+    """
+    Compresses an archive member ahead of the archive writer. Already-compressed formats (ZIP_STORED_EXTENSIONS)
+    are stored, other files are deflated at ZIP_DEFLATE_LEVEL into a raw deflate stream, as zip expects.
+    A file that does not shrink when deflated (e.g. embedded media) is stored instead.
+    Runs on the zip thread pool; zlib releases the GIL while it compresses and checksums.
+
+    Args:
+        asset_file (AssetFile): The file to compress.
+
+    Returns:
+        ZipMember: The compression method, CRC-32, uncompressed size and member data.
+    """
+    crc, size = 0, 0
+    chunks = []
+    compressor = None if asset_file.extension in ZIP_STORED_EXTENSIONS else \
+        zlib.compressobj(ZIP_DEFLATE_LEVEL, zlib.DEFLATED, -15)
+    with open(asset_file.path, 'rb') as file:
+        for chunk in iter(lambda: file.read(ZIP_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            chunks.append(compressor.compress(chunk) if compressor else chunk)
+        if compressor:
+            chunks.append(compressor.flush())
+            if sum(len(chunk) for chunk in chunks) >= size:
+                file.seek(0)
+                return ZipMember(zipfile.ZIP_STORED, crc, size, file.read())
+    return ZipMember(zipfile.ZIP_DEFLATED if compressor else zipfile.ZIP_STORED, crc, size, b''.join(chunks))
+
+
+class ZipArchiveWriter:
+    """
+    Writes a zip archive from members compressed ahead of time by compress_zip_member, so members can be
+    compressed in parallel and still be written in order. zipfile.ZipFile compresses each member on the
+    writing thread, so the local headers, central directory and Zip64 records are written here instead.
+    """
+    ZIP64_LIMIT = 0xFFFFFFFF  # Sizes and offsets from which Zip64 records are needed
+    ZIP64_COUNT_LIMIT = 0xFFFF  # Member count from which Zip64 records are needed
+    ZIP64_SIZE_MARKER = 0xFFFFFFFF  # Stands in for a size or offset stored in the Zip64 records
+    ZIP64_COUNT_MARKER = 0xFFFF
+
+    def __init__(self, output):
+        self.output = output
+        self.entries = []  # Central directory records, written by close()
+
+    def write(self, asset_file, member):
+        """
+        Appends a compressed member to the archive.
+
+        Args:
+            asset_file (AssetFile): The file the member was compressed from.
+            member (ZipMember): The compressed member.
+        """
+        name = asset_file.rel_path.replace(os.sep, '/').encode('utf-8')
+        stat = os.stat(asset_file.path)
+        # Zip timestamps cover 1980-2107, with a two-second resolution
+        year, month, day, hour, minute, second = time.localtime(stat.st_mtime)[:6]
+        year = min(max(year, 1980), 2107)
+        dos_date = (year - 1980) << 9 | month << 5 | day
+        dos_time = hour << 11 | minute << 5 | second // 2
+
+        offset = self.output.tell()
+        zip64 = max(member.size, len(member.data), offset) >= self.ZIP64_LIMIT
+        version = 45 if zip64 else 20
+        flags = 0x800  # UTF-8 file name
+        sizes = (self.ZIP64_SIZE_MARKER, self.ZIP64_SIZE_MARKER) if zip64 else (len(member.data), member.size)
+        local_extra = struct.pack('<HHQQ', 1, 16, member.size, len(member.data)) if zip64 else b''
+        self.output.write(struct.pack('<IHHHHHIIIHH', 0x04034b50, version, flags, member.method, dos_time, dos_date,
+                                      member.crc, *sizes, len(name), len(local_extra)))
+        self.output.write(name + local_extra)
+        self.output.write(member.data)
+
+        central_extra = struct.pack('<HHQQQ', 1, 24, member.size, len(member.data), offset) if zip64 else b''
+        self.entries.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, 3 << 8 | version, version, flags,
+                                         member.method, dos_time, dos_date, member.crc, *sizes, len(name),
+                                         len(central_extra), 0, 0, 0, (stat.st_mode & 0xFFFF) << 16,
+                                         self.ZIP64_SIZE_MARKER if zip64 else offset) + name + central_extra)
+
+    def close(self):
+        """
+        Writes the central directory and the end of central directory records.
+        """
+        directory_offset = self.output.tell()
+        for entry in self.entries:
+            self.output.write(entry)
+        directory_size = self.output.tell() - directory_offset
+        count = len(self.entries)
+
+        if count >= self.ZIP64_COUNT_LIMIT or max(directory_offset, directory_size) >= self.ZIP64_LIMIT:
+            zip64_end_offset = self.output.tell()
+            self.output.write(struct.pack('<IQHHIIQQQQ', 0x06064b50, 44, 45, 45, 0, 0, count, count,
+                                          directory_size, directory_offset))
+            self.output.write(struct.pack('<IIQI', 0x07064b50, 0, zip64_end_offset, 1))
+            count = min(count, self.ZIP64_COUNT_MARKER)
+            directory_size = min(directory_size, self.ZIP64_SIZE_MARKER)
+            directory_offset = self.ZIP64_SIZE_MARKER
+        self.output.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, count, count,
+                                      directory_size, directory_offset, 0))
+
+
+@traced
+def zip_folder_in_memory(inventory):
+    """
+    Creates a zip archive of the given folder in memory. Already-compressed formats (ZIP_STORED_EXTENSIONS)
+    are stored, other files are deflated at ZIP_DEFLATE_LEVEL. Up to ZIP_WORKERS members are compressed
+    in parallel on the zip thread pool while the finished ones are written in inventory order.
+
+    Args:
+        inventory (AssetInventory): The inventory of the folder to zip.
+
+    Returns:
+        BytesIO: The in-memory zip archive.
+    """
+    try:
+        logging.info(f"Zipping folder: {inventory.root}")
+        memory_file = io.BytesIO()
+        writer = ZipArchiveWriter(memory_file)
+        with ThreadPoolExecutor(max_workers=ZIP_WORKERS) as executor:
+            # A sliding window of members in flight, so at most ZIP_WORKERS compressed members wait in memory
+            asset_files = iter(inventory.files)
+            pending = [(asset_file, executor.submit(compress_zip_member, asset_file))
+                       for asset_file in itertools.islice(asset_files, ZIP_WORKERS)]
+            while pending:
+                asset_file, member = pending.pop(0)
+                next_file = next(asset_files, None)
+                if next_file:
+                    pending.append((next_file, executor.submit(compress_zip_member, next_file)))
+                writer.write(asset_file, member.result())
+        writer.close()
+        memory_file.seek(0)
+        logging.info(f"Successfully zipped folder: {inventory.root}")
+        return memory_file
+    except Exception as e:
+        logging.error(f"Error zipping folder: {e}")
+        return None
+
+
+def change_preview_gen_directory(new_directory):
+    """
+    Makes a POST request to change the root directory on the Express server.
+
+    :param api_url: The URL for the API (e.g., 'http://localhost:8000/set-directory')
+    :param new_directory: The new directory path to set as root
+    """
+    try:
+        # Prepare the request data
+        data = {
+            'directoryPath': new_directory
+        }
+
+        # Make the POST request to change the directory
+        response = requests.post(f"http://localhost:{os.getenv('VITE_SERVER_PORT')}/set-directory", json=data)
+
+        # Log the response
+        if response.status_code == 200:
+            logging.info(f"Directory changed successfully: {response.text}")
+        else:
+            logging.info(f"Failed to change directory. Status Code: {response.status_code} | Response: {response.text}")
+
+    except requests.RequestException as e:
+        logging.info(f"Error occurred during the request: {e}")    
+
+
+def get_preview_file_id(file_path):
+    """
+    Builds a stable, URL-safe id for a file served by the preview server.
+    The extension is kept so the previewer can still pick the right loader.
+
+    Args:
+        file_path (str): The absolute path of the file.
+
+    Returns:
+        str: The file id (e.g., '3f2a9c0d1b7e4a55.fbx').
+    """
+    digest = hashlib.sha1(os.path.normcase(file_path).encode('utf-8')).hexdigest()[:16]
+    return f"{digest}{os.path.splitext(file_path)[1].lower()}"
+
+
+@traced
+def register_preview_path_index(path_index):
+    """
+    Makes a POST request to register a path index (id -> absolute path) with the Express server,
+    replacing the previous one. Files are then served by exact id without any directory search.
+
+    :param path_index: Dictionary mapping file ids to absolute file paths
+    """
+    try:
+        response = requests.post(f"http://localhost:{os.getenv('VITE_SERVER_PORT')}/register-path-index",
+                                 json={'paths': path_index})
+
+        if response.status_code == 200:
+            logging.info(f"Path index registered successfully: {response.text}")
+        else:
+            logging.info(f"Failed to register path index. Status Code: {response.status_code} | Response: {response.text}")
+
+    except requests.RequestException as e:
+        logging.info(f"Error occurred during the request: {e}")
+
+
+@traced
+def change_preview_gen_filename(filename):
+    """
+    Makes a POST request to forward the filename to the Express server.
+
+    :param filename: The filename to be forwarded (e.g., 'example_file.fbx')
     """
     try:
         # Prepare the request data
@@ -555,37 +1753,222 @@ def change_preview_gen_filename(filename):
         # Make the POST request to forward the filename
         response = requests.post(f"http://localhost:{os.getenv('VITE_SERVER_PORT')}/forward-filename", json=data)
 
-        # Log the response
-        if response.status_code == 200:
-            logging.info(f"Filename forwarded successfully. Status Code: {response.status_code} | Response: {response.text}")
-        else:
-            logging.info(f"Failed to forward filename. Status Code: {response.status_code} | Response: {response.text}")
+        # Log the response
+        if response.status_code == 200:
+            logging.info(f"Filename forwarded successfully. Status Code: {response.status_code} | Response: {response.text}")
+        else:
+            logging.info(f"Failed to forward filename. Status Code: {response.status_code} | Response: {response.text}")
+
+    except requests.RequestException as e:
+        logging.info(f"Error occurred during the request: {e}")
+
+
+def is_url_healthy(url):
+    """
+    Checks whether a local server answers the given URL with a 200 response.
+
+    Args:
+        url (str): The URL to probe.
+
+    Returns:
+        bool: True if the server is up and healthy, False otherwise.
+    """
+    try:
+        return requests.get(url, timeout=1).status_code == 200
+    except requests.RequestException:
+        return False
+
+
+def is_preview_bundle_stale(generator_directory):
+    """
+    Checks whether the production bundle of the preview page is missing or older than its sources.
+
+    Args:
+        generator_directory (str): The 3d-preview-generator directory.
+
+    Returns:
+        bool: True if the bundle must be (re)built, False otherwise.
+    """
+    bundle_path = os.path.join(generator_directory, 'dist', 'index.html')
+    if not os.path.exists(bundle_path):
+        return True
+
+    source_paths = [os.path.join(generator_directory, file_name) for file_name in ('index.html', 'vite.config.js', 'package.json')]
+    for root, _, files in os.walk(os.path.join(generator_directory, 'src')):
+        source_paths.extend(os.path.join(root, file_name) for file_name in files)
+
+    bundle_time = os.path.getmtime(bundle_path)
+    return any(os.path.getmtime(source_path) > bundle_time for source_path in source_paths if os.path.exists(source_path))
+
+
+def build_preview_bundle(generator_directory='./3d-preview-generator'):
+    """
+    Builds the production bundle of the preview page with 'vite build' when it is missing or out of date.
+    Runs once before any preview server starts, so parallel workers share the same bundle.
+
+    Args:
+        generator_directory (str): The 3d-preview-generator directory.
+
+    Returns:
+        bool: True if an up-to-date bundle is available, False otherwise.
+    """
+    if not is_preview_bundle_stale(generator_directory):
+        logging.info("Preview bundle is up to date.")
+        return True
+
+    logging.info("Building the preview bundle...")
+    try:
+        result = subprocess.run(['node', VITE_BIN, 'build'], cwd=generator_directory, env=os.environ,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except (subprocess.SubprocessError, FileNotFoundError) as e:
+        logging.error(f"Error building the preview bundle: {e}")
+        return False
+
+    if result.returncode != 0:
+        logging.error(f"Error building the preview bundle: {result.stderr.strip()}")
+        return False
+    logging.info("Preview bundle built.")
+    return True
+
+
+def start_node_process(args, cwd):
+    """
+    Starts a Node.js process in its own process group, so it can be stopped with all of its children.
+
+    Args:
+        args (list): Arguments passed to node.
+        cwd (str): The working directory of the process.
+
+    Returns:
+        subprocess.Popen: The started process.
+    """
+    if os.name == 'nt':
+        return subprocess.Popen(['node', *args], cwd=cwd, env=os.environ, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    return subprocess.Popen(['node', *args], cwd=cwd, env=os.environ, start_new_session=True)
+
+
+def stop_process_tree(process):
+    """
+    Stops a process started by start_node_process together with its child processes.
+
+    Args:
+        process (subprocess.Popen): The process to stop.
+    """
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == 'nt':
+            subprocess.run(['taskkill', '/T', '/F', '/PID', str(process.pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=10)
+    except (subprocess.TimeoutExpired, OSError):
+        process.kill()
+
+
+class PreviewServers:
+    """
+    The preview generator servers used by a run. terminate() stops the servers the run started,
+    along with their child processes; servers it attached to are left running.
+    """
+    def __init__(self, processes=()):
+        self.processes = list(processes)
+
+    def terminate(self):
+        if PREVIEW_SERVER_KEEP_ALIVE:
+            if self.processes:
+                logging.info("Leaving the preview servers running for the next run.")
+            return
+        for process in self.processes:
+            stop_process_tree(process)
+        self.processes = []
+
+
+def get_preview_health_urls():
+    """
+    Returns the health check URLs of the preview file server and the preview page.
+    """
+    return f"http://localhost:{os.getenv('VITE_SERVER_PORT')}/health", f"http://localhost:{os.getenv('VITE_PGEN_PORT')}/"
+
 
-    except requests.RequestException as e:
-        logging.info(f"Error occurred during the request: {e}")
+def are_preview_servers_healthy():
+    """
+    Checks if both preview servers answer their health checks.
+    """
+    return all(is_url_healthy(url) for url in get_preview_health_urls())
 
 
 def start_3d_preview_servers():
     """
-    Starts the 3D preview generator servers located in the '3d-preview-generator' folder using 'npm start'.
-    This process will remain open until the program ends.
+    Starts the 3D preview generator servers located in the '3d-preview-generator' folder: the Express file
+    server and the preview page, served from the production bundle (or the Vite dev server in "dev" mode).
+    A server already running and healthy on its port is attached to instead of started. Waits until both
+    servers answer their health checks.
+
+    Returns:
+        PreviewServers: The servers, or None if they did not become healthy in time.
     """
-    try:
-        # Navigate to the 3d-preview-generator directory and start the servers
-        server_process = subprocess.Popen(
-            ['npm', 'start'],
-            cwd='./3d-preview-generator',
-            shell=True
-        )
+    generator_directory = './3d-preview-generator'
+    api_health_url, page_health_url = get_preview_health_urls()
+    start_time = time.perf_counter()
 
-        logging.info("3D preview generator servers started.")
-        return server_process
+    vite_command = 'preview' if PREVIEW_SERVER_MODE == "bundle" else 'dev'
+    if vite_command == 'preview' and not os.path.exists(os.path.join(generator_directory, 'dist', 'index.html')):
+        logging.warning("Preview bundle not found. Falling back to the Vite dev server.")
+        vite_command = 'dev'
+
+    servers = PreviewServers()
+    try:
+        if is_url_healthy(api_health_url):
+            logging.info(f"Attaching to the preview file server already running on port {os.getenv('VITE_SERVER_PORT')}.")
+        else:
+            servers.processes.append(start_node_process(['utils/server.js'], generator_directory))
+        if is_url_healthy(page_health_url):
+            logging.info(f"Attaching to the preview page already running on port {os.getenv('VITE_PGEN_PORT')}.")
+        else:
+            servers.processes.append(start_node_process(
+                [VITE_BIN, vite_command, '--port', os.getenv('VITE_PGEN_PORT'), '--strictPort'], generator_directory
+            ))
+
+        # Poll the health checks until both servers answer, failing fast if one exits
+        deadline = start_time + PREVIEW_SERVER_STARTUP_TIMEOUT
+        while not are_preview_servers_healthy():
+            if any(process.poll() is not None for process in servers.processes):
+                raise Exception("A preview server exited during startup")
+            if time.perf_counter() > deadline:
+                raise Exception(f"Preview servers not healthy after {PREVIEW_SERVER_STARTUP_TIMEOUT} seconds")
+            time.sleep(0.1)
+
+        logging.info(f"3D preview generator servers ready in {time.perf_counter() - start_time:.1f}s.")
+        return servers
 
     except Exception as e:
         logging.error(f"Error starting 3D preview generator servers: {e}")
+        for process in servers.processes:
+            stop_process_tree(process)
         return None
 
 
+def get_render_profile_env():
+    """
+    Builds the environment for make-preview.js, passing the settings of the selected render profile.
+
+    Returns:
+        dict: The environment variables.
+    """
+    profile = RENDER_PROFILES[RENDER_PROFILE]
+    return {
+        **os.environ,
+        "PREVIEW_WIDTH": str(profile["width"]),
+        "PREVIEW_HEIGHT": str(profile["height"]),
+        "PREVIEW_SCALE": str(profile["scale"]),
+        "PREVIEW_ANTIALIAS": "true" if profile["antialias"] else "false",
+        "PREVIEW_FORMAT": profile["format"],
+        "PREVIEW_QUALITY": str(profile["quality"] or "")
+    }
+
+
+@traced
 def run_make_preview_and_get_encoded_screenshot():
     """
     Runs the 'node utils/make-preview.js' command located in 'src/utils', captures the output, 
@@ -596,11 +1979,12 @@ def run_make_preview_and_get_encoded_screenshot():
     """
     try:
         # Run the node command to generate the preview and capture the output
-        logging.info("Running 'node src/utils/make-preview.js' to generate preview...")
+        logging.info(f"Running 'node src/utils/make-preview.js' to generate preview ({RENDER_PROFILE} profile)...")
         result = subprocess.run(
             ['npm', 'run', 'genpreview'],
             cwd='./3d-preview-generator',
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True,
+            env=get_render_profile_env()
         )
 
         # Check if the command was successful
@@ -631,6 +2015,7 @@ def run_make_preview_and_get_encoded_screenshot():
         return None
 
 
+@traced
 def create_byteio_list(preview_list):
     byteio_list = []
 
@@ -653,16 +2038,391 @@ def create_byteio_list(preview_list):
     return byteio_list
 
 
-def traverse_and_process_assets(project_folder_path):
+_asset_result_counts = Counter()  # Ledger entries written by this process: 'succeeded', 'failed' and 'link_failed'
+_asset_result_lock = threading.Lock()
+
+
+def record_asset_result(project_folder_path, asset_folder_path, success, error=None, fingerprint=None):
     """
-    Traverses the given project folder path to find and process FBX files in asset subdirectories.
+    Writes the outcome of an asset upload to the success or error ledger.
 
     Args:
-        project_folder_path (str): The path of the project folder to traverse and process.
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        success (bool): Whether the asset was uploaded.
+        error (Exception or str, optional): The error that stopped the asset, if any.
+        fingerprint (str, optional): The fingerprint of the uploaded asset folder, added to the fingerprint index on success.
+    """
+    if fingerprint:
+        release_fingerprint(fingerprint, success)
+        if success:
+            record_fingerprint(fingerprint, get_asset_name(asset_folder_path), PROJECT_DESTINATION_NAMES)
+
+    with _asset_result_lock:
+        _asset_result_counts['succeeded' if success else 'failed'] += 1
+
+    entry = f"{os.path.basename(project_folder_path)}/{get_asset_name(asset_folder_path)}\t---\t---\t{asset_folder_path}"
+    if success:
+        logging.getLogger('successful_assets_logger').info(entry)
+    elif error is not None:
+        logging.getLogger('errored_assets_logger').error(f"{entry}\t---\t{error}")
+    else:
+        logging.getLogger('errored_assets_logger').error(entry)
+
+
+def record_link_failure(project_folder_path, asset_folder_path, projects, error):
+    """
+    Writes a duplicate asset that could not be linked to its destination projects to the link error ledger.
+    The asset itself is already uploaded, so this is not an upload failure.
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        projects (list): The project names the asset could not be linked to.
+        error (Exception): The error returned by the link request.
+    """
+    with _asset_result_lock:
+        _asset_result_counts['link_failed'] += 1
+
+    entry = f"{os.path.basename(project_folder_path)}/{get_asset_name(asset_folder_path)}\t---\t---\t{asset_folder_path}"
+    logging.getLogger('link_errored_assets_logger').error(f"{entry}\t---\t{', '.join(projects)}\t---\t{error}")
+
+
+_texture_batch = []  # Texture asset folders waiting for their thumbnails
+_texture_pool = None
+
+
+def get_texture_pool():
+    """
+    Returns the process pool generating texture thumbnails, starting it on first use.
+    """
+    global _texture_pool
+    if _texture_pool is None:
+        _texture_pool = ProcessPoolExecutor(max_workers=TEXTURE_WORKERS)
+    return _texture_pool
+
+
+def shutdown_texture_pool():
+    """
+    Stops the texture thumbnail process pool, if it was started.
+    """
+    global _texture_pool
+    if _texture_pool is not None:
+        _texture_pool.shutdown(cancel_futures=True)
+        _texture_pool = None
+
+
+def create_texture_thumbnails(image_paths):
+    """
+    Reads a batch of texture images and scales them down to thumbnails. Runs in the texture process pool.
+
+    Args:
+        image_paths (list): The paths of the images to read.
+
+    Returns:
+        list: A dictionary per image with its 'path', original 'width', 'height' and 'format', and the
+              'thumbnail' image, or an 'error' if the image could not be read.
+    """
+    thumbnails = []
+    for image_path in image_paths:
+        try:
+            with Image.open(image_path) as image:
+                width, height, image_format = image.width, image.height, image.format
+                # thumbnail() lets JPEG decoding skip straight to a reduced scale
+                image.thumbnail((TEXTURE_THUMBNAIL_SIZE, TEXTURE_THUMBNAIL_SIZE))
+                thumbnail = image.convert('RGBA')
+            thumbnails.append({"path": image_path, "width": width, "height": height, "format": image_format,
+                               "thumbnail": thumbnail})
+        except Exception as e:
+            thumbnails.append({"path": image_path, "error": str(e)})
+    return thumbnails
+
+
+def build_contact_sheets(thumbnails, asset_name):
+    """
+    Lays out texture thumbnails on contact sheets used as the preview images of a texture asset.
+
+    Args:
+        thumbnails (list): Thumbnail dictionaries from create_texture_thumbnails.
+        asset_name (str): The name of the asset, used for the preview file names.
+
+    Returns:
+        list: BytesIO contact sheets in PREVIEW_FORMAT, each with a 'name'.
+    """
+    cell_size = TEXTURE_THUMBNAIL_SIZE
+    image_format = Image.registered_extensions()[f'.{PREVIEW_FORMAT}']
+    contact_sheets = []
+
+    for sheet_number, start in enumerate(range(0, len(thumbnails), CONTACT_SHEET_MAX_IMAGES), start=1):
+        sheet_thumbnails = thumbnails[start:start + CONTACT_SHEET_MAX_IMAGES]
+        columns = min(CONTACT_SHEET_COLUMNS, len(sheet_thumbnails))
+        rows = -(-len(sheet_thumbnails) // columns)
+        sheet = Image.new('RGB', (columns * cell_size, rows * cell_size), CONTACT_SHEET_BACKGROUND)
+
+        for index, item in enumerate(sheet_thumbnails):
+            thumbnail = item['thumbnail']
+            # Center each thumbnail in its cell
+            x = (index % columns) * cell_size + (cell_size - thumbnail.width) // 2
+            y = (index // columns) * cell_size + (cell_size - thumbnail.height) // 2
+            sheet.paste(thumbnail, (x, y), thumbnail)
+
+        byte_io = io.BytesIO()
+        quality = RENDER_PROFILES[RENDER_PROFILE]["quality"]
+        sheet.save(byte_io, format=image_format, **({"quality": quality} if quality else {}))
+        byte_io.seek(0)
+        byte_io.name = f"{asset_name} - {sheet_number}.{PREVIEW_FORMAT}"
+        contact_sheets.append(byte_io)
+
+    return contact_sheets
+
+
+def queue_texture_asset(project_folder_path, asset_folder_path, inventory, fingerprint, uploader=None):
+    """
+    Adds a texture asset folder to the current batch, and processes the batch once it holds
+    TEXTURE_BATCH_IMAGES images.
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        inventory (AssetInventory): The inventory of the asset folder.
+        fingerprint (str): The content fingerprint of the asset folder, or None when DUPLICATE_MODE is "off".
+        uploader (AsyncAssetUploader, optional): Uploads the assets in the background.
+
+    Returns:
+        bool: True if the asset was queued (the batch then closes its inventory), False otherwise.
+    """
+    if not inventory.texture_images:
+        logging.error(f"No texture images found in asset folder: {asset_folder_path}")
+        record_asset_result(project_folder_path, asset_folder_path, False,
+                            f"No texture images found in asset folder: {asset_folder_path}", fingerprint)
+        return False
+
+    _texture_batch.append((project_folder_path, asset_folder_path, inventory, fingerprint))
+    if sum(len(entry[2].texture_images) for entry in _texture_batch) >= TEXTURE_BATCH_IMAGES:
+        send_texture_api_request(uploader)
+    return True
+
+
+def process_texture_asset(project_folder_path, asset_folder_path, inventory, fingerprint, thumbnails, uploader=None):
+    """
+    Builds the contact sheets, description and texture metadata of a texture asset and uploads it.
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        inventory (AssetInventory): The inventory of the asset folder.
+        fingerprint (str): The content fingerprint of the asset folder, or None when DUPLICATE_MODE is "off".
+        thumbnails (dict): Thumbnail dictionaries of the batch, by image path.
+        uploader (AsyncAssetUploader, optional): Uploads the asset in the background. Uploads block when None.
+    """
+    asset_name = get_asset_name(asset_folder_path)
+    with trace_span("process_texture_asset", project=os.path.basename(project_folder_path), asset=asset_name):
+        try:
+            texture_thumbnails = []
+            for texture_image in inventory.texture_images:
+                thumbnail = thumbnails[texture_image.path]
+                if "error" in thumbnail:
+                    logging.warning(f"Skipping unreadable texture '{texture_image.path}': {thumbnail['error']}")
+                else:
+                    texture_thumbnails.append(thumbnail)
+            if not texture_thumbnails:
+                raise Exception(f"No readable texture images in asset folder: {asset_folder_path}")
+
+            image_bytes_list = build_contact_sheets(texture_thumbnails, clean_asset_name(asset_name))
+            largest_texture = max(texture_thumbnails, key=lambda thumbnail: thumbnail['width'] * thumbnail['height'])
+            texture_metadata_list = [
+                {
+                    "name": os.path.splitext(texture_image.name)[0],
+                    "fileName": texture_image.name,
+                    "fileSize": texture_image.size
+                }
+                for texture_image in inventory.texture_images
+            ]
+            generated_tags = generate_tags(clean_asset_name(asset_name))
+            asset_metadata = {
+                "description": generate_description(asset_name, os.path.basename(project_folder_path), texture_metadata_list),
+                "projects": PROJECT_DESTINATION_NAMES,
+                "categories": ["texture"],
+                "tags": GLOBAL_TEXTURE_TAGS + (generated_tags if generated_tags else []),
+                "texture": {
+                    "width": largest_texture['width'],
+                    "height": largest_texture['height'],
+                    "type": largest_texture['format']
+                },
+                "fingerprint": fingerprint
+            }
+        except Exception as e:
+            logging.error(f"Error processing texture asset folder '{asset_folder_path}': {e}")
+            record_asset_result(project_folder_path, asset_folder_path, False, e, fingerprint)
+            return
+        finally:
+            inventory.close()
+
+        upload_asset(project_folder_path, asset_folder_path, inventory, fingerprint, asset_metadata, None,
+                     image_bytes_list, uploader)
+
+
+@traced
+def send_texture_api_request(uploader=None):
+    """
+    Processes the queued texture assets as one batch: the thumbnails of all their images are generated
+    on the texture process pool in chunks of TEXTURE_CHUNK_SIZE, then each asset is uploaded.
+
+    Args:
+        uploader (AsyncAssetUploader, optional): Uploads the assets in the background. Uploads block when None.
     """
+    batch = list(_texture_batch)
+    _texture_batch.clear()
+    if not batch:
+        return
+
+    image_paths = [texture_image.path for _, _, inventory, _ in batch for texture_image in inventory.texture_images]
+    logging.info(f"Generating thumbnails for {len(image_paths)} textures in {len(batch)} asset folders...")
+    chunks = [image_paths[start:start + TEXTURE_CHUNK_SIZE] for start in range(0, len(image_paths), TEXTURE_CHUNK_SIZE)]
+    thumbnails = {}
     try:
-        logging.info(f"Processing project folder: {project_folder_path}")
+        for chunk_thumbnails in get_texture_pool().map(create_texture_thumbnails, chunks):
+            thumbnails.update((thumbnail['path'], thumbnail) for thumbnail in chunk_thumbnails)
+    except Exception as e:
+        logging.error(f"Error generating texture thumbnails: {e}")
+        for project_folder_path, asset_folder_path, inventory, fingerprint in batch:
+            inventory.close()
+            record_asset_result(project_folder_path, asset_folder_path, False, e, fingerprint)
+        return
+
+    for project_folder_path, asset_folder_path, inventory, fingerprint in batch:
+        process_texture_asset(project_folder_path, asset_folder_path, inventory, fingerprint, thumbnails, uploader)
+
+
+def upload_asset(project_folder_path, asset_folder_path, inventory, fingerprint, asset_metadata, model_metadata,
+                 image_bytes_list, uploader=None):
+    """
+    Zips an asset folder and uploads it with its metadata and preview images, recording the result in the
+    asset ledgers. The memory of the zip and previews is reserved in the memory budget until the upload finishes.
+    Zipped asset folders are uploaded as-is from a memory map of the original archive, which is not reserved.
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder.
+        inventory (AssetInventory): The inventory of the asset folder.
+        fingerprint (str): The content fingerprint of the asset folder, or None when DUPLICATE_MODE is "off".
+        asset_metadata (dict): Metadata for the asset.
+        model_metadata (dict): Model-specific metadata, or None for texture assets.
+        image_bytes_list (list): BytesIO preview images, each with a 'name'.
+        uploader (AsyncAssetUploader, optional): Uploads the asset in the background. Uploads block when None.
+    """
+    # Reserve memory for the zip (members are streamed in from disk, so the archive is at most about
+    # the folder size) and the previews before zipping; released once the upload finishes
+    archived = isinstance(inventory, ArchiveInventory)
+    preview_bytes = sum(image.getbuffer().nbytes for image in image_bytes_list)
+    reserved_bytes = memory_budget.reserve((0 if archived else inventory.total_size) + preview_bytes)
+    preview_bytes = min(preview_bytes, reserved_bytes)
+    upload_submitted = False
+    main_file = {"filename": get_asset_name(asset_folder_path), "zip": None}
+    try:
+        main_file['zip'] = inventory.map_archive() if archived else zip_folder_in_memory(inventory)
+        # Keep only the finished archive reserved until the upload completes
+        zip_bytes = 0 if archived or not main_file['zip'] else main_file['zip'].getbuffer().nbytes
+        zip_bytes = min(zip_bytes, reserved_bytes - preview_bytes)
+        memory_budget.release(reserved_bytes - preview_bytes - zip_bytes)
+        reserved_bytes = preview_bytes + zip_bytes
+
+        if uploader:
+            def on_upload_result(success, error):
+                memory_budget.release(reserved_bytes)
+                close_zip_file(main_file['zip'])
+                record_asset_result(project_folder_path, asset_folder_path, success, error, fingerprint)
+
+            uploader.submit(REFRESH_TOKEN, main_file, asset_metadata, model_metadata, image_bytes_list,
+                            on_upload_result)
+            upload_submitted = True
+            return
+
+        try:
+            uploaded = send_asset_upload_request(REFRESH_TOKEN, main_file, asset_metadata, model_metadata, image_bytes_list)
+            record_asset_result(project_folder_path, asset_folder_path, uploaded, fingerprint=fingerprint)
+        except Exception as e:
+            logging.error(f"Error sending API request for asset folder '{asset_folder_path}': {e}")
+            record_asset_result(project_folder_path, asset_folder_path, False, e, fingerprint)
+    finally:
+        if not upload_submitted:
+            memory_budget.release(reserved_bytes)
+            if main_file['zip']:
+                close_zip_file(main_file['zip'])
+
+
+def process_asset_folder(project_folder_path, asset_folder_path, uploader=None):
+    """
+    Processes a single asset folder: extracts metadata and previews, generates the description and tags,
+    and uploads the asset, recording the result in the asset ledgers. Folders without .fbx files are
+    queued for the batched texture pipeline. Zipped asset folders are read in place (see ArchiveInventory).
+
+    Args:
+        project_folder_path (str): The path of the project folder the asset belongs to.
+        asset_folder_path (str): The path of the asset folder to process.
+        uploader (AsyncAssetUploader, optional): Uploads the asset in the background. Uploads block when None.
+    """
+    with trace_span("process_asset_folder", project=os.path.basename(project_folder_path),
+                    asset=get_asset_name(asset_folder_path)):
+        inventory = None
+        fingerprint = None
+        queued = False
+        try:
+            with trace_span("scan_asset_folder"):
+                if is_asset_archive(asset_folder_path):
+                    inventory = ArchiveInventory(asset_folder_path)
+                else:
+                    inventory = AssetInventory(asset_folder_path)
+            # Hashing reads the whole folder, so it only runs when duplicates are detected
+            if DUPLICATE_MODE != "off":
+                fingerprint = compute_asset_fingerprint(inventory)
+                if handle_duplicate_asset(project_folder_path, asset_folder_path, fingerprint):
+                    return
+            with trace_span("extract_preview_members"):
+                inventory.extract_preview_members()
+            if not check_fbx_exists(inventory):
+                logging.info(f"No .fbx files found in asset folder: {asset_folder_path}. Queuing it as a texture asset.")
+                queued = queue_texture_asset(project_folder_path, asset_folder_path, inventory, fingerprint, uploader)
+                return
+            metadata_list, preview_list = process_fbx_files_in_asset_folder(inventory)
+            if not preview_list:
+                raise Exception(f"No previews were generated for asset folder: {asset_folder_path}")
+
+            combined_model_metadata = aggregate_metadata(metadata_list)
+            combined_model_metadata['textureCount'] = count_image_files_in_texture_folders(inventory)
+            generated_tags = generate_tags(clean_asset_name(get_asset_name(asset_folder_path)))
+            asset_metadata = {
+                "description": generate_description(get_asset_name(asset_folder_path), os.path.basename(project_folder_path), metadata_list),
+                "projects": PROJECT_DESTINATION_NAMES,
+                "categories": ["model"],
+                "tags": GLOBAL_ASSET_TAGS + (generated_tags if generated_tags else []),
+                "fingerprint": fingerprint
+            }
+            image_bytes_list = create_byteio_list(preview_list)
+        except Exception as e:
+            logging.error(f"Error processing asset folder '{asset_folder_path}': {e}")
+            record_asset_result(project_folder_path, asset_folder_path, False, e, fingerprint)
+            return
+        finally:
+            if inventory and not queued:
+                inventory.close()
+
+        upload_asset(project_folder_path, asset_folder_path, inventory, fingerprint, asset_metadata,
+                     combined_model_metadata, image_bytes_list, uploader)
+
+
+def get_asset_folders(project_folder_path):
+    """
+    Lists the asset folders of a project folder, grouped under their asset parent folders.
+
+    Args:
+        project_folder_path (str): The path of the project folder.
 
+    Returns:
+        list: A list of (asset_parent_folder_path, asset_folder_path) tuples.
+    """
+    asset_folders = []
+    try:
         asset_parent_folders = {
             folder for folder in os.listdir(project_folder_path)
             if os.path.isdir(os.path.join(project_folder_path, folder))
@@ -670,69 +2430,160 @@ def traverse_and_process_assets(project_folder_path):
 
         for asset_parent_folder in asset_parent_folders:
             asset_parent_folder_path = os.path.join(project_folder_path, asset_parent_folder)
-            change_preview_gen_directory(asset_parent_folder_path)
-            if not os.path.exists(asset_parent_folder_path):
-                logging.warning(f"Asset folder '{asset_parent_folder}' does not exist in '{project_folder_path}'")
-                continue
+            for asset_folder in os.listdir(asset_parent_folder_path):
+                asset_folders.append((asset_parent_folder_path, os.path.join(asset_parent_folder_path, asset_folder)))
+    except Exception as e:
+        logging.error(f"Error listing asset folders in '{project_folder_path}': {e}")
 
-            logging.info(f"Traversing asset folder: {asset_parent_folder_path}")
+    return asset_folders
 
-            for asset_folder in os.listdir(asset_parent_folder_path):
-                asset_folder_path = os.path.join(asset_parent_folder_path, asset_folder)
-                try:
-                    if not check_fbx_exists(asset_folder_path):
-                        logging.info(f"No .fbx files found in asset folder: {asset_folder_path}")
-                        raise Exception(f"No .fbx files found in asset folder: {asset_folder_path}")
-                    metadata_list, preview_list = process_fbx_files_in_asset_folder(asset_folder_path)
-                except Exception as e:
-                    logging.error(f"Error processing asset folder '{asset_folder_path}': {e}")
-                    error_logger = logging.getLogger('errored_assets_logger')
-                    error_logger.error(f"{os.path.basename(project_folder_path)}/{os.path.basename(asset_folder_path)}\t---\t---\t{asset_folder_path}\t---\t{e}")
-                    continue
 
-                main_file = {
-                    "filename": os.path.basename(asset_folder_path),
-                    "zip": zip_folder_in_memory(asset_folder_path)
-                }
+def traverse_and_process_assets(project_folder_path, uploader=None):
+    """
+    Traverses the given project folder path to find and process FBX files in asset subdirectories.
 
-                if metadata_list and preview_list:
-                    combined_model_metadata = aggregate_metadata(metadata_list)
-                    combined_model_metadata['textureCount'] = count_image_files_in_texture_folders(asset_folder_path)
-                    generated_tags = generate_tags(clean_asset_name(os.path.basename(asset_folder_path)))
-                    asset_metadata = {
-                        "description": generate_description(os.path.basename(asset_folder_path), os.path.basename(project_folder_path), metadata_list),
-                        "projects": PROJECT_DESTINATION_NAMES,
-                        "categories": ["model"],
-                        "tags": GLOBAL_ASSET_TAGS + (generated_tags if generated_tags else [])
-                    }
-                    image_bytes_list = create_byteio_list(preview_list)
-                    try:
-                        if send_fbx_api_request(REFRESH_TOKEN, main_file, asset_metadata, combined_model_metadata, image_bytes_list):
-                            success_logger = logging.getLogger('successful_assets_logger')
-                            success_logger.info(f"{os.path.basename(project_folder_path)}/{os.path.basename(asset_folder_path)}\t---\t---\t{asset_folder_path}")
-                        else:
-                            error_logger = logging.getLogger('errored_assets_logger')
-                            error_logger.error(f"{os.path.basename(project_folder_path)}/{os.path.basename(asset_folder_path)}\t---\t---\t{asset_folder_path}")
-                            continue
-                    except Exception as e:
-                        logging.error(f"Error sending API request for asset folder '{asset_folder_path}': {e}")
-                        error_logger = logging.getLogger('errored_assets_logger')
-                        error_logger.error(f"{os.path.basename(project_folder_path)}/{os.path.basename(asset_folder_path)}\t---\t---\t{asset_folder_path}\t---\t{e}")
-                        continue
-                else:
-                    logging.info(f"No .fbx files found in asset folder: {asset_folder_path}. Sending non-FBX request.")
-                    asset_metadata = {
-                        "description": generate_description(os.path.basename(asset_folder_path), os.path.basename(project_folder_path)),
-                        "projects": PROJECT_DESTINATION_NAMES,
-                        "categories": ["texture"],
-                        "tags": ["colour"]
-                    }
-                    # send_texture_api_request  # Placeholder for sending texture API request
-                    logging.info(f"Successfully sent non-FBX request for asset folder {asset_folder_path}")
+    Args:
+        project_folder_path (str): The path of the project folder to traverse and process.
+        uploader (AsyncAssetUploader, optional): Uploads the assets in the background.
+    """
+    try:
+        logging.info(f"Processing project folder: {project_folder_path}")
+
+        current_parent_folder_path = None
+        for asset_parent_folder_path, asset_folder_path in get_asset_folders(project_folder_path):
+            if asset_parent_folder_path != current_parent_folder_path:
+                current_parent_folder_path = asset_parent_folder_path
+                change_preview_gen_directory(asset_parent_folder_path)
+                logging.info(f"Traversing asset folder: {asset_parent_folder_path}")
+
+            process_asset_folder(project_folder_path, asset_folder_path, uploader)
+
+        # Process the texture assets left in the last batch
+        send_texture_api_request(uploader)
     except Exception as e:
         logging.error(f"Error while processing project folder '{project_folder_path}': {e}")
 
 
+def run_asset_worker(worker_id, job_queue, worker_count=1, shared_fingerprints=None):
+    """
+    Worker process entry point. Starts a dedicated pair of preview/API servers on the ports allocated
+    to this worker and processes asset folder jobs from the shared queue until a None sentinel is received.
+
+    Args:
+        worker_id (int): Index of the worker, used for its port range and ledger files.
+        job_queue (multiprocessing.Queue): Queue of (project_folder_path, asset_folder_path) jobs.
+        worker_count (int): The number of workers sharing MEMORY_BUDGET_BYTES.
+        shared_fingerprints (DictProxy, optional): Fingerprint claims shared by the workers, so a duplicate
+            asset is skipped even when another worker is processing it.
+    """
+    global TEXTURE_WORKERS, _shared_fingerprints
+    setup_logger(worker_id)
+    _shared_fingerprints = shared_fingerprints
+    memory_budget.limit = MEMORY_BUDGET_BYTES // worker_count
+    TEXTURE_WORKERS = max(1, TEXTURE_WORKERS // worker_count)
+    set_working_directory_and_load_env()
+    download_nltk_data()
+    load_fingerprint_index(worker_id)
+
+    # Allocate this worker's ports after the .env file is loaded so they are not overridden
+    os.environ["VITE_PGEN_PORT"] = str(WORKER_BASE_PORT + 2 * worker_id)
+    os.environ["VITE_SERVER_PORT"] = str(WORKER_BASE_PORT + 2 * worker_id + 1)
+
+    server_process = start_3d_preview_servers()
+    if not server_process:
+        logging.error(f"Worker {worker_id} could not start its preview servers.")
+        return
+
+    uploader = create_asset_uploader()
+    interrupted = False
+    try:
+        logging.info(f"Worker {worker_id} started on ports {os.environ['VITE_PGEN_PORT']}/{os.environ['VITE_SERVER_PORT']}.")
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+            project_folder_path, asset_folder_path = job
+            change_preview_gen_directory(os.path.dirname(asset_folder_path))
+            process_asset_folder(project_folder_path, asset_folder_path, uploader)
+        send_texture_api_request(uploader)
+    except KeyboardInterrupt:
+        interrupted = True
+        logging.warning(f"Worker {worker_id} interrupted. Cancelling in-flight uploads...")
+    except Exception as e:
+        logging.error(f"Worker {worker_id} stopped with an error: {e}")
+    finally:
+        if uploader:
+            uploader.close(cancel=interrupted)
+        shutdown_texture_pool()
+        write_trace_file(worker_id)
+        server_process.terminate()
+        logging.info(f"Worker {worker_id} preview servers terminated.")
+
+
+def merge_worker_ledgers(worker_count):
+    """
+    Appends the ledger and fingerprint index files written by each worker to the main files and removes them.
+    Workers never share a ledger file, so entries are merged only once all workers have exited.
+
+    Args:
+        worker_count (int): The number of workers that ran.
+    """
+    for ledger_suffix, extension in (("-asset-ledger", "log"), ("-asset-ledger-error", "log"),
+                                     ("-asset-ledger-link-error", "log"), ("-fingerprints", "jsonl")):
+        main_ledger_path = get_log_file_path(ledger_suffix, extension=extension)
+        for worker_id in range(worker_count):
+            worker_ledger_path = get_log_file_path(ledger_suffix, worker_id, extension)
+            if not os.path.exists(worker_ledger_path):
+                continue
+            try:
+                with open(worker_ledger_path, 'r', encoding='utf-8') as worker_ledger, \
+                        open(main_ledger_path, 'a', encoding='utf-8') as main_ledger:
+                    shutil.copyfileobj(worker_ledger, main_ledger)
+                os.remove(worker_ledger_path)
+            except Exception as e:
+                logging.error(f"Error merging ledger '{worker_ledger_path}': {e}")
+
+
+def process_projects_in_parallel(project_folders, worker_count):
+    """
+    Shards the asset folders of all given projects across a pool of worker processes,
+    each running its own preview and API servers, then merges the worker ledgers.
+
+    Args:
+        project_folders (set): The project folder names to process.
+        worker_count (int): The maximum number of worker processes.
+    """
+    jobs = []
+    for project_folder_name in project_folders:
+        project_folder_path = os.path.join(ROOT_ASSET_PATH, project_folder_name)
+        jobs.extend((project_folder_path, asset_folder_path) for _, asset_folder_path in get_asset_folders(project_folder_path))
+
+    worker_count = max(1, min(worker_count, len(jobs)))
+    logging.info(f"Processing {len(jobs)} asset folders with {worker_count} worker processes...")
+
+    job_queue = multiprocessing.Queue()
+    for job in jobs:
+        job_queue.put(job)
+    for _ in range(worker_count):
+        job_queue.put(None)  # One stop sentinel per worker
+
+    with multiprocessing.Manager() as manager:
+        shared_fingerprints = manager.dict()
+        workers = [
+            multiprocessing.Process(target=run_asset_worker, args=(worker_id, job_queue, worker_count, shared_fingerprints),
+                                    name=f"upload-worker-{worker_id}")
+            for worker_id in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    merge_worker_ledgers(worker_count)
+    summarize_trace(merge_worker_traces(worker_count))
+    logging.info("All worker processes finished.")
+
+
 def get_project_folders(root_source_path, project_folders=None):
     """
     Retrieves the set of project folders to process.
@@ -756,12 +2607,19 @@ def get_project_folders(root_source_path, project_folders=None):
     return project_folders
 
 
-nltk.download('punkt_tab', quiet=True)
-nltk.download('wordnet')
+def download_nltk_data():
+    """
+    Downloads the NLTK tokenizer and WordNet data used by generate_tags, if missing.
+    """
+    nltk.download('punkt_tab', quiet=True)
+    nltk.download('wordnet')
+
+
 english_dict = enchant.Dict("en_US")
 lemmatizer = WordNetLemmatizer()
 
 
+@traced
 def generate_tags(input_string: str) -> list[str]:
     """
     Generate up to two real English word tags from the input string,
@@ -786,21 +2644,271 @@ def generate_tags(input_string: str) -> list[str]:
     return real_words
 
 
-if __name__ == "__main__":
+def open_job_queue():
+    """
+    Opens the SQLite job queue of the ingestion daemon, next to the asset ledgers, creating it if needed.
+
+    Returns:
+        sqlite3.Connection: The connection, in autocommit mode with rows returned as sqlite3.Row.
+    """
+    connection = sqlite3.connect(get_log_file_path("-jobs", extension="sqlite3"), timeout=30, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")  # Let enqueue and status run while the daemon writes
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            path TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            succeeded INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        )
+    """)
+    return connection
+
+
+def enqueue_jobs(paths, kind="project"):
+    """
+    Adds ingestion jobs to the daemon's queue.
+
+    Args:
+        paths (list): Project folder paths, or asset folder (or zipped asset folder) paths.
+        kind (str): "project" or "asset".
+
+    Returns:
+        list: The ids of the queued jobs.
+    """
+    connection = open_job_queue()
+    job_ids = []
     try:
-        setup_logger()
-        set_working_directory_and_load_env()
-        install_npm_dependencies('metadata-extractor')
-        install_npm_dependencies('3d-preview-generator')
-        server_process = start_3d_preview_servers()
-        if server_process:
-            logging.info("Process started.")
-            project_folders = get_project_folders(ROOT_ASSET_PATH, PROJECT_FOLDERS)
-            for projectFolderName in project_folders:
-                traverse_and_process_assets(os.path.join(ROOT_ASSET_PATH, projectFolderName))
-        server_process.terminate()
-        logging.info("3D preview servers terminated.")
-    except Exception as e:
-        logging.error(f"Error during processing: {e}")
+        for path in paths:
+            cursor = connection.execute("INSERT INTO jobs (kind, path, created_at) VALUES (?, ?, ?)",
+                                        (kind, os.path.abspath(path), time.time()))
+            job_ids.append(cursor.lastrowid)
+            logging.info(f"Queued {kind} job {cursor.lastrowid}: {os.path.abspath(path)}")
+    finally:
+        connection.close()
+    return job_ids
+
+
+def claim_next_job(connection):
+    """
+    Marks the oldest queued job as running and returns it.
+
+    Returns:
+        sqlite3.Row: The job, or None if the queue is empty.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        job = connection.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+        if job:
+            connection.execute("UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?", (time.time(), job['id']))
+        connection.execute("COMMIT")
+        return job
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def print_job_status(job_ids=None, limit=JOB_STATUS_LIMIT):
+    """
+    Prints the status of the given jobs, or of the most recent ones.
+
+    Args:
+        job_ids (list, optional): Ids of the jobs to show.
+        limit (int): Number of recent jobs shown when no ids are given.
+    """
+    connection = open_job_queue()
+    try:
+        if job_ids:
+            placeholders = ", ".join("?" * len(job_ids))
+            jobs = connection.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders}) ORDER BY id", job_ids).fetchall()
+        else:
+            jobs = connection.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()[::-1]
+        counts = dict(connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+    finally:
+        connection.close()
+
+    for job in jobs:
+        if job['finished_at']:
+            elapsed = f"{job['finished_at'] - job['started_at']:.1f}s"
+        elif job['started_at']:
+            elapsed = f"{time.time() - job['started_at']:.1f}s so far"
+        else:
+            elapsed = "-"
+        print(f"{job['id']:>5}  {job['status']:<8} {job['kind']:<7} {job['succeeded']:>4} ok {job['failed']:>4} failed"
+              f"  {elapsed:<14} {job['path']}" + (f"  ({job['error']})" if job['error'] else ""))
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "No jobs queued.")
+
+
+def run_job(job, uploader=None):
+    """
+    Processes a project folder or asset folder job and waits for its uploads to finish.
+
+    Args:
+        job (sqlite3.Row): The job to run.
+        uploader (AsyncAssetUploader, optional): Uploads the assets in the background.
+
+    Returns:
+        Counter: The 'succeeded', 'failed' and 'link_failed' ledger entries written for the job.
+    """
+    if not os.path.exists(job['path']):
+        raise Exception(f"Path not found: {job['path']}")
+    counts_before = Counter(_asset_result_counts)
+
+    with trace_span("job", job=job['id']):
+        if job['kind'] == "asset":
+            asset_parent_folder_path = os.path.dirname(job['path'])
+            change_preview_gen_directory(asset_parent_folder_path)
+            process_asset_folder(os.path.dirname(asset_parent_folder_path), job['path'], uploader)
+            send_texture_api_request(uploader)
+        else:
+            traverse_and_process_assets(job['path'], uploader)
+        if uploader:
+            uploader.wait()
+
+    with _asset_result_lock:
+        return Counter(_asset_result_counts) - counts_before
+
+
+def run_daemon():
+    """
+    Runs as a long-lived ingestion daemon: the preview servers, uploader, fingerprint index and NLTK data
+    stay loaded while jobs are taken from the SQLite job queue one at a time, so small incremental
+    ingestions skip the startup cost of a full run. Jobs left running by a previous daemon are queued
+    again. Jobs are only claimed while the preview servers are healthy; servers that stop answering are
+    restarted with an exponential backoff. A job with failed assets is marked failed. Stops on Ctrl+C.
+    Jobs are processed in this process only; PROCESS_WORKERS does not apply. With TRACE_ENABLED, each job's
+    trace is written to its own file when the job ends.
+    """
+    connection = open_job_queue()
+    requeued = connection.execute("UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'").rowcount
+    if requeued:
+        logging.warning(f"Requeued {requeued} jobs interrupted by a previous daemon.")
+
+    load_fingerprint_index()
+    server_process = start_3d_preview_servers()
+    if not server_process:
+        connection.close()
+        return
+    uploader = create_asset_uploader()
+    interrupted = False
+    restart_delay = DAEMON_RESTART_BACKOFF
+    logging.info(f"Daemon started. Waiting for jobs in {get_log_file_path('-jobs', extension='sqlite3')}...")
+    try:
+        while True:
+            # Jobs stay queued until the preview servers answer again
+            if not are_preview_servers_healthy():
+                logging.warning("The preview servers stopped answering. Restarting them...")
+                server_process.terminate()
+                server_process = start_3d_preview_servers()
+                if not server_process:
+                    server_process = PreviewServers()
+                    logging.error(f"The preview servers could not be restarted. Retrying in {restart_delay}s...")
+                    time.sleep(restart_delay)
+                    restart_delay = min(restart_delay * 2, DAEMON_RESTART_BACKOFF_MAX)
+                    continue
+                restart_delay = DAEMON_RESTART_BACKOFF
+
+            job = claim_next_job(connection)
+            if job is None:
+                time.sleep(DAEMON_POLL_INTERVAL)
+                continue
+
+            logging.info(f"Starting {job['kind']} job {job['id']}: {job['path']}")
+            try:
+                counts = run_job(job, uploader)
+                status = 'failed' if counts['failed'] else 'done'
+                error = f"{counts['failed']} assets failed (see the error ledger)" if counts['failed'] else None
+                connection.execute(
+                    "UPDATE jobs SET status = ?, succeeded = ?, failed = ?, error = ?, finished_at = ? WHERE id = ?",
+                    (status, counts['succeeded'], counts['failed'], error, time.time(), job['id'])
+                )
+                logging.info(f"Job {job['id']} {status}: {counts['succeeded']} succeeded, {counts['failed']} failed, "
+                             f"{counts['link_failed']} not linked to their projects.")
+            except Exception as e:
+                logging.error(f"Job {job['id']} failed: {e}")
+                connection.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                                   (str(e), time.time(), job['id']))
+            summarize_trace(write_trace_file(job_id=job['id']))
+    except KeyboardInterrupt:
+        interrupted = True
+        logging.warning("Daemon interrupted. Cancelling in-flight uploads...")
     finally:
-        logging.info("End of script.")
+        if uploader:
+            uploader.close(cancel=interrupted)
+        shutdown_texture_pool()
+        summarize_trace(write_trace_file())
+        server_process.terminate()
+        connection.close()
+        logging.info("Daemon stopped.")
+
+
+def parse_arguments():
+    """
+    Parses the command line. Without a command, every project folder under ROOT_ASSET_PATH is processed once.
+    """
+    parser = argparse.ArgumentParser(description="Uploads the assets of the project folders under ROOT_ASSET_PATH.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("run", help="process every project folder once (default)")
+    subparsers.add_parser("daemon", help="stay running and process the jobs added with 'enqueue'")
+    enqueue_parser = subparsers.add_parser("enqueue", help="queue project folders (or asset folders) for the daemon")
+    enqueue_parser.add_argument("paths", nargs="+", help="project folder paths, or asset folder paths with --asset")
+    enqueue_parser.add_argument("--asset", action="store_true", help="the paths are asset folders or zipped asset folders")
+    status_parser = subparsers.add_parser("status", help="show the status of queued jobs")
+    status_parser.add_argument("job_ids", nargs="*", type=int, help="jobs to show (default: the most recent)")
+    status_parser.add_argument("--limit", type=int, default=JOB_STATUS_LIMIT, help="number of recent jobs to show")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    if args.command == "enqueue":
+        setup_logger()
+        enqueue_jobs(args.paths, "asset" if args.asset else "project")
+    elif args.command == "status":
+        print_job_status(args.job_ids, args.limit)
+    else:
+        try:
+            setup_logger()
+            set_working_directory_and_load_env()
+            download_nltk_data()
+            install_npm_dependencies('metadata-extractor')
+            install_npm_dependencies('3d-preview-generator')
+            if PREVIEW_SERVER_MODE == "bundle":
+                build_preview_bundle()
+            if args.command == "daemon":
+                run_daemon()
+            else:
+                project_folders = get_project_folders(ROOT_ASSET_PATH, PROJECT_FOLDERS)
+                worker_count = PROCESS_WORKERS or os.cpu_count() or 1
+                if worker_count > 1:
+                    process_projects_in_parallel(project_folders, worker_count)
+                else:
+                    server_process = start_3d_preview_servers()
+                    uploader = create_asset_uploader()
+                    interrupted = False
+                    try:
+                        if server_process:
+                            logging.info("Process started.")
+                            for projectFolderName in project_folders:
+                                traverse_and_process_assets(os.path.join(ROOT_ASSET_PATH, projectFolderName), uploader)
+                    except KeyboardInterrupt:
+                        interrupted = True
+                        logging.warning("Interrupted. Cancelling in-flight uploads...")
+                    finally:
+                        if uploader:
+                            uploader.close(cancel=interrupted)
+                        shutdown_texture_pool()
+                        summarize_trace(write_trace_file())
+                    if server_process:
+                        server_process.terminate()
+                        logging.info("3D preview servers terminated.")
+        except Exception as e:
+            logging.error(f"Error during processing: {e}")
+        finally:
+            logging.info("End of script.")
@@ -0,0 +1,518 @@
+"""
+Script Overview:
+This script benchmarks upload-automation.py end to end without real FBX files, Puppeteer,
+Cohere or the live asset API. It generates a synthetic asset tree, swaps the external stages
+for local stand-ins with configurable latency and failure rates, runs the real traversal,
+zipping and upload code against them, and reports per-stage latency percentiles and
+end-to-end throughput.
+
+Key Features:
+- Synthetic asset-tree generator (projects / 3D Assets / asset folders with FBX and texture files,
+  and 2D Assets / texture-only asset folders for the texture pipeline).
+- Fake metadata extractor in place of the Node.js metadata-extractor.
+- Stub preview server (set-directory, forward-filename, register-path-index and a render endpoint).
+- Stub LLM and /api/asset servers with configurable latency and failure rates.
+- Stub blob service (Put Block, Get Block List, Put Block List) for the direct-to-blob upload mode.
+- Scenarios for API uploads, direct-to-blob uploads and the batched texture pipeline.
+- Per-stage p50/p90/p99 latencies and assets/minute for each scenario.
+
+The benchmark runs in a single process (PROCESS_WORKERS is forced to 1), since worker
+processes would not inherit the stand-ins.
+"""
+
+import base64
+import importlib.util
+import json
+import logging
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+import requests
+from PIL import Image
+
+# Scenarios
+SCENARIOS = ["api", "blob", "texture"]  # Run in order: "api" uploads through /api/asset, "blob" stages blocks on the stub blob service, "texture" sends 2D asset folders through the texture pipeline
+
+# Synthetic asset tree
+BENCHMARK_ROOT = None  # Folder for the synthetic tree (None = temporary folder, removed afterwards)
+PROJECT_COUNT = 2  # Number of synthetic project folders
+ASSETS_PER_PROJECT = 10  # Number of asset folders per project
+TEXTURE_ASSETS_PER_PROJECT = 10  # Number of texture-only asset folders per project (texture scenario)
+TEXTURE_IMAGE_SIZE = 1024  # Width and height of the texture images of texture-only asset folders (pixels)
+FBX_PER_ASSET = 2  # Number of FBX files per asset folder
+TEXTURES_PER_ASSET = 4  # Number of texture images per asset folder
+FBX_SIZE = 2 * 1024 * 1024  # Size of each synthetic FBX file (bytes, compressible)
+TEXTURE_SIZE = 512 * 1024  # Size of each synthetic texture (bytes, incompressible)
+RANDOM_SEED = 42  # Seed for reproducible trees and failures
+
+# Stand-in latencies (seconds) and failure rates (0.0 - 1.0)
+METADATA_LATENCY = 0.05  # Fake metadata extractor
+PREVIEW_LATENCY = 0.5  # Stub preview render
+LLM_LATENCY = 0.8  # Stub LLM description
+LLM_FAILURE_RATE = 0.0  # Note: generate_description exits the run on LLM errors, as in production
+API_LATENCY = 0.3  # Stub /api/asset upload
+API_FAILURE_RATE = 0.05  # Stub /api/asset upload failures
+BLOB_LATENCY = 0.05  # Stub blob service, per block or block list request
+
+# Upload-automation settings under test
+UPLOAD_CONCURRENCY = 4  # Passed through to upload-automation.py (0 = blocking uploads)
+BLOB_CHUNK_SIZE = 1024 * 1024  # Passed through to upload-automation.py (block size of the blob scenario)
+
+
+def load_upload_automation():
+    """
+    Loads upload-automation.py as a module (its file name is not importable directly).
+
+    Returns:
+        module: The loaded upload-automation module.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location("upload_automation", os.path.join(script_dir, "upload-automation.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # The texture process pool pickles its functions by module name
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_synthetic_asset_tree(root):
+    """
+    Generates PROJECT_COUNT projects of ASSETS_PER_PROJECT asset folders, laid out the way
+    onedrive-asset-copier.py writes them.
+
+    Args:
+        root (str): The folder to generate the tree in.
+
+    Returns:
+        list: The generated project folder names.
+    """
+    rng = random.Random(RANDOM_SEED)
+    fbx_block = b"Kaydara FBX Binary  \x00" + bytes(range(256)) * 64
+    project_names = []
+
+    for project_index in range(PROJECT_COUNT):
+        project_name = f"BENCH{project_index:02d} - Synthetic Project"
+        project_names.append(project_name)
+        for asset_index in range(ASSETS_PER_PROJECT):
+            asset_folder = os.path.join(root, project_name, "3D Assets", f"Asset Files - Bench Asset {asset_index:03d}")
+            mesh_folder = os.path.join(asset_folder, "Mesh Exports")
+            texture_folder = os.path.join(asset_folder, "Texture Files")
+            os.makedirs(mesh_folder, exist_ok=True)
+            os.makedirs(texture_folder, exist_ok=True)
+
+            for fbx_index in range(FBX_PER_ASSET):
+                with open(os.path.join(mesh_folder, f"BenchMesh{asset_index:03d}_{fbx_index}.fbx"), 'wb') as file:
+                    file.write((fbx_block * (FBX_SIZE // len(fbx_block) + 1))[:FBX_SIZE])
+            for texture_index in range(TEXTURES_PER_ASSET):
+                with open(os.path.join(texture_folder, f"BenchTexture{texture_index}.png"), 'wb') as file:
+                    file.write(rng.randbytes(TEXTURE_SIZE))
+
+    return project_names
+
+
+def generate_synthetic_texture_tree(root):
+    """
+    Generates PROJECT_COUNT projects of TEXTURE_ASSETS_PER_PROJECT texture-only asset folders
+    under "2D Assets", the way onedrive-asset-copier.py writes folders without .fbx files.
+    The textures are real PNG images, since the texture pipeline decodes them.
+
+    Args:
+        root (str): The folder to generate the tree in.
+
+    Returns:
+        list: The generated project folder names.
+    """
+    rng = random.Random(RANDOM_SEED)
+    project_names = []
+
+    for project_index in range(PROJECT_COUNT):
+        project_name = f"BENCH{project_index:02d} - Synthetic Project"
+        project_names.append(project_name)
+        for asset_index in range(TEXTURE_ASSETS_PER_PROJECT):
+            texture_folder = os.path.join(root, project_name, "2D Assets",
+                                          f"Asset Files - Bench Texture {asset_index:03d}", "Texture Files")
+            os.makedirs(texture_folder, exist_ok=True)
+            for texture_index in range(TEXTURES_PER_ASSET):
+                noise = rng.randbytes(TEXTURE_IMAGE_SIZE * TEXTURE_IMAGE_SIZE * 3)
+                image = Image.frombytes('RGB', (TEXTURE_IMAGE_SIZE, TEXTURE_IMAGE_SIZE), noise)
+                image.save(os.path.join(texture_folder, f"BenchTexture{texture_index}.png"))
+
+    return project_names
+
+
+class StageTimer:
+    """
+    Thread-safe collector of per-stage durations.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations = {}
+
+    def record(self, stage, duration):
+        with self._lock:
+            self.durations.setdefault(stage, []).append(duration)
+
+    def wrap(self, stage, function):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+        return timed
+
+    def wrap_async(self, stage, function):
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+        return timed
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+
+def make_stub_handler(routes, latency, failure_rate, rng):
+    """
+    Builds a request handler class answering the given routes after `latency` seconds,
+    failing with a 500 response at `failure_rate`.
+
+    Args:
+        routes (dict): (method, path) -> function(body, query) returning a JSON-serializable response.
+        latency (float): Seconds to wait before answering.
+        failure_rate (float): Probability of answering with an error.
+        rng (random.Random): Random source for failures.
+
+    Returns:
+        type: The handler class.
+    """
+    rng_lock = threading.Lock()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Keep the benchmark output readable
+
+        def _respond(self, method):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            url = urlsplit(self.path)
+            route = routes.get((method, url.path))
+            if route is None:
+                self._send(404, {"error": "Not found"})
+                return
+
+            time.sleep(latency)
+            with rng_lock:
+                failed = rng.random() < failure_rate
+            if failed:
+                self._send(500, {"error": "Injected failure", "success": False})
+            else:
+                self._send(200, route(body, parse_qs(url.query)))
+
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._respond('GET')
+
+        def do_POST(self):
+            self._respond('POST')
+
+    return StubHandler
+
+
+def make_blob_handler(latency):
+    """
+    Builds a request handler class standing in for the blob service: blocks are staged with Put Block,
+    listed with Get Block List and committed with Put Block List, answering after `latency` seconds.
+
+    Args:
+        latency (float): Seconds to wait before answering block and block list requests.
+
+    Returns:
+        type: The handler class.
+    """
+    blobs_lock = threading.Lock()
+    staged_blocks = {}  # Blob path -> block id -> size
+    committed_blobs = {}  # Blob path -> committed size
+
+    class BlobHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Keep the benchmark output readable
+
+        def _send(self, status, data=b'', content_type='application/xml'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_PUT(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            time.sleep(latency)
+            with blobs_lock:
+                if query.get('comp') == ['block']:
+                    staged_blocks.setdefault(url.path, {})[query['blockid'][0]] = len(body)
+                elif query.get('comp') == ['blocklist']:
+                    blocks = staged_blocks.pop(url.path, {})
+                    committed_blobs[url.path] = sum(blocks.values())
+                else:
+                    self._send(400)
+                    return
+            self._send(201)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            time.sleep(latency)
+            with blobs_lock:
+                blocks = dict(staged_blocks.get(url.path, {}))
+            if not blocks:
+                self._send(404)
+                return
+            block_list = ''.join(f"<Block><Name>{block_id}</Name><Size>{size}</Size></Block>"
+                                 for block_id, size in blocks.items())
+            self._send(200, f"<BlockList><UncommittedBlocks>{block_list}</UncommittedBlocks></BlockList>".encode('utf-8'))
+
+    return BlobHandler
+
+
+def start_stub_server(handler_class):
+    """
+    Starts a threaded HTTP server on a free local port.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_stand_ins(rng):
+    """
+    Starts the stub preview, LLM, asset API and blob servers.
+
+    Returns:
+        dict: The running servers by name.
+    """
+    preview_image = base64.b64encode(b"RIFF\x1a\x00\x00\x00WEBPVP8L" + bytes(18)).decode('ascii')
+    def render_preview(body, query):
+        time.sleep(PREVIEW_LATENCY)  # Only the render is slow; the control endpoints answer immediately
+        return {"status": "success", "screenshotBase64": preview_image}
+
+    preview_routes = {
+        ('POST', '/set-directory'): lambda body, query: {"message": "ok"},
+        ('POST', '/forward-filename'): lambda body, query: {"message": "ok"},
+        ('POST', '/register-path-index'): lambda body, query: {"message": "ok"},
+        ('GET', '/render'): render_preview,
+        ('GET', '/health'): lambda body, query: {"status": "ok"},
+    }
+    llm_routes = {
+        ('POST', '/generate'): lambda body, query: {"text": "This asset is a synthetic benchmark model used for testing."},
+    }
+
+    blob_server = start_stub_server(make_blob_handler(BLOB_LATENCY))
+    blob_container_url = f"http://127.0.0.1:{blob_server.server_port}/assets"
+    api_routes = {
+        ('POST', '/api/asset'): lambda body, query: {"message": "Files uploaded successfully", "success": True},
+        ('GET', '/api/asset/upload-sas-token'): lambda body, query: {
+            "blobUrl": f"{blob_container_url}/{quote(query['fileName'][0])}", "message": "sv=stub", "success": True},
+        ('POST', '/api/asset/register'): lambda body, query: {"message": "Asset registered successfully", "success": True},
+    }
+
+    return {
+        "preview": start_stub_server(make_stub_handler(preview_routes, 0.0, 0.0, rng)),
+        "llm": start_stub_server(make_stub_handler(llm_routes, LLM_LATENCY, LLM_FAILURE_RATE, rng)),
+        "api": start_stub_server(make_stub_handler(api_routes, API_LATENCY, API_FAILURE_RATE, rng)),
+        "blob": blob_server,
+    }
+
+
+def install_stand_ins(upload_automation, servers, timer, scenario):
+    """
+    Points upload-automation at the stand-ins and wraps every stage with a timer.
+
+    Args:
+        upload_automation (module): The loaded upload-automation module.
+        servers (dict): The running stub servers.
+        timer (StageTimer): Collector for the stage durations.
+        scenario (str): The scenario being run.
+    """
+    preview_port = servers["preview"].server_port
+    llm_url = f"http://127.0.0.1:{servers['llm'].server_port}/generate"
+    os.environ["VITE_SERVER_PORT"] = str(preview_port)
+    upload_automation.API_URL = f"http://127.0.0.1:{servers['api'].server_port}/api/asset"
+    upload_automation.UPLOAD_MODE = "blob" if scenario == "blob" else "api"
+    upload_automation.BLOB_CHUNK_SIZE = BLOB_CHUNK_SIZE
+    upload_automation.UPLOAD_CONCURRENCY = UPLOAD_CONCURRENCY
+    upload_automation.PROCESS_WORKERS = 1
+    upload_automation.DUPLICATE_MODE = "off"  # A rerun on the same tree would otherwise skip every asset as a duplicate
+
+    def fake_get_fbx_metadata(fbx_file_path):
+        time.sleep(METADATA_LATENCY)
+        file_name = os.path.basename(fbx_file_path)
+        return {
+            "name": os.path.splitext(file_name)[0],
+            "fileName": file_name,
+            "fileSize": os.path.getsize(fbx_file_path),
+            "format": "fbx",
+            "model": {"triCount": 1200, "vertices": 3600, "edges": 1800, "lodCount": 0,
+                      "polygons": 900, "rigType": "NONE", "animationCount": 0}
+        }
+
+    def stub_render_preview():
+        response = requests.get(f"http://127.0.0.1:{preview_port}/render")
+        return response.json() if response.status_code == 200 else None
+
+    class StubCohereClient:
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+        def generate(self, model, prompt, temperature):
+            response = requests.post(llm_url, json={"model": model, "prompt": prompt, "temperature": temperature})
+            response.raise_for_status()
+            return types.SimpleNamespace(generations=[types.SimpleNamespace(text=response.json()["text"])])
+
+    upload_automation.cohere = types.SimpleNamespace(Client=StubCohereClient)
+    upload_automation.get_fbx_metadata = timer.wrap("get_fbx_metadata", fake_get_fbx_metadata)
+    upload_automation.run_make_preview_and_get_encoded_screenshot = timer.wrap(
+        "run_make_preview_and_get_encoded_screenshot", stub_render_preview)
+
+    # create_texture_thumbnails runs on the texture process pool and is timed through send_texture_api_request
+    for stage in ("generate_description", "generate_tags", "zip_folder_in_memory", "create_byteio_list",
+                  "send_fbx_api_request", "send_fbx_blob_request", "put_blob_block", "commit_blob_block_list",
+                  "send_texture_api_request", "build_contact_sheets", "process_texture_asset", "process_asset_folder"):
+        setattr(upload_automation, stage, timer.wrap(stage, getattr(upload_automation, stage)))
+    upload_automation.AsyncAssetUploader._upload = timer.wrap_async(
+        "async_upload", upload_automation.AsyncAssetUploader._upload)
+
+
+def count_ledger_lines(upload_automation, suffix):
+    """
+    Counts the entries of a ledger. The ledgers are appended to across runs, so the benchmark
+    counts them before and after a scenario and reports the difference.
+    """
+    ledger_path = upload_automation.get_log_file_path(suffix)
+    if not os.path.exists(ledger_path):
+        return 0
+    with open(ledger_path, 'r', encoding='utf-8') as ledger:
+        return sum(1 for line in ledger if line.strip())
+
+
+def print_report(scenario, timer, asset_count, uploaded, failed, elapsed):
+    """
+    Prints per-stage latency percentiles and end-to-end throughput.
+    """
+    print()
+    print(f"Scenario: {scenario}")
+    print(f"{'Stage':<46}{'Count':>7}{'p50 (s)':>10}{'p90 (s)':>10}{'p99 (s)':>10}{'Max (s)':>10}{'Total (s)':>11}")
+    print("-" * 104)
+    for stage, durations in sorted(timer.durations.items(), key=lambda item: -sum(item[1])):
+        values = sorted(durations)
+        print(f"{stage:<46}{len(values):>7}{percentile(values, 0.5):>10.3f}{percentile(values, 0.9):>10.3f}"
+              f"{percentile(values, 0.99):>10.3f}{values[-1]:>10.3f}{sum(values):>11.2f}")
+    print("-" * 104)
+    print(f"Assets: {asset_count} | Uploaded: {uploaded} | Failed: {failed} | Wall time: {elapsed:.2f}s")
+    print(f"Throughput: {uploaded / elapsed * 60 if elapsed else 0:.1f} assets/minute "
+          f"({asset_count / elapsed * 60 if elapsed else 0:.1f} processed/minute)")
+
+
+def run_scenario(scenario, root, servers):
+    """
+    Generates the synthetic tree of a scenario, runs upload-automation against the stand-ins and prints the report.
+
+    Args:
+        scenario (str): "api", "blob" or "texture".
+        root (str): The folder to generate the scenario tree in.
+        servers (dict): The running stub servers.
+    """
+    print(f"Generating the synthetic asset tree of the {scenario} scenario in {root}...")
+    if scenario == "texture":
+        project_names = generate_synthetic_texture_tree(root)
+        asset_count = PROJECT_COUNT * TEXTURE_ASSETS_PER_PROJECT
+    else:
+        project_names = generate_synthetic_asset_tree(root)
+        asset_count = PROJECT_COUNT * ASSETS_PER_PROJECT
+
+    # A fresh module per scenario, so the stage timers and upload settings of one scenario do not leak into the next
+    upload_automation = load_upload_automation()
+    upload_automation.ROOT_ASSET_PATH = root
+    upload_automation.LOG_MODE = logging.WARNING  # Only surface problems while timing
+    upload_automation.setup_logger()
+    upload_automation.download_nltk_data()
+    for ledger_name in ('successful_assets_logger', 'errored_assets_logger'):
+        ledger_logger = logging.getLogger(ledger_name)
+        ledger_logger.setLevel(logging.INFO)  # Ledgers are counted for the report
+        for handler in ledger_logger.handlers:
+            handler.setLevel(logging.INFO)
+
+    timer = StageTimer()
+    install_stand_ins(upload_automation, servers, timer, scenario)
+
+    # Entries written by earlier runs on the same BENCHMARK_ROOT are not counted
+    uploaded_before = count_ledger_lines(upload_automation, "-asset-ledger")
+    failed_before = count_ledger_lines(upload_automation, "-asset-ledger-error")
+
+    start = time.perf_counter()
+    uploader = upload_automation.create_asset_uploader()
+    try:
+        for project_name in project_names:
+            upload_automation.traverse_and_process_assets(os.path.join(root, project_name), uploader)
+    finally:
+        if uploader:
+            uploader.close()
+        upload_automation.shutdown_texture_pool()
+    elapsed = time.perf_counter() - start
+
+    print_report(scenario, timer, asset_count,
+                 count_ledger_lines(upload_automation, "-asset-ledger") - uploaded_before,
+                 count_ledger_lines(upload_automation, "-asset-ledger-error") - failed_before,
+                 elapsed)
+    for ledger_name in ('successful_assets_logger', 'errored_assets_logger'):
+        for handler in list(logging.getLogger(ledger_name).handlers):
+            handler.close()
+
+
+def run_benchmark():
+    """
+    Starts the stand-ins and runs each of SCENARIOS on its own synthetic tree.
+    """
+    root = BENCHMARK_ROOT or tempfile.mkdtemp(prefix="upload-benchmark-")
+    rng = random.Random(RANDOM_SEED)
+    servers = {}
+
+    try:
+        servers = start_stand_ins(rng)
+        for scenario in SCENARIOS:
+            run_scenario(scenario, os.path.join(root, scenario), servers)
+    finally:
+        for server in servers.values():
+            server.shutdown()
+        logging.shutdown()
+        if BENCHMARK_ROOT is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    run_benchmark()